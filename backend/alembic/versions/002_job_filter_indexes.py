@@ -0,0 +1,33 @@
+"""Job filter indexes
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "002"
+down_revision: Union[str, None] = "001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Listing is always filtered by status and ordered by newest first
+    op.create_index("idx_jobs_status_created_at", "jobs", ["status", "created_at"])
+
+    # Range filters and facets used by the job search
+    op.create_index("idx_jobs_status_budget_max", "jobs", ["status", "budget_max"])
+    op.create_index("idx_jobs_status_deadline", "jobs", ["status", "deadline"])
+    op.create_index("idx_jobs_status_estimated_hours", "jobs", ["status", "estimated_hours"])
+
+
+def downgrade() -> None:
+    op.drop_index("idx_jobs_status_estimated_hours", table_name="jobs")
+    op.drop_index("idx_jobs_status_deadline", table_name="jobs")
+    op.drop_index("idx_jobs_status_budget_max", table_name="jobs")
+    op.drop_index("idx_jobs_status_created_at", table_name="jobs")
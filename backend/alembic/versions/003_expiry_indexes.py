@@ -0,0 +1,38 @@
+"""Partial indexes for the expiry scheduler
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "003"
+down_revision: Union[str, None] = "002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Only open jobs with a deadline and pending applications are candidates for expiry
+    op.create_index(
+        "idx_jobs_open_deadline",
+        "jobs",
+        ["deadline"],
+        postgresql_where=sa.text("status = 'open' AND deadline IS NOT NULL"),
+    )
+    op.create_index(
+        "idx_applications_pending_created_at",
+        "applications",
+        ["created_at"],
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_applications_pending_created_at", table_name="applications")
+    op.drop_index("idx_jobs_open_deadline", table_name="jobs")
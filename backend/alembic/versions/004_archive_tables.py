@@ -0,0 +1,78 @@
+"""Archive tables for completed/cancelled jobs
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "004"
+down_revision: Union[str, None] = "003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    job_status = postgresql.ENUM(name="jobstatus", create_type=False)
+    application_status = postgresql.ENUM(name="applicationstatus", create_type=False)
+
+    # Same columns as the hot tables, without FK constraints, plus archived_at
+    op.create_table(
+        "jobs_archive",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("sponsor_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("title", sa.String(255), nullable=False),
+        sa.Column("description", sa.Text, nullable=False),
+        sa.Column("requirements", sa.Text),
+        sa.Column("budget_min", sa.Integer),
+        sa.Column("budget_max", sa.Integer),
+        sa.Column("budget_type", sa.String(20)),
+        sa.Column("estimated_hours", sa.Integer),
+        sa.Column("deadline", sa.Date),
+        sa.Column("status", job_status),
+        sa.Column("ai_generated_description", sa.Boolean),
+        sa.Column("created_at", sa.DateTime(timezone=True)),
+        sa.Column("updated_at", sa.DateTime(timezone=True)),
+        sa.Column("archived_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+    op.create_index("ix_jobs_archive_sponsor_id", "jobs_archive", ["sponsor_id"])
+
+    op.create_table(
+        "applications_archive",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("job_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("apprentice_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("cover_letter", sa.Text),
+        sa.Column("proposed_rate", sa.Integer),
+        sa.Column("estimated_completion_days", sa.Integer),
+        sa.Column("status", application_status),
+        sa.Column("ai_match_score", sa.Float),
+        sa.Column("ai_generated_cover_letter", sa.Boolean),
+        sa.Column("created_at", sa.DateTime(timezone=True)),
+        sa.Column("updated_at", sa.DateTime(timezone=True)),
+        sa.Column("archived_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+    op.create_index("ix_applications_archive_job_id", "applications_archive", ["job_id"])
+    op.create_index(
+        "ix_applications_archive_apprentice_id", "applications_archive", ["apprentice_id"]
+    )
+
+    # The mover scans for finished jobs by age
+    op.create_index(
+        "idx_jobs_finished_updated_at",
+        "jobs",
+        [sa.text("coalesce(updated_at, created_at)")],
+        postgresql_where=sa.text("status IN ('completed', 'cancelled')"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_jobs_finished_updated_at", table_name="jobs")
+    op.drop_table("applications_archive")
+    op.drop_table("jobs_archive")
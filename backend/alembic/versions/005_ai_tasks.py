@@ -0,0 +1,63 @@
+"""AI task queue table
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "005"
+down_revision: Union[str, None] = "004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    ai_task_status = postgresql.ENUM(
+        "queued", "running", "succeeded", "failed", name="aitaskstatus", create_type=False
+    )
+    ai_task_status.create(op.get_bind(), checkfirst=True)
+
+    op.create_table(
+        "ai_tasks",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column(
+            "user_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("users.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("kind", sa.String(50), nullable=False),
+        sa.Column("payload", postgresql.JSONB, nullable=False),
+        sa.Column("status", ai_task_status, nullable=False, server_default="queued"),
+        sa.Column("attempts", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("result", postgresql.JSONB),
+        sa.Column("error", sa.Text),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("started_at", sa.DateTime(timezone=True)),
+        sa.Column("finished_at", sa.DateTime(timezone=True)),
+    )
+    # Workers claim the oldest queued task; keep that scan on a small partial index
+    op.create_index(
+        "idx_ai_tasks_queued_created_at",
+        "ai_tasks",
+        ["created_at"],
+        postgresql_where=sa.text("status = 'queued'"),
+    )
+    op.create_index(
+        "idx_ai_tasks_running_started_at",
+        "ai_tasks",
+        ["started_at"],
+        postgresql_where=sa.text("status = 'running'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("ai_tasks")
+    op.execute("DROP TYPE IF EXISTS aitaskstatus")
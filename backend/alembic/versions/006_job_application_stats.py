@@ -0,0 +1,112 @@
+"""Per-job application stats maintained by trigger
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "006"
+down_revision: Union[str, None] = "005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _status_delta(row: str, sign: str) -> str:
+    return ",\n".join(
+        f"            {status}_count = s.{status}_count {sign} "
+        f"({row}.status IS NOT DISTINCT FROM '{status}')::int"
+        for status in ("pending", "accepted", "rejected", "withdrawn")
+    )
+
+
+def upgrade() -> None:
+    op.create_table(
+        "job_application_stats",
+        sa.Column(
+            "job_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("jobs.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("pending_count", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("accepted_count", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("rejected_count", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("withdrawn_count", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("rate_sum", sa.BigInteger, nullable=False, server_default="0"),
+        sa.Column("rate_count", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("last_application_at", sa.DateTime(timezone=True)),
+    )
+
+    # Remove the old row's contribution, then add the new row's. The insert
+    # side upserts so the stats row appears with the job's first application.
+    op.execute(
+        f"""
+        CREATE OR REPLACE FUNCTION job_application_stats_apply() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                UPDATE job_application_stats AS s SET
+{_status_delta("OLD", "-")},
+                    rate_sum = s.rate_sum - coalesce(OLD.proposed_rate, 0),
+                    rate_count = s.rate_count - (OLD.proposed_rate IS NOT NULL)::int
+                WHERE s.job_id = OLD.job_id;
+            END IF;
+
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                INSERT INTO job_application_stats AS s (job_id, last_application_at)
+                VALUES (NEW.job_id, NEW.created_at)
+                ON CONFLICT (job_id) DO UPDATE
+                    SET last_application_at = greatest(s.last_application_at, NEW.created_at);
+
+                UPDATE job_application_stats AS s SET
+{_status_delta("NEW", "+")},
+                    rate_sum = s.rate_sum + coalesce(NEW.proposed_rate, 0),
+                    rate_count = s.rate_count + (NEW.proposed_rate IS NOT NULL)::int
+                WHERE s.job_id = NEW.job_id;
+            END IF;
+
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER trg_applications_job_stats
+        AFTER INSERT OR DELETE OR UPDATE OF status, proposed_rate, job_id ON applications
+        FOR EACH ROW EXECUTE FUNCTION job_application_stats_apply()
+        """
+    )
+
+    # Backfill from existing applications
+    op.execute(
+        """
+        INSERT INTO job_application_stats (
+            job_id, pending_count, accepted_count, rejected_count, withdrawn_count,
+            rate_sum, rate_count, last_application_at
+        )
+        SELECT
+            job_id,
+            count(*) FILTER (WHERE status = 'pending'),
+            count(*) FILTER (WHERE status = 'accepted'),
+            count(*) FILTER (WHERE status = 'rejected'),
+            count(*) FILTER (WHERE status = 'withdrawn'),
+            coalesce(sum(proposed_rate), 0),
+            count(proposed_rate),
+            max(created_at)
+        FROM applications
+        GROUP BY job_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_applications_job_stats ON applications")
+    op.execute("DROP FUNCTION IF EXISTS job_application_stats_apply()")
+    op.drop_table("job_application_stats")
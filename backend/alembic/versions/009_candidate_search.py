@@ -0,0 +1,40 @@
+"""Full-text index for apprentice candidate search
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "009"
+down_revision: Union[str, None] = "008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Must match app.models.user.SEARCH_VECTOR_EXPRESSION
+SEARCH_VECTOR_EXPRESSION = (
+    "setweight(to_tsvector('english', coalesce(full_name, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(bio, '')), 'B')"
+)
+
+
+def upgrade() -> None:
+    # Generated column so every write path keeps it current (rewrites the table once)
+    op.execute(
+        f"ALTER TABLE users ADD COLUMN search_vector tsvector "
+        f"GENERATED ALWAYS AS ({SEARCH_VECTOR_EXPRESSION}) STORED"
+    )
+    # Only apprentices are searchable, so sponsors stay out of the index
+    op.execute(
+        "CREATE INDEX ix_users_apprentice_search ON users USING gin (search_vector) "
+        "WHERE role = 'apprentice'"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_users_apprentice_search", table_name="users")
+    op.drop_column("users", "search_vector")
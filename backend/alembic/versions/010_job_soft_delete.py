@@ -0,0 +1,36 @@
+"""Soft delete for jobs
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "010"
+down_revision: Union[str, None] = "009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("jobs", sa.Column("deleted_at", sa.DateTime(timezone=True)))
+    # Archival copies every jobs column
+    op.add_column("jobs_archive", sa.Column("deleted_at", sa.DateTime(timezone=True)))
+    # Lets the purge task find soft-deleted jobs without scanning live ones
+    op.create_index(
+        "ix_jobs_deleted_at",
+        "jobs",
+        ["deleted_at"],
+        postgresql_where=sa.text("deleted_at IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_jobs_deleted_at", table_name="jobs")
+    op.drop_column("jobs_archive", "deleted_at")
+    op.drop_column("jobs", "deleted_at")
@@ -0,0 +1,66 @@
+"""Application status history
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "011"
+down_revision: Union[str, None] = "010"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    application_status = postgresql.ENUM(name="applicationstatus", create_type=False)
+
+    op.create_table(
+        "application_status_events",
+        sa.Column("id", sa.BigInteger, sa.Identity(), primary_key=True),
+        sa.Column("application_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("job_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("apprentice_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("from_status", application_status),
+        sa.Column("to_status", application_status, nullable=False),
+        sa.Column("changed_by", postgresql.UUID(as_uuid=True)),
+        sa.Column("changed_at", sa.DateTime(timezone=True), nullable=False),
+    )
+    op.create_index(
+        "ix_application_status_events_application",
+        "application_status_events",
+        ["application_id", "changed_at"],
+    )
+    op.create_index(
+        "ix_application_status_events_to_status",
+        "application_status_events",
+        ["to_status", "changed_at"],
+    )
+
+    # Seed what we know: every submission, plus the current status where it has
+    # moved on (intermediate changes were never recorded)
+    op.execute(
+        """
+        INSERT INTO application_status_events
+            (application_id, job_id, apprentice_id, from_status, to_status, changed_by, changed_at)
+        SELECT id, job_id, apprentice_id, NULL::applicationstatus, 'pending'::applicationstatus,
+               apprentice_id, created_at
+        FROM applications
+        WHERE created_at IS NOT NULL
+        UNION ALL
+        SELECT id, job_id, apprentice_id, 'pending'::applicationstatus, status, NULL,
+               COALESCE(updated_at, created_at)
+        FROM applications
+        WHERE status <> 'pending' AND created_at IS NOT NULL
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("application_status_events")
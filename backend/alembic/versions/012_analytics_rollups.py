@@ -0,0 +1,56 @@
+"""Analytics rollup tables
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "012"
+down_revision: Union[str, None] = "011"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _rollup_table(name: str) -> None:
+    op.create_table(
+        name,
+        sa.Column("bucket", sa.DateTime(timezone=False), primary_key=True),
+        sa.Column("budget_type", sa.String(20), primary_key=True),
+        sa.Column("budget_band", sa.SmallInteger, primary_key=True),
+        sa.Column("jobs_posted", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("applications", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("acceptances", sa.Integer, nullable=False, server_default="0"),
+        sa.Column("budget_total", sa.BigInteger, nullable=False, server_default="0"),
+        sa.Column("budget_count", sa.Integer, nullable=False, server_default="0"),
+    )
+
+
+def upgrade() -> None:
+    _rollup_table("analytics_hourly")
+    _rollup_table("analytics_daily")
+
+    # NULL processed_until: the first run rolls up all existing history
+    op.create_table(
+        "analytics_rollup_state",
+        sa.Column("name", sa.String(50), primary_key=True),
+        sa.Column("processed_until", sa.DateTime(timezone=True)),
+    )
+    op.execute("INSERT INTO analytics_rollup_state (name) VALUES ('activity')")
+
+    # Each rollup run scans only rows created since the previous one
+    op.create_index("idx_jobs_created_at", "jobs", ["created_at"])
+    op.create_index("idx_applications_created_at", "applications", ["created_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("idx_applications_created_at", table_name="applications")
+    op.drop_index("idx_jobs_created_at", table_name="jobs")
+    op.drop_table("analytics_rollup_state")
+    op.drop_table("analytics_daily")
+    op.drop_table("analytics_hourly")
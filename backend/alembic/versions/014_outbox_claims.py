@@ -0,0 +1,27 @@
+"""Outbox claim leases
+
+Revision ID: 014
+Revises: 013
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "014"
+down_revision: Union[str, None] = "013"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Set while a dispatcher is delivering the row; other dispatchers skip it
+    # until then, and pick it up again if that dispatcher died mid-batch
+    op.add_column("outbox_messages", sa.Column("claimed_until", sa.DateTime(timezone=True)))
+
+
+def downgrade() -> None:
+    op.drop_column("outbox_messages", "claimed_until")
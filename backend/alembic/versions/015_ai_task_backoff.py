@@ -0,0 +1,31 @@
+"""AI task retry backoff
+
+Revision ID: 015
+Revises: 014
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "015"
+down_revision: Union[str, None] = "014"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Re-queued tasks are not claimed again before this time
+    op.add_column(
+        "ai_tasks",
+        sa.Column(
+            "available_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("ai_tasks", "available_at")
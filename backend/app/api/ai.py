@@ -1,15 +1,37 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import datetime
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_current_user, get_db
+from app.config import settings
+from app.models.ai_task import AITask, AITaskStatus
 from app.models.job import Job, JobStatus
 from app.models.user import User, UserRole
+from app.services import ai_queue
 from app.services.ai_service import ai_service
+from app.services.recommendations import recommender
 
 router = APIRouter(prefix="/ai", tags=["ai"])
 
 
+def enforce_ai_quota(current_user: User = Depends(get_current_user)) -> User:
+    """Per-user token bucket in front of the LLM-backed endpoints."""
+    key = str(current_user.id)
+    if not ai_service.user_quota.consume(key):
+        retry_after = ai_service.user_quota.get(key).retry_after()
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="AI request quota exceeded, please slow down",
+            headers={"Retry-After": str(max(1, round(retry_after)))},
+        )
+    return current_user
+
+
 class GenerateDescriptionRequest(BaseModel):
     brief: str
     requirements: list[str] | None = None
@@ -35,10 +57,45 @@ class JobMatchResponse(BaseModel):
     reason: str
 
 
-@router.post("/generate-description", response_model=GenerateDescriptionResponse)
+class JobRecommendationResponse(BaseModel):
+    job_id: UUID
+    title: str
+    score: float
+
+
+class AITaskResponse(BaseModel):
+    id: UUID
+    kind: str
+    status: AITaskStatus
+    result: dict | list | None = None
+    error: str | None = None
+    created_at: datetime
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+
+    class Config:
+        from_attributes = True
+
+
+def task_accepted(task: AITask) -> JSONResponse:
+    """202 response pointing the client at the task status endpoint."""
+    return JSONResponse(
+        status_code=status.HTTP_202_ACCEPTED,
+        content=jsonable_encoder(AITaskResponse.model_validate(task)),
+        headers={"Location": f"/api/ai/tasks/{task.id}"},
+    )
+
+
+@router.post(
+    "/generate-description",
+    response_model=GenerateDescriptionResponse,
+    responses={202: {"model": AITaskResponse}},
+)
 async def generate_description(
     request: GenerateDescriptionRequest,
-    current_user: User = Depends(get_current_user),
+    run_async: bool = Query(False, alias="async"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(enforce_ai_quota),
 ):
     """Generate a job description from a brief input (sponsors only)."""
     if current_user.role != UserRole.SPONSOR:
@@ -47,6 +104,15 @@ async def generate_description(
             detail="Only sponsors can generate job descriptions",
         )
 
+    if run_async:
+        task = ai_queue.enqueue(
+            db,
+            current_user.id,
+            "generate_description",
+            {"brief": request.brief, "requirements": request.requirements},
+        )
+        return task_accepted(task)
+
     try:
         result = await ai_service.generate_job_description(
             request.brief, request.requirements
@@ -64,11 +130,16 @@ async def generate_description(
         )
 
 
-@router.post("/generate-cover-letter", response_model=GenerateCoverLetterResponse)
+@router.post(
+    "/generate-cover-letter",
+    response_model=GenerateCoverLetterResponse,
+    responses={202: {"model": AITaskResponse}},
+)
 async def generate_cover_letter(
     request: GenerateCoverLetterRequest,
+    run_async: bool = Query(False, alias="async"),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(enforce_ai_quota),
 ):
     """Generate a cover letter for a job application (apprentices only)."""
     if current_user.role != UserRole.APPRENTICE:
@@ -85,6 +156,20 @@ async def generate_cover_letter(
             detail="Job not found",
         )
 
+    if run_async:
+        task = ai_queue.enqueue(
+            db,
+            current_user.id,
+            "generate_cover_letter",
+            {
+                "job_title": job.title,
+                "job_description": job.description,
+                "apprentice_name": current_user.full_name,
+                "apprentice_bio": current_user.bio,
+            },
+        )
+        return task_accepted(task)
+
     try:
         cover_letter = await ai_service.generate_cover_letter(
             job_title=job.title,
@@ -105,10 +190,15 @@ async def generate_cover_letter(
         )
 
 
-@router.post("/match-jobs", response_model=list[JobMatchResponse])
+@router.post(
+    "/match-jobs",
+    response_model=list[JobMatchResponse],
+    responses={202: {"model": AITaskResponse}},
+)
 async def match_jobs(
+    run_async: bool = Query(False, alias="async"),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(enforce_ai_quota),
 ):
     """Get job recommendations for current apprentice."""
     if current_user.role != UserRole.APPRENTICE:
@@ -117,8 +207,14 @@ async def match_jobs(
             detail="Only apprentices can get job matches",
         )
 
-    # Get open jobs
-    jobs = db.query(Job).filter(Job.status == JobStatus.OPEN).limit(20).all()
+    # Get candidate open jobs (newest first); scoring is chunked by the AI service
+    jobs = (
+        db.query(Job.id, Job.title, Job.description)
+        .filter(Job.status == JobStatus.OPEN)
+        .order_by(Job.created_at.desc())
+        .limit(settings.AI_MATCH_MAX_CANDIDATES)
+        .all()
+    )
     if not jobs:
         return []
 
@@ -127,6 +223,15 @@ async def match_jobs(
         for job in jobs
     ]
 
+    if run_async:
+        task = ai_queue.enqueue(
+            db,
+            current_user.id,
+            "match_jobs",
+            {"apprentice_bio": current_user.bio, "jobs": jobs_data},
+        )
+        return task_accepted(task)
+
     try:
         matches = await ai_service.match_jobs_for_apprentice(
             apprentice_bio=current_user.bio,
@@ -143,3 +248,49 @@ async def match_jobs(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to match jobs: {str(e)}",
         )
+
+
+@router.get("/tasks/{task_id}", response_model=AITaskResponse)
+def get_ai_task(
+    task_id: UUID,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Poll the status/result of a queued AI task."""
+    task = db.query(AITask).filter(AITask.id == task_id).first()
+    if not task or task.user_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Task not found",
+        )
+    return task
+
+
+@router.get("/recommendations", response_model=list[JobRecommendationResponse])
+def recommended_jobs(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Open jobs applied to by apprentices with a similar application history."""
+    if current_user.role != UserRole.APPRENTICE:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only apprentices can get job recommendations",
+        )
+    if not settings.RECOMMENDATIONS_ENABLED:
+        return []
+
+    recommendations = recommender.recommend(current_user.id)
+    if not recommendations:
+        return []
+    titles = dict(
+        db.query(Job.id, Job.title)
+        .filter(Job.id.in_([job_id for job_id, _ in recommendations]))
+        .filter(Job.status == JobStatus.OPEN)
+        .all()
+    )
+    return [
+        JobRecommendationResponse(job_id=job_id, title=titles[job_id], score=score)
+        for job_id, score in recommendations
+        if job_id in titles
+    ]
@@ -0,0 +1,153 @@
+from datetime import datetime, timedelta, timezone
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.api.deps import get_current_user, get_db
+from app.config import settings
+from app.models.analytics import AnalyticsDaily, AnalyticsHourly
+from app.models.user import User
+from app.schemas.analytics import (
+    ActivityPoint,
+    ActivityResponse,
+    BudgetBand,
+    BudgetDistributionResponse,
+    Granularity,
+)
+from app.services.analytics import band_range
+
+router = APIRouter(prefix="/analytics", tags=["analytics"])
+
+ROLLUPS = {"hour": AnalyticsHourly, "day": AnalyticsDaily}
+
+# Bounds how many rollup rows a request can touch, whatever the history size
+MAX_RANGE = {"hour": timedelta(days=31), "day": timedelta(days=731)}
+DEFAULT_RANGE = {"hour": timedelta(days=2), "day": timedelta(days=90)}
+
+
+def require_analytics_access(current_user: User = Depends(get_current_user)) -> User:
+    """Only users listed in ANALYTICS_ALLOWED_EMAILS; nobody while it is empty."""
+    if current_user.email not in settings.ANALYTICS_ALLOWED_EMAILS:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You don't have access to analytics",
+        )
+    return current_user
+
+
+def _utc(value: datetime) -> datetime:
+    """Aware UTC datetime; naive input is taken to be UTC already."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _window(
+    granularity: Granularity, start: datetime | None, end: datetime | None
+) -> tuple[datetime, datetime]:
+    """Resolve the requested range to aware UTC datetimes, within MAX_RANGE."""
+    end = _utc(end) if end else datetime.now(timezone.utc)
+    start = _utc(start) if start else end - DEFAULT_RANGE[granularity]
+    if start >= end:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="start must be before end",
+        )
+    if end - start > MAX_RANGE[granularity]:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Range too large: at most {MAX_RANGE[granularity].days} days by {granularity}",
+        )
+    return start, end
+
+
+def _rollup_query(
+    db: Session, model, columns: list, start: datetime, end: datetime, budget_type: str | None
+):
+    """Rollup rows for buckets starting in [start, end). Buckets are stored as naive UTC."""
+    query = db.query(*columns).filter(
+        model.bucket >= start.replace(tzinfo=None), model.bucket < end.replace(tzinfo=None)
+    )
+    if budget_type:
+        query = query.filter(model.budget_type == budget_type)
+    return query
+
+
+@router.get("/activity", response_model=ActivityResponse)
+def get_activity(
+    granularity: Granularity = "day",
+    start: datetime | None = None,
+    end: datetime | None = None,
+    budget_type: str | None = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_analytics_access),
+):
+    """Jobs posted, applications and acceptances per hour or day, from the rollups."""
+    start, end = _window(granularity, start, end)
+    model = ROLLUPS[granularity]
+    columns = [
+        model.bucket,
+        func.sum(model.jobs_posted),
+        func.sum(model.applications),
+        func.sum(model.acceptances),
+        func.sum(model.budget_total),
+        func.sum(model.budget_count),
+    ]
+    rows = (
+        _rollup_query(db, model, columns, start, end, budget_type)
+        .group_by(model.bucket)
+        .order_by(model.bucket)
+        .all()
+    )
+    points = [
+        ActivityPoint(
+            bucket=bucket.replace(tzinfo=timezone.utc),
+            jobs_posted=jobs_posted,
+            applications=applications,
+            acceptances=acceptances,
+            average_budget=budget_total / budget_count if budget_count else None,
+        )
+        for bucket, jobs_posted, applications, acceptances, budget_total, budget_count in rows
+    ]
+    return ActivityResponse(
+        granularity=granularity, start=start, end=end, budget_type=budget_type, points=points
+    )
+
+
+@router.get("/budgets", response_model=BudgetDistributionResponse)
+def get_budget_distribution(
+    start: datetime | None = None,
+    end: datetime | None = None,
+    budget_type: str | None = Query(None, description="e.g. fixed or hourly"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_analytics_access),
+):
+    """Activity by budget band over a date range, from the daily rollup."""
+    start, end = _window("day", start, end)
+    columns = [
+        AnalyticsDaily.budget_band,
+        func.sum(AnalyticsDaily.jobs_posted),
+        func.sum(AnalyticsDaily.applications),
+        func.sum(AnalyticsDaily.acceptances),
+    ]
+    rows = (
+        _rollup_query(db, AnalyticsDaily, columns, start, end, budget_type)
+        .group_by(AnalyticsDaily.budget_band)
+        .order_by(AnalyticsDaily.budget_band)
+        .all()
+    )
+    bands = []
+    for band, jobs_posted, applications, acceptances in rows:
+        low, high = band_range(band)
+        bands.append(
+            BudgetBand(
+                band=band,
+                low=low,
+                high=high,
+                jobs_posted=jobs_posted,
+                applications=applications,
+                acceptances=acceptances,
+            )
+        )
+    return BudgetDistributionResponse(start=start, end=end, budget_type=budget_type, bands=bands)
@@ -1,6 +1,7 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_current_user, get_db
@@ -12,10 +13,31 @@ from app.schemas.application import (
     ApplicationResponse,
     ApplicationStatusUpdate,
 )
+from app.services import outbox
+from app.services.events import publish_event
+from app.services.idempotency import claim_idempotency_key, store_idempotent_response
+from app.services.job_cache import invalidate_job
+from app.services.status_history import status_history
 
 router = APIRouter(prefix="/applications", tags=["applications"])
 
 
+def _application_event(application: Application, sponsor_id) -> dict:
+    return {
+        "application_id": str(application.id),
+        "job_id": str(application.job_id),
+        "apprentice_id": str(application.apprentice_id),
+        "sponsor_id": str(sponsor_id),
+        "status": application.status,
+    }
+
+
+def _owning_job(db: Session, job_id: UUID) -> Job | None:
+    """The job applications belong to, soft-deleted or not: deleting a job
+    doesn't change who may manage its applications."""
+    return db.query(Job).execution_options(include_deleted=True).filter(Job.id == job_id).first()
+
+
 @router.get("", response_model=list[ApplicationResponse])
 def get_my_applications(
     db: Session = Depends(get_db),
@@ -45,7 +67,7 @@ def get_applications_for_job(
     current_user: User = Depends(get_current_user),
 ):
     """Get applications for a specific job (sponsor/owner only)."""
-    job = db.query(Job).filter(Job.id == job_id).first()
+    job = _owning_job(db, job_id)
     if not job:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -77,6 +99,7 @@ def create_application(
     app_data: ApplicationCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
+    idempotency_key: str | None = Header(None, alias="Idempotency-Key", max_length=255),
 ):
     """Submit an application to a job (apprentices only)."""
     if current_user.role != UserRole.APPRENTICE:
@@ -85,6 +108,13 @@ def create_application(
             detail="Only apprentices can apply to jobs",
         )
 
+    # Retried requests replay the original response
+    replay = claim_idempotency_key(
+        db, current_user.id, idempotency_key, "POST /api/applications", app_data
+    )
+    if replay is not None:
+        return replay
+
     # Check if job exists and is open
     job = db.query(Job).filter(Job.id == app_data.job_id).first()
     if not job:
@@ -99,34 +129,53 @@ def create_application(
             detail="This job is no longer accepting applications",
         )
 
-    # Check if already applied
-    existing = (
-        db.query(Application)
-        .filter(
-            Application.job_id == app_data.job_id,
-            Application.apprentice_id == current_user.id,
+    # Insert unless already applied; the unique constraint decides atomically,
+    # so concurrent duplicates cannot slip through between a check and the insert
+    stmt = (
+        insert(Application)
+        .values(
+            job_id=app_data.job_id,
+            apprentice_id=current_user.id,
+            cover_letter=app_data.cover_letter,
+            proposed_rate=app_data.proposed_rate,
+            estimated_completion_days=app_data.estimated_completion_days,
+            ai_generated_cover_letter=app_data.ai_generated_cover_letter,
         )
-        .first()
+        .on_conflict_do_nothing(constraint="uq_application_job_apprentice")
+        .returning(Application)
     )
-    if existing:
+    application = db.execute(stmt).scalar_one_or_none()
+    if application is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="You have already applied to this job",
         )
 
-    application = Application(
-        job_id=app_data.job_id,
-        apprentice_id=current_user.id,
-        cover_letter=app_data.cover_letter,
-        proposed_rate=app_data.proposed_rate,
-        estimated_completion_days=app_data.estimated_completion_days,
-        ai_generated_cover_letter=app_data.ai_generated_cover_letter,
+    publish_event(
+        db, "applications", "application.created", _application_event(application, job.sponsor_id)
+    )
+    # Sent by the outbox dispatcher once this transaction commits
+    outbox.enqueue(
+        db,
+        job.sponsor_id,
+        outbox.APPLICATION_RECEIVED,
+        {
+            "application_id": str(application.id),
+            "job_id": str(job.id),
+            "job_title": job.title,
+            "apprentice_name": current_user.full_name,
+        },
+    )
+    response = ApplicationResponse.model_validate(application)
+    store_idempotent_response(
+        db, current_user.id, idempotency_key, status.HTTP_201_CREATED, response
     )
-    db.add(application)
     db.commit()
-    db.refresh(application)
+    # The job's cached application_count is now stale
+    invalidate_job(application.job_id)
+    status_history.record(application, None, current_user.id)
 
-    return application
+    return response
 
 
 @router.get("/{application_id}", response_model=ApplicationResponse)
@@ -144,7 +193,7 @@ def get_application(
         )
 
     # Check permissions
-    job = db.query(Job).filter(Job.id == application.job_id).first()
+    job = _owning_job(db, application.job_id)
     is_owner = application.apprentice_id == current_user.id
     is_sponsor = job and job.sponsor_id == current_user.id
 
@@ -172,7 +221,7 @@ def update_application_status(
             detail="Application not found",
         )
 
-    job = db.query(Job).filter(Job.id == application.job_id).first()
+    job = _owning_job(db, application.job_id)
 
     # Apprentice can only withdraw their own application
     if status_update.status == ApplicationStatus.WITHDRAWN:
@@ -194,8 +243,26 @@ def update_application_status(
             detail="Invalid status transition",
         )
 
+    previous_status = application.status
     application.status = status_update.status
+    publish_event(
+        db,
+        "applications",
+        "application.status_changed",
+        _application_event(application, job.sponsor_id if job else None),
+    )
+    if status_update.status in (ApplicationStatus.ACCEPTED, ApplicationStatus.REJECTED):
+        outbox.enqueue(
+            db,
+            application.apprentice_id,
+            outbox.APPLICATION_ACCEPTED
+            if status_update.status == ApplicationStatus.ACCEPTED
+            else outbox.APPLICATION_REJECTED,
+            {"application_id": str(application.id), "job_id": str(job.id), "job_title": job.title},
+        )
     db.commit()
     db.refresh(application)
+    # Recorded off the request path; see app.services.status_history
+    status_history.record(application, previous_status, current_user.id)
 
     return application
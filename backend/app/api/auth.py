@@ -1,10 +1,26 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import csv
+import io
+
+from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
 from fastapi.security import OAuth2PasswordRequestForm
+from pydantic import ValidationError
+from sqlalchemy import String, any_, literal, select
+from sqlalchemy.dialects.postgresql import ARRAY, insert
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_current_user, get_db
-from app.models.user import User
-from app.schemas.user import Token, UserCreate, UserResponse
+from app.config import settings
+from app.models.user import User, UserRole
+from app.schemas.user import (
+    BulkApprenticeCreate,
+    BulkRegisterRequest,
+    BulkRegisterResponse,
+    BulkRegisterResult,
+    Token,
+    UserCreate,
+    UserResponse,
+)
+from app.services.password_hashing import password_hash_pool
 from app.utils.security import create_access_token, get_password_hash, verify_password
 
 router = APIRouter(prefix="/auth", tags=["auth"])
@@ -41,6 +57,145 @@ def register(user_data: UserCreate, db: Session = Depends(get_db)):
     return user
 
 
+def _too_many_rows() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"At most {settings.BULK_REGISTER_MAX_ROWS} rows per request",
+    )
+
+
+def _row_error(index: int, email, message: str) -> BulkRegisterResult:
+    return BulkRegisterResult(
+        index=index, email=email if isinstance(email, str) else None, status="error", error=message
+    )
+
+
+def register_apprentices(
+    db: Session, current_user: User, rows: list[dict]
+) -> BulkRegisterResponse:
+    """Validate, hash and insert a cohort of apprentices, reporting each row.
+
+    One `= ANY` lookup for existing emails, bcrypt across the hashing process
+    pool with no transaction open, and one multi-row INSERT.
+    """
+    if current_user.role != UserRole.SPONSOR:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only sponsors can register apprentices in bulk",
+        )
+    if len(rows) > settings.BULK_REGISTER_MAX_ROWS:
+        raise _too_many_rows()
+
+    results: dict[int, BulkRegisterResult] = {}
+    candidates: dict[str, tuple[int, BulkApprenticeCreate]] = {}
+    for index, raw in enumerate(rows):
+        try:
+            row = BulkApprenticeCreate.model_validate(raw)
+        except ValidationError as e:
+            error = e.errors()[0]
+            field = ".".join(str(part) for part in error["loc"])
+            results[index] = _row_error(index, raw.get("email"), f"{field}: {error['msg']}")
+            continue
+        if row.email in candidates:
+            results[index] = _row_error(index, row.email, "Duplicate email in this request")
+            continue
+        candidates[row.email] = (index, row)
+
+    if candidates:
+        emails = literal(list(candidates), ARRAY(String))
+        for email in db.scalars(select(User.email).where(User.email == any_(emails))):
+            index, _ = candidates.pop(email)
+            results[index] = _row_error(index, email, "Email already registered")
+        # Hand the connection back to the pool for the seconds bcrypt takes
+        db.rollback()
+
+    if candidates:
+        pending = list(candidates.values())
+        hashes = password_hash_pool.hash_all([row.password for _, row in pending])
+        stmt = (
+            insert(User)
+            .values(
+                [
+                    {
+                        "email": row.email,
+                        "password_hash": password_hash,
+                        "role": UserRole.APPRENTICE,
+                        "full_name": row.full_name,
+                        "bio": row.bio,
+                        "portfolio_url": row.portfolio_url,
+                        "github_url": row.github_url,
+                        "linkedin_url": row.linkedin_url,
+                    }
+                    for (_, row), password_hash in zip(pending, hashes)
+                ]
+            )
+            # A concurrent registration may have taken an email since the lookup
+            .on_conflict_do_nothing(index_elements=[User.email])
+            .returning(User.id, User.email)
+        )
+        created = {email: user_id for user_id, email in db.execute(stmt)}
+        db.commit()
+        for email, (index, _) in candidates.items():
+            if email in created:
+                results[index] = BulkRegisterResult(
+                    index=index, email=email, status="created", user_id=created[email]
+                )
+            else:
+                results[index] = _row_error(index, email, "Email already registered")
+
+    ordered = [results[index] for index in sorted(results)]
+    created_count = sum(result.status == "created" for result in ordered)
+    return BulkRegisterResponse(
+        created=created_count, failed=len(ordered) - created_count, results=ordered
+    )
+
+
+@router.post("/register/bulk", response_model=BulkRegisterResponse)
+def register_bulk(
+    request: BulkRegisterRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Register a cohort of apprentices from JSON (sponsors only)."""
+    return register_apprentices(db, current_user, request.apprentices)
+
+
+@router.post("/register/bulk/csv", response_model=BulkRegisterResponse)
+def register_bulk_csv(
+    file: UploadFile = File(...),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Register a cohort of apprentices from a CSV upload (sponsors only).
+
+    The header row names the columns: email, password, full_name and optionally
+    bio, portfolio_url, github_url, linkedin_url. The upload is decoded and
+    parsed as it is read, and reading stops once it exceeds the row limit.
+    """
+    text = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+    rows = []
+    try:
+        for row in csv.DictReader(text):
+            if len(rows) == settings.BULK_REGISTER_MAX_ROWS:
+                raise _too_many_rows()
+            # Empty cells mean "not provided"
+            rows.append({key: value or None for key, value in row.items() if key})
+    except UnicodeDecodeError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="CSV must be UTF-8 encoded",
+        )
+    except csv.Error as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid CSV: {e}",
+        )
+    finally:
+        # The upload's file is closed by FastAPI, not by the wrapper
+        text.detach()
+    return register_apprentices(db, current_user, rows)
+
+
 @router.post("/login", response_model=Token)
 def login(
     form_data: OAuth2PasswordRequestForm = Depends(),
@@ -0,0 +1,155 @@
+import base64
+import json
+import re
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import and_, cast, func, or_
+from sqlalchemy.dialects.postgresql import REGCONFIG
+from sqlalchemy.orm import Session
+
+from app.api.deps import get_current_user, get_db
+from app.models.job import Job
+from app.models.user import User, UserRole
+from app.schemas.user import CandidateResult, CandidateSearchResponse
+from app.utils.text import make_snippet
+
+router = APIRouter(prefix="/candidates", tags=["candidates"])
+
+# Distinct job terms OR-ed together when searching by job; enough to describe
+# the work without turning the query into a scan of every posting
+MAX_JOB_TERMS = 32
+# Word characters only, so job text can't inject tsquery operators
+_TERM_PATTERN = re.compile(r"[a-z][a-z0-9]{2,}")
+
+_BIO_FETCH_CHARS = 300
+
+
+def job_terms_query(job: Job):
+    """tsquery matching any of the job's leading title/description terms.
+
+    Title terms come first so they survive the cap.
+    """
+    terms: list[str] = []
+    seen = set()
+    for text in (job.title, job.description):
+        for term in _TERM_PATTERN.findall((text or "").lower()):
+            if term not in seen and len(terms) < MAX_JOB_TERMS:
+                seen.add(term)
+                terms.append(term)
+    if not terms:
+        return None
+    return func.to_tsquery(cast("english", REGCONFIG), " | ".join(terms))
+
+
+def encode_cursor(rank: float, user_id: UUID) -> str:
+    raw = json.dumps([rank, str(user_id)]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[float, UUID]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        rank, user_id = json.loads(base64.urlsafe_b64decode(padded))
+        return float(rank), UUID(user_id)
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+
+
+@router.get("", response_model=CandidateSearchResponse)
+def search_candidates(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+    q: str | None = Query(None, max_length=200),
+    job_id: UUID | None = None,
+    limit: int = Query(20, ge=1, le=100),
+    cursor: str | None = None,
+):
+    """Ranked full-text search over apprentice names and bios.
+
+    `q` accepts web-search syntax ("python -php", quoted phrases, `or`).
+    `job_id` searches with one of the sponsor's jobs instead; with both, `q`
+    filters and the job ranks. Results are keyset-paginated with `cursor`.
+    """
+    if current_user.role != UserRole.SPONSOR:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only sponsors can search candidates",
+        )
+    if not q and job_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Provide q or job_id",
+        )
+
+    text_query = func.websearch_to_tsquery(cast("english", REGCONFIG), q) if q else None
+    job_query = None
+    if job_id is not None:
+        job = db.query(Job).filter(Job.id == job_id).first()
+        if not job:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Job not found",
+            )
+        if job.sponsor_id != current_user.id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You can only search candidates for your own jobs",
+            )
+        job_query = job_terms_query(job)
+        if job_query is None and text_query is None:
+            return CandidateSearchResponse(candidates=[])
+
+    rank_query = job_query if job_query is not None else text_query
+    rank = func.ts_rank(User.search_vector, rank_query)
+
+    # The partial GIN index covers exactly role = 'apprentice' plus the @@ match
+    query = db.query(User).filter(
+        User.role == UserRole.APPRENTICE,
+        User.search_vector.op("@@")(rank_query),
+    )
+    if text_query is not None and job_query is not None:
+        query = query.filter(User.search_vector.op("@@")(text_query))
+
+    if cursor:
+        last_rank, last_id = decode_cursor(cursor)
+        query = query.filter(
+            or_(rank < last_rank, and_(rank == last_rank, User.id < last_id))
+        )
+
+    rows = (
+        query.with_entities(
+            User.id,
+            User.full_name,
+            func.left(User.bio, _BIO_FETCH_CHARS).label("bio"),
+            User.portfolio_url,
+            User.github_url,
+            User.linkedin_url,
+            User.created_at,
+            rank.label("rank"),
+        )
+        .order_by(rank.desc(), User.id.desc())
+        .limit(limit + 1)
+        .all()
+    )
+
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    candidates = [
+        CandidateResult(
+            id=row.id,
+            full_name=row.full_name,
+            bio_snippet=make_snippet(row.bio),
+            portfolio_url=row.portfolio_url,
+            github_url=row.github_url,
+            linkedin_url=row.linkedin_url,
+            created_at=row.created_at,
+            rank=row.rank,
+        )
+        for row in rows
+    ]
+    next_cursor = encode_cursor(rows[-1].rank, rows[-1].id) if has_more else None
+    return CandidateSearchResponse(candidates=candidates, next_cursor=next_cursor)
@@ -0,0 +1,70 @@
+import asyncio
+import json
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+from fastapi.security import OAuth2PasswordBearer
+
+from app.config import settings
+from app.services.events import event_broker
+from app.utils.security import decode_access_token
+
+router = APIRouter(prefix="/events", tags=["events"])
+
+# EventSource cannot set headers, so the token may also come as a query parameter
+optional_oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login", auto_error=False)
+
+TOPICS = {"jobs", "applications"}
+
+
+@router.get("")
+async def stream_events(
+    request: Request,
+    topics: str = Query("jobs", description="Comma-separated: jobs, applications"),
+    access_token: str | None = None,
+    header_token: str | None = Depends(optional_oauth2_scheme),
+):
+    """Server-sent events for job and application changes."""
+    requested = {t.strip() for t in topics.split(",") if t.strip()}
+    if not requested or not requested <= TOPICS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown topic; choose from {', '.join(sorted(TOPICS))}",
+        )
+
+    # Resolve the user from the signed token alone, so no DB session is held
+    # for the lifetime of the stream
+    user_id = None
+    token = header_token or access_token
+    if token:
+        payload = decode_access_token(token)
+        user_id = payload.get("sub") if payload else None
+    if "applications" in requested and user_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Application events require authentication",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    subscriber = event_broker.subscribe(requested, user_id)
+
+    async def event_stream():
+        try:
+            yield "retry: 3000\n\n"
+            while not await request.is_disconnected():
+                try:
+                    event = await asyncio.wait_for(
+                        subscriber.queue.get(), timeout=settings.EVENTS_HEARTBEAT_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                yield f"event: {event['type']}\ndata: {json.dumps(event)}\n\n"
+        finally:
+            event_broker.unsubscribe(subscriber)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
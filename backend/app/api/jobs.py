@@ -1,77 +1,288 @@
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Literal
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import func
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+from sqlalchemy import case, func
+from sqlalchemy.orm import Query as OrmQuery
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_current_user, get_db
-from app.models.application import Application
+from app.config import settings
+from app.models.archive import JobArchive
 from app.models.job import Job, JobStatus
+from app.models.job_stats import JobApplicationStats
 from app.models.user import User, UserRole
-from app.schemas.job import JobCreate, JobListResponse, JobResponse, JobUpdate
+from app.schemas.job import (
+    JobCreate,
+    JobDashboardEntry,
+    JobFacetCount,
+    JobFacetsResponse,
+    JobListResponse,
+    JobResponse,
+    JobSummary,
+    JobSummaryListResponse,
+    JobUpdate,
+    SponsorDashboardResponse,
+)
+from app.services.events import publish_event
+from app.services.idempotency import claim_idempotency_key, store_idempotent_response
+from app.services.job_cache import invalidate_job, job_cache
+from app.services.job_dedupe import job_duplicate_index
+from app.services.job_responses import job_to_response
+from app.utils.text import SNIPPET_LENGTH, make_snippet
 
 router = APIRouter(prefix="/jobs", tags=["jobs"])
 
 
-def job_to_response(job: Job, db: Session) -> JobResponse:
-    """Convert Job model to JobResponse with application count."""
-    app_count = db.query(func.count(Application.id)).filter(Application.job_id == job.id).scalar()
-    return JobResponse(
-        id=job.id,
-        sponsor_id=job.sponsor_id,
-        title=job.title,
-        description=job.description,
-        requirements=job.requirements,
-        budget_min=job.budget_min,
-        budget_max=job.budget_max,
-        budget_type=job.budget_type,
-        estimated_hours=job.estimated_hours,
-        deadline=job.deadline,
-        status=job.status,
-        ai_generated_description=job.ai_generated_description,
-        created_at=job.created_at,
-        application_count=app_count or 0,
-        sponsor=job.sponsor,
+# A little more description than a snippet is fetched so it can end on a word boundary
+_SNIPPET_FETCH_CHARS = SNIPPET_LENGTH + 50
+
+
+def summarize_jobs(
+    query: OrmQuery, skip: int = 0, limit: int | None = None
+) -> list[JobSummary]:
+    """Run a Job query selecting only the columns a job card needs.
+
+    Reads a description prefix instead of the full text, the sponsor display
+    name instead of the whole user row, and the application count from the
+    stats table, all in one statement.
+    """
+    rows = (
+        query.join(User, User.id == Job.sponsor_id)
+        .outerjoin(JobApplicationStats, JobApplicationStats.job_id == Job.id)
+        .with_entities(
+            Job.id,
+            Job.sponsor_id,
+            func.coalesce(User.company_name, User.full_name).label("sponsor_name"),
+            Job.title,
+            func.left(Job.description, _SNIPPET_FETCH_CHARS).label("description_prefix"),
+            Job.budget_min,
+            Job.budget_max,
+            Job.budget_type,
+            Job.estimated_hours,
+            Job.deadline,
+            Job.status,
+            Job.ai_generated_description,
+            Job.created_at,
+            func.coalesce(
+                JobApplicationStats.pending_count
+                + JobApplicationStats.accepted_count
+                + JobApplicationStats.rejected_count
+                + JobApplicationStats.withdrawn_count,
+                0,
+            ).label("application_count"),
+        )
+        .offset(skip)
+        .limit(limit)
+        .all()
     )
+    return [
+        JobSummary(
+            id=row.id,
+            sponsor_id=row.sponsor_id,
+            sponsor_name=row.sponsor_name,
+            title=row.title,
+            snippet=make_snippet(row.description_prefix),
+            budget_min=row.budget_min,
+            budget_max=row.budget_max,
+            budget_type=row.budget_type,
+            estimated_hours=row.estimated_hours,
+            deadline=row.deadline,
+            status=row.status,
+            ai_generated_description=row.ai_generated_description,
+            created_at=row.created_at,
+            application_count=row.application_count,
+        )
+        for row in rows
+    ]
 
 
-@router.get("", response_model=JobListResponse)
-def list_jobs(
-    db: Session = Depends(get_db),
-    skip: int = Query(0, ge=0),
-    limit: int = Query(20, ge=1, le=100),
+def _job_event(job: Job) -> dict:
+    return {"job_id": str(job.id), "sponsor_id": str(job.sponsor_id), "status": job.status}
+
+
+# Upper bounds (inclusive) of the budget facet buckets; the last bucket is open-ended
+BUDGET_BUCKETS = [100, 500, 1000, 5000]
+
+# Deadline facet windows, in days from today
+DEADLINE_WINDOWS = [7, 30, 90]
+
+
+@dataclass
+class JobFilters:
+    """Server-side filters shared by the job list and facet endpoints."""
+
+    status: JobStatus | None = None
+    search: str | None = None
+    budget_min: int | None = None
+    budget_max: int | None = None
+    budget_type: str | None = None
+    hours_min: int | None = None
+    hours_max: int | None = None
+    deadline_after: date | None = None
+    deadline_before: date | None = None
+
+
+def get_job_filters(
     status_filter: JobStatus | None = Query(None, alias="status"),
     search: str | None = None,
-):
-    """List all open jobs with optional filters."""
-    query = db.query(Job)
+    budget_min: int | None = Query(None, ge=0),
+    budget_max: int | None = Query(None, ge=0),
+    budget_type: str | None = None,
+    hours_min: int | None = Query(None, ge=0),
+    hours_max: int | None = Query(None, ge=0),
+    deadline_after: date | None = None,
+    deadline_before: date | None = None,
+) -> JobFilters:
+    return JobFilters(
+        status=status_filter,
+        search=search,
+        budget_min=budget_min,
+        budget_max=budget_max,
+        budget_type=budget_type,
+        hours_min=hours_min,
+        hours_max=hours_max,
+        deadline_after=deadline_after,
+        deadline_before=deadline_before,
+    )
 
+
+def apply_job_filters(query: OrmQuery, filters: JobFilters) -> OrmQuery:
+    """Apply status, search, budget, hours and deadline filters to a Job query."""
     # Filter by status (default to open jobs)
-    if status_filter:
-        query = query.filter(Job.status == status_filter)
+    if filters.status:
+        query = query.filter(Job.status == filters.status)
     else:
         query = query.filter(Job.status == JobStatus.OPEN)
 
     # Search in title and description
-    if search:
-        search_term = f"%{search}%"
+    if filters.search:
+        search_term = f"%{filters.search}%"
         query = query.filter(
             (Job.title.ilike(search_term)) | (Job.description.ilike(search_term))
         )
 
+    # Budget range overlaps the requested range (a single bound counts as both ends)
+    if filters.budget_min is not None:
+        query = query.filter(
+            func.coalesce(Job.budget_max, Job.budget_min) >= filters.budget_min
+        )
+    if filters.budget_max is not None:
+        query = query.filter(
+            func.coalesce(Job.budget_min, Job.budget_max) <= filters.budget_max
+        )
+    if filters.budget_type:
+        query = query.filter(Job.budget_type == filters.budget_type)
+
+    if filters.hours_min is not None:
+        query = query.filter(Job.estimated_hours >= filters.hours_min)
+    if filters.hours_max is not None:
+        query = query.filter(Job.estimated_hours <= filters.hours_max)
+
+    if filters.deadline_after is not None:
+        query = query.filter(Job.deadline >= filters.deadline_after)
+    if filters.deadline_before is not None:
+        query = query.filter(Job.deadline <= filters.deadline_before)
+
+    return query
+
+
+_BUDGET_LOWER_BOUNDS = [0] + [upper + 1 for upper in BUDGET_BUCKETS]
+_BUDGET_BUCKET_ORDER = [
+    f"{lower}-{upper}" for lower, upper in zip(_BUDGET_LOWER_BOUNDS, BUDGET_BUCKETS)
+] + [f"{BUDGET_BUCKETS[-1]}+", "unspecified"]
+
+_DEADLINE_WINDOW_ORDER = ["past"] + [f"{days}d" for days in DEADLINE_WINDOWS] + ["later", "none"]
+
+
+def _budget_bucket_expr():
+    budget = func.coalesce(Job.budget_max, Job.budget_min)
+    whens = [(budget.is_(None), "unspecified")]
+    for label, upper in zip(_BUDGET_BUCKET_ORDER, BUDGET_BUCKETS):
+        whens.append((budget <= upper, label))
+    return case(*whens, else_=f"{BUDGET_BUCKETS[-1]}+")
+
+
+def _deadline_window_expr(today: date):
+    whens = [(Job.deadline.is_(None), "none"), (Job.deadline < today, "past")]
+    for days in DEADLINE_WINDOWS:
+        whens.append((Job.deadline <= today + timedelta(days=days), f"{days}d"))
+    return case(*whens, else_="later")
+
+
+@router.get("", response_model=JobListResponse | JobSummaryListResponse)
+def list_jobs(
+    db: Session = Depends(get_db),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+    filters: JobFilters = Depends(get_job_filters),
+    view: Literal["full", "summary"] = "full",
+):
+    """List all open jobs with optional filters.
+
+    `view=summary` returns compact cards (snippet instead of description, no
+    nested sponsor).
+    """
+    query = apply_job_filters(db.query(Job), filters)
+
     total = query.count()
-    jobs = query.order_by(Job.created_at.desc()).offset(skip).limit(limit).all()
+    query = query.order_by(Job.created_at.desc())
 
+    if view == "summary":
+        return JobSummaryListResponse(jobs=summarize_jobs(query, skip, limit), total=total)
+
+    jobs = query.offset(skip).limit(limit).all()
     return JobListResponse(
         jobs=[job_to_response(job, db) for job in jobs],
         total=total,
     )
 
 
-@router.get("/my", response_model=JobListResponse)
+@router.get("/facets", response_model=JobFacetsResponse)
+def get_job_facets(
+    db: Session = Depends(get_db),
+    filters: JobFilters = Depends(get_job_filters),
+):
+    """Count matching jobs per budget bucket, budget type and deadline window."""
+    bucket = _budget_bucket_expr().label("bucket")
+    window = _deadline_window_expr(date.today()).label("window")
+
+    # One grouped query over the (small) cross product of the three facets,
+    # folded into per-facet counts below
+    query = apply_job_filters(
+        db.query(bucket, Job.budget_type, window, func.count(Job.id)), filters
+    ).group_by(bucket, Job.budget_type, window)
+
+    budget_counts: dict[str, int] = {}
+    type_counts: dict[str, int] = {}
+    deadline_counts: dict[str, int] = {}
+    total = 0
+    for bucket_value, budget_type, window_value, count in query.all():
+        budget_type = budget_type or "unspecified"
+        budget_counts[bucket_value] = budget_counts.get(bucket_value, 0) + count
+        type_counts[budget_type] = type_counts.get(budget_type, 0) + count
+        deadline_counts[window_value] = deadline_counts.get(window_value, 0) + count
+        total += count
+
+    def to_counts(counts: dict[str, int], order: list[str]) -> list[JobFacetCount]:
+        ordered = [v for v in order if v in counts] + sorted(set(counts) - set(order))
+        return [JobFacetCount(value=value, count=counts[value]) for value in ordered]
+
+    return JobFacetsResponse(
+        budget=to_counts(budget_counts, _BUDGET_BUCKET_ORDER),
+        budget_type=to_counts(type_counts, []),
+        deadline=to_counts(deadline_counts, _DEADLINE_WINDOW_ORDER),
+        total=total,
+    )
+
+
+@router.get("/my", response_model=JobListResponse | JobSummaryListResponse)
 def get_my_jobs(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
+    view: Literal["full", "summary"] = "full",
 ):
     """Get jobs posted by current sponsor."""
     if current_user.role != UserRole.SPONSOR:
@@ -80,29 +291,80 @@ def get_my_jobs(
             detail="Only sponsors can view their posted jobs",
         )
 
-    jobs = (
-        db.query(Job)
-        .filter(Job.sponsor_id == current_user.id)
-        .order_by(Job.created_at.desc())
-        .all()
+    query = db.query(Job).filter(Job.sponsor_id == current_user.id).order_by(
+        Job.created_at.desc()
     )
 
+    if view == "summary":
+        summaries = summarize_jobs(query)
+        return JobSummaryListResponse(jobs=summaries, total=len(summaries))
+
+    jobs = query.all()
+
     return JobListResponse(
         jobs=[job_to_response(job, db) for job in jobs],
         total=len(jobs),
     )
 
 
+@router.get("/my/dashboard", response_model=SponsorDashboardResponse)
+def get_my_dashboard(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Per-job application aggregates for the current sponsor."""
+    if current_user.role != UserRole.SPONSOR:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only sponsors can view their dashboard",
+        )
+
+    # Aggregates come pre-computed from job_application_stats (kept current by
+    # a trigger on applications), so this is a single indexed join
+    rows = (
+        db.query(Job.id, Job.title, Job.status, Job.created_at, JobApplicationStats)
+        .outerjoin(JobApplicationStats, JobApplicationStats.job_id == Job.id)
+        .filter(Job.sponsor_id == current_user.id)
+        .order_by(Job.created_at.desc())
+        .all()
+    )
+
+    entries = []
+    for job_id, title, job_status, created_at, stats in rows:
+        entry = JobDashboardEntry(
+            job_id=job_id, title=title, status=job_status, created_at=created_at
+        )
+        if stats is not None:
+            entry.total_applications = stats.total_count
+            entry.pending_count = stats.pending_count
+            entry.accepted_count = stats.accepted_count
+            entry.rejected_count = stats.rejected_count
+            entry.withdrawn_count = stats.withdrawn_count
+            entry.average_proposed_rate = stats.average_proposed_rate
+            entry.last_application_at = stats.last_application_at
+        entries.append(entry)
+
+    return SponsorDashboardResponse(jobs=entries, total=len(entries))
+
+
 @router.get("/{job_id}", response_model=JobResponse)
 def get_job(job_id: UUID, db: Session = Depends(get_db)):
-    """Get job details."""
-    job = db.query(Job).filter(Job.id == job_id).first()
-    if not job:
+    """Get job details (served from the per-worker job cache when warm)."""
+
+    def load() -> JobResponse | None:
+        job = db.query(Job).filter(Job.id == job_id).first()
+        if not job:
+            # Finished jobs may have been moved out of the hot table
+            job = db.query(JobArchive).filter(JobArchive.id == job_id).first()
+        return job_to_response(job, db) if job else None
+
+    response = job_cache.get_or_load(str(job_id), load)
+    if response is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Job not found",
         )
-    return job_to_response(job, db)
+    return response
 
 
 @router.post("", response_model=JobResponse, status_code=status.HTTP_201_CREATED)
@@ -110,6 +372,7 @@ def create_job(
     job_data: JobCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
+    idempotency_key: str | None = Header(None, alias="Idempotency-Key", max_length=255),
 ):
     """Create a new job posting (sponsors only)."""
     if current_user.role != UserRole.SPONSOR:
@@ -118,6 +381,22 @@ def create_job(
             detail="Only sponsors can post jobs",
         )
 
+    # Retried requests replay the original response instead of posting twice
+    replay = claim_idempotency_key(
+        db, current_user.id, idempotency_key, "POST /api/jobs", job_data
+    )
+    if replay is not None:
+        return replay
+
+    duplicates = []
+    if settings.JOB_DUPLICATE_MODE != "off":
+        duplicates = job_duplicate_index.find_duplicates(db, job_data.title, job_data.description)
+        if duplicates and settings.JOB_DUPLICATE_MODE == "reject":
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"A near-identical job is already open: {duplicates[0][0]}",
+            )
+
     job = Job(
         sponsor_id=current_user.id,
         title=job_data.title,
@@ -131,10 +410,18 @@ def create_job(
         ai_generated_description=job_data.ai_generated_description,
     )
     db.add(job)
+    db.flush()
+    publish_event(db, "jobs", "job.created", _job_event(job))
+    response = job_to_response(job, db)
+    response.possible_duplicate_of = [job_id for job_id, _ in duplicates]
+    store_idempotent_response(
+        db, current_user.id, idempotency_key, status.HTTP_201_CREATED, response
+    )
     db.commit()
-    db.refresh(job)
+    if settings.JOB_DUPLICATE_MODE != "off":
+        job_duplicate_index.update(job)
 
-    return job_to_response(job, db)
+    return response
 
 
 @router.put("/{job_id}", response_model=JobResponse)
@@ -162,8 +449,12 @@ def update_job(
     for field, value in update_data.items():
         setattr(job, field, value)
 
+    publish_event(db, "jobs", "job.updated", _job_event(job))
     db.commit()
+    invalidate_job(job.id)
     db.refresh(job)
+    if settings.JOB_DUPLICATE_MODE != "off":
+        job_duplicate_index.update(job)
 
     return job_to_response(job, db)
 
@@ -188,5 +479,15 @@ def delete_job(
             detail="You can only delete your own jobs",
         )
 
-    db.delete(job)
+    if settings.JOB_SOFT_DELETE:
+        # Closed as well as hidden, so the expiry sweep rejects (and notifies)
+        # applications still pending on it
+        job.status = JobStatus.CANCELLED
+        job.deleted_at = func.now()
+    publish_event(db, "jobs", "job.deleted", _job_event(job))
+    if not settings.JOB_SOFT_DELETE:
+        # One DELETE; applications and stats are removed by ON DELETE CASCADE
+        db.delete(job)
     db.commit()
+    invalidate_job(job_id)
+    job_duplicate_index.remove(job_id)
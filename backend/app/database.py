@@ -3,10 +3,22 @@ from sqlalchemy.orm import DeclarativeBase, sessionmaker
 
 from app.config import settings
 
-engine = create_engine(settings.DATABASE_URL)
+engine = create_engine(
+    settings.DATABASE_URL,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
+def warm_pool(size: int) -> None:
+    """Open pooled connections up front so the first requests skip connection setup."""
+    connections = [engine.connect() for _ in range(min(size, settings.DB_POOL_SIZE))]
+    for conn in connections:
+        conn.exec_driver_sql("SELECT 1")
+        conn.close()
+
+
 class Base(DeclarativeBase):
     pass
 
@@ -1,15 +1,145 @@
+import asyncio
+import logging
+import os
+import time
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.api import ai, applications, auth, jobs
+from app.api import ai, analytics, applications, auth, candidates, events, jobs
 from app.config import settings
+from app.database import warm_pool
+from app.middleware.compression import CompressionMiddleware
+from app.middleware.rate_limit import RateLimitMiddleware
+from app.middleware.snapshots import SnapshotMiddleware
+from app.services.ai_queue import ai_worker_pool, purge_finished_tasks
+from app.services.ai_service import ai_service
+from app.services.analytics import rollup_analytics
+from app.services.archive import archive_finished_jobs, purge_deleted_jobs
+from app.services.events import event_broker
+from app.services.idempotency import purge_expired_keys
+from app.services.job_cache import handle_event as invalidate_cached_jobs
+from app.services.job_dedupe import job_duplicate_index
+from app.services.job_expiry import expire_jobs
+from app.services.outbox import outbox_dispatcher, purge_sent_messages
+from app.services.password_hashing import password_hash_pool
+from app.services.rate_limit_store import PostgresBucketStore, purge_idle_buckets
+from app.services.recommendations import recommender
+from app.services.scheduler import scheduler
+from app.services.snapshots import refresh_job_snapshots, snapshot_store
+from app.services.status_history import status_history
+from app.utils.process import rss_mb
+from app.utils.rate_limit import LeasedRateLimiter
+
+logger = logging.getLogger(__name__)
+
+# Heavy dependencies imported on first use (see app.utils.security and
+# app.services.ai_service) so cold starts skip them; the preloading gunicorn
+# master imports them up front instead, so forked workers share the pages
+LAZY_MODULES = ("httpx", "jose.jwt", "passlib.context")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    started = time.perf_counter()
+
+    # Pay connection setup before serving traffic rather than on the first requests
+    if settings.WARMUP_ON_STARTUP:
+        try:
+            await asyncio.to_thread(warm_pool, settings.DB_POOL_SIZE)
+        except Exception:
+            logger.exception("Database pool warmup failed")
+        await ai_service.warmup()
+
+    # Near-duplicate index over open jobs, per worker (built in the background)
+    if settings.JOB_DUPLICATE_MODE != "off":
+        job_duplicate_index.start_rebuild()
+    if settings.RECOMMENDATIONS_ENABLED:
+        recommender.start()
+
+    # Background tasks (each run is leader-guarded by a Postgres advisory lock)
+    if settings.SCHEDULER_ENABLED:
+        scheduler.register("expire_jobs", settings.JOB_EXPIRY_INTERVAL_SECONDS, expire_jobs)
+        scheduler.register(
+            "archive_jobs", settings.ARCHIVE_INTERVAL_SECONDS, archive_finished_jobs
+        )
+        scheduler.register("purge_ai_tasks", 3600, purge_finished_tasks)
+        scheduler.register("purge_idempotency_keys", 3600, purge_expired_keys)
+        scheduler.register("purge_deleted_jobs", 3600, purge_deleted_jobs)
+        scheduler.register(
+            "rollup_analytics", settings.ANALYTICS_ROLLUP_INTERVAL_SECONDS, rollup_analytics
+        )
+        scheduler.register("purge_outbox", 3600, purge_sent_messages)
+        if settings.RATE_LIMIT_BACKEND == "postgres":
+            scheduler.register("purge_rate_limit_buckets", 3600, purge_idle_buckets)
+        if settings.SNAPSHOT_ENABLED:
+            scheduler.register(
+                "refresh_job_snapshots", settings.SNAPSHOT_INTERVAL_SECONDS, refresh_job_snapshots
+            )
+        scheduler.start()
+    status_history.start()
+    # Every worker drains the outbox; claim leases keep them off each other's rows
+    if settings.OUTBOX_ENABLED:
+        outbox_dispatcher.start()
+    if settings.AI_WORKER_CONCURRENCY > 0:
+        ai_worker_pool.start(settings.AI_WORKER_CONCURRENCY)
+    # One shared LISTEN connection per worker feeding the SSE subscribers, the
+    # job cache invalidation, the duplicate index and the recommender
+    if settings.EVENTS_ENABLED:
+        event_broker.add_callback(invalidate_cached_jobs)
+        if settings.JOB_DUPLICATE_MODE != "off":
+            event_broker.add_callback(job_duplicate_index.handle_event)
+        if settings.RECOMMENDATIONS_ENABLED:
+            event_broker.add_callback(recommender.handle_event)
+        event_broker.start()
+
+    logger.info(
+        "Worker %d ready in %.0f ms (RSS %.1f MB)",
+        os.getpid(),
+        (time.perf_counter() - started) * 1000,
+        rss_mb(),
+    )
+    yield
+    await event_broker.stop()
+    await recommender.stop()
+    await ai_worker_pool.stop()
+    await scheduler.stop()
+    await outbox_dispatcher.stop()
+    # After the other tasks so nothing records into the buffer behind the flush
+    await status_history.stop()
+    await ai_service.aclose()
+    password_hash_pool.shutdown()
+
 
 app = FastAPI(
     title="AITB Automation Job Board",
     description="API for connecting sponsors with apprentices for automation tasks",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
+# Anonymous job pages and the sitemap straight from disk (inside the rate limiter,
+# so crawlers are still throttled)
+if settings.SNAPSHOT_ENABLED:
+    app.add_middleware(
+        SnapshotMiddleware, store=snapshot_store, max_age=settings.SNAPSHOT_INTERVAL_SECONDS
+    )
+
+# Throttle login, AI and public search before they reach the database (added first so
+# the CORS middleware still decorates 429 responses)
+if settings.RATE_LIMIT_ENABLED:
+    shared_limiter = None
+    if settings.RATE_LIMIT_BACKEND == "postgres":
+        shared_limiter = LeasedRateLimiter(
+            PostgresBucketStore(), lease_fraction=settings.RATE_LIMIT_LEASE_FRACTION
+        )
+    app.add_middleware(
+        RateLimitMiddleware,
+        limiter=shared_limiter,
+        trust_forwarded=settings.RATE_LIMIT_TRUST_FORWARDED,
+    )
+
 # CORS middleware - allow frontend to connect
 app.add_middleware(
     CORSMiddleware,
@@ -24,11 +154,24 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large JSON responses (job lists, application lists with cover letters)
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MIN_SIZE,
+        gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+        brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+        offload_size=settings.COMPRESSION_OFFLOAD_SIZE,
+    )
+
 # Include routers
 app.include_router(auth.router, prefix="/api")
 app.include_router(jobs.router, prefix="/api")
 app.include_router(applications.router, prefix="/api")
 app.include_router(ai.router, prefix="/api")
+app.include_router(candidates.router, prefix="/api")
+app.include_router(analytics.router, prefix="/api")
+app.include_router(events.router, prefix="/api")
 
 
 @app.get("/")
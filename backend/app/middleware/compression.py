@@ -0,0 +1,128 @@
+import gzip
+
+import anyio
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # optional: pip install ".[perf]"
+    brotli = None
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+    "text/",
+)
+
+
+def parse_accept_encoding(header: str) -> dict[str, float]:
+    """Map each accepted coding to its q-value."""
+    codings = {}
+    for part in header.split(","):
+        name, _, params = part.strip().partition(";")
+        if not name:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        codings[name.strip().lower()] = q
+    return codings
+
+
+def choose_encoding(accept_encoding: str) -> str | None:
+    """Prefer brotli when available and accepted, then gzip."""
+    codings = parse_accept_encoding(accept_encoding)
+    wildcard = codings.get("*", 0.0)
+    for name in ("br", "gzip"):
+        if name == "br" and brotli is None:
+            continue
+        if codings.get(name, wildcard) > 0:
+            return name
+    return None
+
+
+class CompressionMiddleware:
+    """Negotiated gzip/brotli for complete (non-streaming) responses.
+
+    Bodies under `minimum_size` pass through untouched, and bodies of at least
+    `offload_size` bytes are compressed in a worker thread so large job and
+    application lists don't stall the event loop. Streaming responses (e.g.
+    the SSE feed) are never buffered.
+
+    Every complete response of a compressible type carries
+    `Vary: Accept-Encoding`, compressed or not, so shared caches keep the
+    variants apart.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 4,
+        brotli_quality: int = 4,
+        offload_size: int = 64 * 1024,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.offload_size = offload_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        start_message: Message | None = None
+        passthrough = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start_message, passthrough
+
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+            if passthrough or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            headers = MutableHeaders(raw=start_message["headers"])
+            negotiable = (
+                not message.get("more_body", False)
+                and "content-encoding" not in headers
+                and headers.get("content-type", "").startswith(COMPRESSIBLE_TYPES)
+            )
+            if negotiable:
+                # Another request for the same URL may get the other variant
+                headers.add_vary_header("Accept-Encoding")
+            if not negotiable or encoding is None or len(body) < self.minimum_size:
+                passthrough = True
+                await send(start_message)
+                await send(message)
+                return
+
+            if len(body) >= self.offload_size:
+                compressed = await anyio.to_thread.run_sync(self.compress, body, encoding)
+            else:
+                compressed = self.compress(body, encoding)
+
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(compressed))
+            await send(start_message)
+            await send({"type": "http.response.body", "body": compressed})
+
+        await self.app(scope, receive, send_wrapper)
+
+    def compress(self, body: bytes, encoding: str) -> bytes:
+        if encoding == "br":
+            return brotli.compress(body, quality=self.brotli_quality)
+        return gzip.compress(body, compresslevel=self.gzip_level, mtime=0)
@@ -0,0 +1,141 @@
+import json
+import logging
+import math
+
+import anyio
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.config import settings
+from app.utils.rate_limit import InMemoryRateLimiter, LeasedRateLimiter, RateLimitPolicy
+from app.utils.security import decode_access_token
+
+logger = logging.getLogger(__name__)
+
+
+def default_policies() -> tuple[RateLimitPolicy, ...]:
+    return (
+        # Password guessing
+        RateLimitPolicy(
+            "login",
+            capacity=settings.RATE_LIMIT_LOGIN_PER_MINUTE,
+            period=60,
+            methods=frozenset({"POST"}),
+            path_prefix="/api/auth/login",
+        ),
+        # Every AI call costs an OpenRouter request
+        RateLimitPolicy(
+            "ai",
+            capacity=settings.RATE_LIMIT_AI_PER_MINUTE,
+            period=60,
+            path_prefix="/api/ai/",
+            key_by="user",
+        ),
+        # Public job search and listing
+        RateLimitPolicy(
+            "search",
+            capacity=settings.RATE_LIMIT_SEARCH_PER_MINUTE,
+            period=60,
+            methods=frozenset({"GET"}),
+            path_prefix="/api/jobs",
+            exact_path=True,
+        ),
+    )
+
+
+def client_ip(scope: Scope, trust_forwarded: bool) -> str:
+    if trust_forwarded:
+        forwarded = Headers(scope=scope).get("x-forwarded-for")
+        if forwarded:
+            return forwarded.split(",")[0].strip()
+    client = scope.get("client")
+    return client[0] if client else "unknown"
+
+
+def user_id_from_scope(scope: Scope) -> str | None:
+    authorization = Headers(scope=scope).get("authorization", "")
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    payload = decode_access_token(token)
+    return payload.get("sub") if payload else None
+
+
+class RateLimitMiddleware:
+    """Per-route token-bucket limits keyed by client IP or user id.
+
+    With no `limiter` the buckets live in this process; pass a
+    `LeasedRateLimiter` to share them across workers and nodes. Requests that
+    match no policy are not counted.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        policies: tuple[RateLimitPolicy, ...] | None = None,
+        limiter: LeasedRateLimiter | None = None,
+        trust_forwarded: bool = False,
+    ):
+        self.app = app
+        self.policies = policies if policies is not None else default_policies()
+        self.memory = InMemoryRateLimiter()
+        self.shared = limiter
+        self.trust_forwarded = trust_forwarded
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        policy = self.match(scope["method"], scope["path"])
+        if policy is None:
+            await self.app(scope, receive, send)
+            return
+
+        user_id = user_id_from_scope(scope) if policy.key_by == "user" else None
+        if user_id is not None:
+            key = f"{policy.name}:user:{user_id}"
+        else:
+            key = f"{policy.name}:ip:{client_ip(scope, self.trust_forwarded)}"
+
+        retry_after = await self.hit(key, policy)
+        if retry_after > 0:
+            await self.reject(send, policy, retry_after)
+            return
+        await self.app(scope, receive, send)
+
+    def match(self, method: str, path: str) -> RateLimitPolicy | None:
+        for policy in self.policies:
+            if policy.matches(method, path):
+                return policy
+        return None
+
+    async def hit(self, key: str, policy: RateLimitPolicy) -> float:
+        if self.shared is None:
+            return self.memory.hit(key, policy)
+
+        decision = self.shared.try_local(key)
+        if decision is not None:
+            return decision
+        try:
+            return await anyio.to_thread.run_sync(self.shared.refill, key, policy)
+        except Exception:
+            # Shared store unavailable: degrade to per-process limits
+            logger.exception("Shared rate limit store failed; using in-process buckets")
+            return self.memory.hit(key, policy)
+
+    async def reject(self, send: Send, policy: RateLimitPolicy, retry_after: float) -> None:
+        body = json.dumps({"detail": "Too many requests, please slow down"}).encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 429,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                    (b"retry-after", str(max(1, math.ceil(retry_after))).encode()),
+                    (b"x-ratelimit-limit", str(policy.capacity).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,94 @@
+import gzip
+from pathlib import Path
+from urllib.parse import parse_qsl
+from uuid import UUID
+
+import anyio
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.middleware.compression import parse_accept_encoding
+from app.services.snapshots import JobSnapshotStore
+
+_JOB_PREFIX = "/api/jobs/"
+
+
+class SnapshotMiddleware:
+    """Serve anonymous job listing, job detail and sitemap requests from disk.
+
+    Only requests whose response the snapshot holds exactly are answered:
+    GET/HEAD without an Authorization header for `/api/jobs` with at most
+    `skip` (a multiple of the page size), `limit` (the page size) and
+    `view=full`; `/api/jobs/<id>` of an open job; and `/sitemap.xml`.
+    Anything else, or a missing file, falls through to the app. Files are
+    stored gzipped and sent as-is to clients that accept gzip.
+    """
+
+    def __init__(self, app: ASGIApp, store: JobSnapshotStore, max_age: int = 30):
+        self.app = app
+        self.store = store
+        self.max_age = max_age
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        path = None
+        if scope["type"] == "http" and scope["method"] in ("GET", "HEAD"):
+            headers = Headers(scope=scope)
+            if "authorization" not in headers:
+                path = self.snapshot_for(scope["path"], scope.get("query_string", b""))
+        if path is None:
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            data = await anyio.to_thread.run_sync(path.read_bytes)
+        except FileNotFoundError:
+            await self.app(scope, receive, send)
+            return
+
+        codings = parse_accept_encoding(headers.get("accept-encoding", ""))
+        content_type = "application/xml" if path == self.store.sitemap_path else "application/json"
+        response_headers = [
+            (b"content-type", content_type.encode()),
+            (b"cache-control", f"public, max-age={self.max_age}".encode()),
+            (b"vary", b"Accept-Encoding"),
+        ]
+        if codings.get("gzip", codings.get("*", 0.0)) > 0:
+            response_headers.append((b"content-encoding", b"gzip"))
+        else:
+            data = gzip.decompress(data)
+        response_headers.append((b"content-length", str(len(data)).encode()))
+
+        await send({"type": "http.response.start", "status": 200, "headers": response_headers})
+        body = b"" if scope["method"] == "HEAD" else data
+        await send({"type": "http.response.body", "body": body})
+
+    def snapshot_for(self, path: str, query_string: bytes) -> Path | None:
+        if path == "/sitemap.xml":
+            return self.store.sitemap_path if not query_string else None
+        if path.startswith(_JOB_PREFIX):
+            if query_string:
+                return None
+            try:
+                job_id = UUID(path[len(_JOB_PREFIX) :])
+            except ValueError:
+                return None
+            return self.store.job_path(job_id)
+        if path == "/api/jobs":
+            return self._page_for(query_string.decode("latin-1"))
+        return None
+
+    def _page_for(self, query: str) -> Path | None:
+        params = dict(parse_qsl(query))
+        if len(params) != len(parse_qsl(query)) or set(params) - {"skip", "limit", "view"}:
+            return None
+        if params.get("view", "full") != "full":
+            return None
+        try:
+            skip = int(params.get("skip", "0"))
+            # The API's default page size
+            limit = int(params.get("limit", "20"))
+        except ValueError:
+            return None
+        if limit != self.store.page_size or skip < 0 or skip % limit:
+            return None
+        return self.store.page_path(skip // limit)
@@ -1,6 +1,13 @@
 from app.models.user import User, UserRole
 from app.models.job import Job, JobStatus
 from app.models.application import Application, ApplicationStatus
+from app.models.application_event import ApplicationStatusEvent
+from app.models.archive import ApplicationArchive, JobArchive
+from app.models.ai_task import AITask, AITaskStatus
+from app.models.job_stats import JobApplicationStats
+from app.models.idempotency import IdempotencyKey
+from app.models.analytics import AnalyticsDaily, AnalyticsHourly, AnalyticsRollupState
+from app.models.outbox import OutboxMessage
 
 __all__ = [
     "User",
@@ -9,4 +16,15 @@ __all__ = [
     "JobStatus",
     "Application",
     "ApplicationStatus",
+    "ApplicationStatusEvent",
+    "JobArchive",
+    "ApplicationArchive",
+    "AITask",
+    "AITaskStatus",
+    "JobApplicationStats",
+    "IdempotencyKey",
+    "AnalyticsHourly",
+    "AnalyticsDaily",
+    "AnalyticsRollupState",
+    "OutboxMessage",
 ]
@@ -0,0 +1,44 @@
+import enum
+import uuid
+
+from sqlalchemy import Column, DateTime, Enum, ForeignKey, Integer, String, Text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.sql import func
+
+from app.database import Base
+
+
+class AITaskStatus(str, enum.Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class AITask(Base):
+    """Queued AI generation request, drained by the in-process worker pool."""
+
+    __tablename__ = "ai_tasks"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    user_id = Column(
+        UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+
+    kind = Column(String(50), nullable=False)
+    payload = Column(JSONB, nullable=False)
+
+    status = Column(
+        Enum(AITaskStatus, values_callable=lambda obj: [e.value for e in obj]),
+        default=AITaskStatus.QUEUED,
+        nullable=False,
+    )
+    attempts = Column(Integer, default=0, nullable=False)
+    result = Column(JSONB)
+    error = Column(Text)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    # Not claimed before this time (pushed back when upstream is unavailable)
+    available_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    started_at = Column(DateTime(timezone=True))
+    finished_at = Column(DateTime(timezone=True))
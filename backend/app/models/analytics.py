@@ -0,0 +1,42 @@
+from sqlalchemy import BigInteger, Column, DateTime, Integer, SmallInteger, String
+
+from app.database import Base
+
+
+class _RollupColumns:
+    """One row per (bucket, budget_type, budget_band); measures only ever grow."""
+
+    # Bucket start in UTC
+    bucket = Column(DateTime(timezone=False), primary_key=True)
+    budget_type = Column(String(20), primary_key=True)
+    # Index into app.services.analytics.BUDGET_BAND_EDGES; -1 when no budget was given
+    budget_band = Column(SmallInteger, primary_key=True)
+
+    jobs_posted = Column(Integer, nullable=False, default=0)
+    applications = Column(Integer, nullable=False, default=0)
+    acceptances = Column(Integer, nullable=False, default=0)
+
+    # Sum/count of posted jobs' budgets, for the average
+    budget_total = Column(BigInteger, nullable=False, default=0)
+    budget_count = Column(Integer, nullable=False, default=0)
+
+
+class AnalyticsHourly(_RollupColumns, Base):
+    """Hourly activity rollup, maintained by `app.services.analytics.rollup_analytics`."""
+
+    __tablename__ = "analytics_hourly"
+
+
+class AnalyticsDaily(_RollupColumns, Base):
+    """Daily activity rollup, maintained by `app.services.analytics.rollup_analytics`."""
+
+    __tablename__ = "analytics_daily"
+
+
+class AnalyticsRollupState(Base):
+    """How far the rollups have consumed their source tables."""
+
+    __tablename__ = "analytics_rollup_state"
+
+    name = Column(String(50), primary_key=True)
+    processed_until = Column(DateTime(timezone=True))
@@ -0,0 +1,35 @@
+from sqlalchemy import BigInteger, Column, DateTime, Enum, Identity, Index
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.database import Base
+from app.models.application import ApplicationStatus
+
+_status_enum = Enum(ApplicationStatus, values_callable=lambda obj: [e.value for e in obj])
+
+
+class ApplicationStatusEvent(Base):
+    """Append-only log of application status changes.
+
+    Written in batches by `app.services.status_history`, and directly by bulk
+    status changes (`app.services.job_expiry`); never updated. No foreign
+    keys, so history outlives archived and deleted applications.
+    """
+
+    __tablename__ = "application_status_events"
+    __table_args__ = (
+        Index("ix_application_status_events_application", "application_id", "changed_at"),
+        Index("ix_application_status_events_to_status", "to_status", "changed_at"),
+    )
+
+    id = Column(BigInteger, Identity(), primary_key=True)
+    application_id = Column(UUID(as_uuid=True), nullable=False)
+    job_id = Column(UUID(as_uuid=True), nullable=False)
+    apprentice_id = Column(UUID(as_uuid=True), nullable=False)
+
+    # NULL from_status marks the submission itself
+    from_status = Column(_status_enum)
+    to_status = Column(_status_enum, nullable=False)
+    changed_by = Column(UUID(as_uuid=True))
+
+    # When the change happened (set by the API, not when the batch was flushed)
+    changed_at = Column(DateTime(timezone=True), nullable=False)
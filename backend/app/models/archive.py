@@ -0,0 +1,86 @@
+from sqlalchemy import (
+    Boolean,
+    Column,
+    Date,
+    DateTime,
+    Enum,
+    Float,
+    Integer,
+    String,
+    Text,
+)
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+
+from app.database import Base
+from app.models.application import ApplicationStatus
+from app.models.job import JobStatus
+
+
+class JobArchive(Base):
+    """Completed/cancelled jobs moved out of the hot `jobs` table.
+
+    Mirrors the `jobs` columns so archived rows render through the same schemas.
+    """
+
+    __tablename__ = "jobs_archive"
+
+    id = Column(UUID(as_uuid=True), primary_key=True)
+    sponsor_id = Column(UUID(as_uuid=True), nullable=False, index=True)
+
+    title = Column(String(255), nullable=False)
+    description = Column(Text, nullable=False)
+    requirements = Column(Text)
+
+    budget_min = Column(Integer)
+    budget_max = Column(Integer)
+    budget_type = Column(String(20))
+
+    estimated_hours = Column(Integer)
+    deadline = Column(Date)
+
+    status = Column(Enum(JobStatus, values_callable=lambda obj: [e.value for e in obj]))
+
+    ai_generated_description = Column(Boolean)
+
+    created_at = Column(DateTime(timezone=True))
+    updated_at = Column(DateTime(timezone=True))
+    deleted_at = Column(DateTime(timezone=True))
+    archived_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    # Relationships (no FK constraints on archive tables)
+    sponsor = relationship(
+        "User", primaryjoin="foreign(JobArchive.sponsor_id) == User.id", viewonly=True
+    )
+
+
+class ApplicationArchive(Base):
+    """Applications moved out of `applications` together with their archived job."""
+
+    __tablename__ = "applications_archive"
+
+    id = Column(UUID(as_uuid=True), primary_key=True)
+    job_id = Column(UUID(as_uuid=True), nullable=False, index=True)
+    apprentice_id = Column(UUID(as_uuid=True), nullable=False, index=True)
+
+    cover_letter = Column(Text)
+    proposed_rate = Column(Integer)
+    estimated_completion_days = Column(Integer)
+
+    status = Column(
+        Enum(ApplicationStatus, values_callable=lambda obj: [e.value for e in obj])
+    )
+
+    ai_match_score = Column(Float)
+    ai_generated_cover_letter = Column(Boolean)
+
+    created_at = Column(DateTime(timezone=True))
+    updated_at = Column(DateTime(timezone=True))
+    archived_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    apprentice = relationship(
+        "User",
+        primaryjoin="foreign(ApplicationArchive.apprentice_id) == User.id",
+        viewonly=True,
+    )
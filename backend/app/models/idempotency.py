@@ -0,0 +1,25 @@
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, String
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.sql import func
+
+from app.database import Base
+
+
+class IdempotencyKey(Base):
+    """Stored response for a client-supplied `Idempotency-Key`, scoped per user."""
+
+    __tablename__ = "idempotency_keys"
+
+    user_id = Column(
+        UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    key = Column(String(255), primary_key=True)
+
+    endpoint = Column(String(255), nullable=False)
+    request_hash = Column(String(64), nullable=False)
+
+    status_code = Column(Integer)
+    response_body = Column(JSONB)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
@@ -1,9 +1,20 @@
 import enum
 import uuid
 
-from sqlalchemy import Boolean, Column, Date, DateTime, Enum, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    Boolean,
+    Column,
+    Date,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Integer,
+    String,
+    Text,
+    event,
+)
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Session, relationship, with_loader_criteria
 from sqlalchemy.sql import func
 
 from app.database import Base
@@ -20,7 +31,9 @@ class Job(Base):
     __tablename__ = "jobs"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    sponsor_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    sponsor_id = Column(
+        UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
 
     title = Column(String(255), nullable=False)
     description = Column(Text, nullable=False)
@@ -45,9 +58,33 @@ class Job(Base):
 
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    # Set instead of deleting when JOB_SOFT_DELETE is on; see exclude_deleted_jobs
+    deleted_at = Column(DateTime(timezone=True))
 
     # Relationships
     sponsor = relationship("User", back_populates="jobs_posted")
+    # passive_deletes: the database's ON DELETE CASCADE removes applications in the
+    # same statement instead of the ORM loading and deleting them one by one
     applications = relationship(
-        "Application", back_populates="job", cascade="all, delete-orphan"
+        "Application", back_populates="job", cascade="all, delete-orphan", passive_deletes=True
     )
+
+
+@event.listens_for(Session, "do_orm_execute")
+def exclude_deleted_jobs(execute_state):
+    """Hide soft-deleted jobs from every ORM query.
+
+    Opt out with `.execution_options(include_deleted=True)`. The criteria
+    propagate to relationship loads of the objects a query returns, so
+    `application.job` is None once the job is soft-deleted; ownership checks
+    that must still see the job opt out explicitly.
+    """
+    if (
+        execute_state.is_select
+        and not execute_state.is_column_load
+        and not execute_state.is_relationship_load
+        and not execute_state.execution_options.get("include_deleted", False)
+    ):
+        execute_state.statement = execute_state.statement.options(
+            with_loader_criteria(Job, lambda cls: cls.deleted_at.is_(None), include_aliases=True)
+        )
@@ -0,0 +1,39 @@
+from sqlalchemy import BigInteger, Column, DateTime, ForeignKey, Integer
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.database import Base
+
+
+class JobApplicationStats(Base):
+    """Per-job application aggregates.
+
+    Maintained incrementally by the `applications` trigger installed in
+    migration 006; the application never writes this table directly.
+    """
+
+    __tablename__ = "job_application_stats"
+
+    job_id = Column(
+        UUID(as_uuid=True), ForeignKey("jobs.id", ondelete="CASCADE"), primary_key=True
+    )
+
+    pending_count = Column(Integer, nullable=False, default=0)
+    accepted_count = Column(Integer, nullable=False, default=0)
+    rejected_count = Column(Integer, nullable=False, default=0)
+    withdrawn_count = Column(Integer, nullable=False, default=0)
+
+    # Sum/count of non-null proposed rates, for the average
+    rate_sum = Column(BigInteger, nullable=False, default=0)
+    rate_count = Column(Integer, nullable=False, default=0)
+
+    last_application_at = Column(DateTime(timezone=True))
+
+    @property
+    def total_count(self) -> int:
+        return (
+            self.pending_count + self.accepted_count + self.rejected_count + self.withdrawn_count
+        )
+
+    @property
+    def average_proposed_rate(self) -> float | None:
+        return self.rate_sum / self.rate_count if self.rate_count else None
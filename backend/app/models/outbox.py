@@ -0,0 +1,52 @@
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    DateTime,
+    ForeignKey,
+    Identity,
+    Index,
+    Integer,
+    String,
+    Text,
+)
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.sql import func, text
+
+from app.database import Base
+
+
+class OutboxMessage(Base):
+    """Notification to deliver, written in the same transaction as the change
+    that caused it and drained by `app.services.outbox`.
+
+    Pending while both `sent_at` and `failed_at` are NULL; claimed by a
+    dispatcher while `claimed_until` is in the future.
+    """
+
+    __tablename__ = "outbox_messages"
+    __table_args__ = (
+        Index(
+            "ix_outbox_messages_pending",
+            "available_at",
+            postgresql_where=text("sent_at IS NULL AND failed_at IS NULL"),
+        ),
+    )
+
+    id = Column(BigInteger, Identity(), primary_key=True)
+    recipient_id = Column(
+        UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+
+    kind = Column(String(50), nullable=False)
+    payload = Column(JSONB, nullable=False)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    # Not delivered before this time (pushed back after failed attempts)
+    available_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    attempts = Column(Integer, default=0, nullable=False)
+    last_error = Column(Text)
+    # Lease held by the dispatcher delivering this row; expires if it dies
+    claimed_until = Column(DateTime(timezone=True))
+
+    sent_at = Column(DateTime(timezone=True), index=True)
+    failed_at = Column(DateTime(timezone=True))
@@ -1,9 +1,9 @@
 import enum
 import uuid
 
-from sqlalchemy import Column, DateTime, Enum, String, Text
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Computed, DateTime, Enum, String, Text
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
+from sqlalchemy.orm import deferred, relationship
 from sqlalchemy.sql import func
 
 from app.database import Base
@@ -14,6 +14,12 @@ class UserRole(str, enum.Enum):
     APPRENTICE = "apprentice"
 
 
+SEARCH_VECTOR_EXPRESSION = (
+    "setweight(to_tsvector('english', coalesce(full_name, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(bio, '')), 'B')"
+)
+
+
 class User(Base):
     __tablename__ = "users"
 
@@ -34,11 +40,26 @@ class User(Base):
     github_url = Column(String(500))
     linkedin_url = Column(String(500))
 
+    # Candidate search: name outranks bio. Maintained by Postgres, never loaded
+    # with the row.
+    search_vector = deferred(
+        Column(
+            TSVECTOR,
+            Computed(SEARCH_VECTOR_EXPRESSION, persisted=True),
+        )
+    )
+
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
     # Relationships
-    jobs_posted = relationship("Job", back_populates="sponsor", cascade="all, delete-orphan")
+    # Children are removed by ON DELETE CASCADE, not loaded and deleted row by row
+    jobs_posted = relationship(
+        "Job", back_populates="sponsor", cascade="all, delete-orphan", passive_deletes=True
+    )
     applications = relationship(
-        "Application", back_populates="apprentice", cascade="all, delete-orphan"
+        "Application",
+        back_populates="apprentice",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
@@ -1,15 +1,27 @@
 from app.schemas.user import (
     UserCreate,
+    BulkApprenticeCreate,
+    BulkRegisterRequest,
+    BulkRegisterResult,
+    BulkRegisterResponse,
     UserLogin,
     UserResponse,
     UserUpdate,
     Token,
+    CandidateResult,
+    CandidateSearchResponse,
 )
 from app.schemas.job import (
     JobCreate,
     JobUpdate,
     JobResponse,
     JobListResponse,
+    JobSummary,
+    JobSummaryListResponse,
+    JobFacetCount,
+    JobFacetsResponse,
+    JobDashboardEntry,
+    SponsorDashboardResponse,
 )
 from app.schemas.application import (
     ApplicationCreate,
@@ -18,18 +30,41 @@ from app.schemas.application import (
     ApplicationStatusUpdate,
 )
 
+from app.schemas.analytics import (
+    ActivityPoint,
+    ActivityResponse,
+    BudgetBand,
+    BudgetDistributionResponse,
+)
+
 __all__ = [
     "UserCreate",
+    "BulkApprenticeCreate",
+    "BulkRegisterRequest",
+    "BulkRegisterResult",
+    "BulkRegisterResponse",
     "UserLogin",
     "UserResponse",
     "UserUpdate",
     "Token",
+    "CandidateResult",
+    "CandidateSearchResponse",
     "JobCreate",
     "JobUpdate",
     "JobResponse",
     "JobListResponse",
+    "JobSummary",
+    "JobSummaryListResponse",
+    "JobFacetCount",
+    "JobFacetsResponse",
+    "JobDashboardEntry",
+    "SponsorDashboardResponse",
     "ApplicationCreate",
     "ApplicationUpdate",
     "ApplicationResponse",
     "ApplicationStatusUpdate",
+    "ActivityPoint",
+    "ActivityResponse",
+    "BudgetBand",
+    "BudgetDistributionResponse",
 ]
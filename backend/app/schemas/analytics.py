@@ -0,0 +1,38 @@
+from datetime import datetime
+from typing import Literal
+
+from pydantic import BaseModel
+
+Granularity = Literal["hour", "day"]
+
+
+class ActivityPoint(BaseModel):
+    bucket: datetime
+    jobs_posted: int
+    applications: int
+    acceptances: int
+    average_budget: float | None = None
+
+
+class ActivityResponse(BaseModel):
+    granularity: Granularity
+    start: datetime
+    end: datetime
+    budget_type: str | None = None
+    points: list[ActivityPoint]
+
+
+class BudgetBand(BaseModel):
+    band: int
+    low: int | None = None
+    high: int | None = None
+    jobs_posted: int
+    applications: int
+    acceptances: int
+
+
+class BudgetDistributionResponse(BaseModel):
+    start: datetime
+    end: datetime
+    budget_type: str | None = None
+    bands: list[BudgetBand]
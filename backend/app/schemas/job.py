@@ -47,6 +47,8 @@ class JobResponse(BaseModel):
     created_at: datetime
     application_count: int = 0
     sponsor: UserResponse | None = None
+    # Set on creation when open jobs with near-identical text already exist
+    possible_duplicate_of: list[UUID] = []
 
     class Config:
         from_attributes = True
@@ -55,3 +57,59 @@ class JobResponse(BaseModel):
 class JobListResponse(BaseModel):
     jobs: list[JobResponse]
     total: int
+
+
+class JobSummary(BaseModel):
+    """Compact job card: a description snippet and sponsor name instead of the
+    full description and nested sponsor."""
+
+    id: UUID
+    sponsor_id: UUID
+    sponsor_name: str | None = None
+    title: str
+    snippet: str
+    budget_min: int | None = None
+    budget_max: int | None = None
+    budget_type: str
+    estimated_hours: int | None = None
+    deadline: date | None = None
+    status: JobStatus
+    ai_generated_description: bool
+    created_at: datetime
+    application_count: int = 0
+
+
+class JobSummaryListResponse(BaseModel):
+    jobs: list[JobSummary]
+    total: int
+
+
+class JobFacetCount(BaseModel):
+    value: str
+    count: int
+
+
+class JobFacetsResponse(BaseModel):
+    budget: list[JobFacetCount]
+    budget_type: list[JobFacetCount]
+    deadline: list[JobFacetCount]
+    total: int
+
+
+class JobDashboardEntry(BaseModel):
+    job_id: UUID
+    title: str
+    status: JobStatus
+    created_at: datetime
+    total_applications: int = 0
+    pending_count: int = 0
+    accepted_count: int = 0
+    rejected_count: int = 0
+    withdrawn_count: int = 0
+    average_proposed_rate: float | None = None
+    last_application_at: datetime | None = None
+
+
+class SponsorDashboardResponse(BaseModel):
+    jobs: list[JobDashboardEntry]
+    total: int
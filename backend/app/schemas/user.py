@@ -1,7 +1,8 @@
 from datetime import datetime
+from typing import Any, Literal
 from uuid import UUID
 
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, Field
 
 from app.models.user import UserRole
 
@@ -19,6 +20,38 @@ class UserCreate(BaseModel):
     linkedin_url: str | None = None
 
 
+class BulkApprenticeCreate(BaseModel):
+    """One row of a bulk apprentice registration (role is implied)."""
+
+    email: EmailStr
+    password: str = Field(min_length=1)
+    full_name: str = Field(min_length=1)
+    bio: str | None = None
+    portfolio_url: str | None = None
+    github_url: str | None = None
+    linkedin_url: str | None = None
+
+
+class BulkRegisterRequest(BaseModel):
+    # Validated row by row so one bad row doesn't reject the whole cohort; see
+    # BulkApprenticeCreate for the fields
+    apprentices: list[dict[str, Any]]
+
+
+class BulkRegisterResult(BaseModel):
+    index: int  # position in the input (data rows only for CSV)
+    email: str | None = None
+    status: Literal["created", "error"]
+    user_id: UUID | None = None
+    error: str | None = None
+
+
+class BulkRegisterResponse(BaseModel):
+    created: int
+    failed: int
+    results: list[BulkRegisterResult]
+
+
 class UserLogin(BaseModel):
     email: EmailStr
     password: str
@@ -54,3 +87,22 @@ class UserResponse(BaseModel):
 class Token(BaseModel):
     access_token: str
     token_type: str = "bearer"
+
+
+class CandidateResult(BaseModel):
+    """Public apprentice profile as shown in sponsor candidate search (no email)."""
+
+    id: UUID
+    full_name: str
+    bio_snippet: str
+    portfolio_url: str | None = None
+    github_url: str | None = None
+    linkedin_url: str | None = None
+    created_at: datetime
+    rank: float
+
+
+class CandidateSearchResponse(BaseModel):
+    candidates: list[CandidateResult]
+    # Pass back as `cursor` for the next page; null on the last page
+    next_cursor: str | None = None
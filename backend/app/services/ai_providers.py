@@ -0,0 +1,159 @@
+import json
+import re
+import time
+from dataclasses import dataclass, replace
+from typing import Protocol
+
+from app.config import settings
+
+# Task names routed by AIService.run_task
+TASK_JOB_DESCRIPTION = "job_description"
+TASK_COVER_LETTER = "cover_letter"
+TASK_MATCH_JOBS = "match_jobs"
+
+
+class Provider(Protocol):
+    """Something that can answer a chat completion.
+
+    Implement this to plug in an offline CPU model; register it with
+    `ai_service.register_provider(name, provider)` and route tasks to it via
+    AI_TASK_MODELS or AI_PROVIDER.
+    """
+
+    async def complete(
+        self, task: str, model: str, messages: list, max_tokens: int, timeout: float
+    ) -> str: ...
+
+
+@dataclass(frozen=True)
+class ModelRoute:
+    provider: str
+    model: str
+
+    @classmethod
+    def parse(cls, spec: str) -> "ModelRoute":
+        """Parse "provider:model"; a bare model name means OpenRouter."""
+        provider, sep, model = spec.partition(":")
+        if not sep:
+            return cls("openrouter", spec)
+        return cls(provider, model)
+
+    def __str__(self) -> str:
+        return f"{self.provider}:{self.model}"
+
+
+@dataclass(frozen=True)
+class TaskPolicy:
+    """Routes are tried in order. Every route but the last gets `slo_seconds`
+    before the next one is tried; the last gets the full `timeout`."""
+
+    routes: tuple[ModelRoute, ...]
+    max_tokens: int
+    timeout: float
+    slo_seconds: float
+
+
+_HAIKU = ModelRoute("openrouter", "anthropic/claude-3-haiku-20240307")
+_GPT_MINI = ModelRoute("openrouter", "openai/gpt-4o-mini")
+
+# Every task starts on the small, fast model and falls back to a comparable one
+# from another vendor, so one upstream's slowdown doesn't stall it. Output caps
+# follow what each prompt asks for (match_jobs chunks pass their own, smaller cap).
+DEFAULT_TASK_POLICIES = {
+    TASK_MATCH_JOBS: TaskPolicy(
+        routes=(_HAIKU, _GPT_MINI),
+        max_tokens=1000,
+        timeout=settings.AI_REQUEST_TIMEOUT_SECONDS,
+        slo_seconds=10.0,
+    ),
+    TASK_JOB_DESCRIPTION: TaskPolicy(
+        routes=(_HAIKU, _GPT_MINI),
+        max_tokens=900,
+        timeout=settings.AI_REQUEST_TIMEOUT_SECONDS,
+        slo_seconds=12.0,
+    ),
+    TASK_COVER_LETTER: TaskPolicy(
+        routes=(_HAIKU, _GPT_MINI),
+        max_tokens=700,
+        timeout=settings.AI_REQUEST_TIMEOUT_SECONDS,
+        slo_seconds=12.0,
+    ),
+}
+
+
+def task_policies() -> dict[str, TaskPolicy]:
+    """Default policies with AI_TASK_MODELS / AI_PROVIDER overrides applied."""
+    policies = dict(DEFAULT_TASK_POLICIES)
+    for task, specs in settings.AI_TASK_MODELS.items():
+        if task in policies and specs:
+            routes = tuple(ModelRoute.parse(spec) for spec in specs)
+            policies[task] = replace(policies[task], routes=routes)
+    if settings.AI_PROVIDER:
+        # Send every task to one provider (e.g. "stub" for tests and benchmarks)
+        policies = {
+            task: replace(
+                policy, routes=(ModelRoute(settings.AI_PROVIDER, policy.routes[0].model),)
+            )
+            for task, policy in policies.items()
+        }
+    return policies
+
+
+class RouteHealth:
+    """Routes that recently breached their SLO or failed are skipped for a while."""
+
+    def __init__(self, cooldown_seconds: float):
+        self.cooldown_seconds = cooldown_seconds
+        self._degraded_until: dict[ModelRoute, float] = {}
+
+    def available(self, route: ModelRoute) -> bool:
+        return self._degraded_until.get(route, 0.0) <= time.monotonic()
+
+    def mark_degraded(self, route: ModelRoute) -> None:
+        self._degraded_until[route] = time.monotonic() + self.cooldown_seconds
+
+
+_WORD = re.compile(r"[a-z0-9]+")
+_JOB_LINE = re.compile(r"^- Job ID (\S+): (.*)$", re.MULTILINE)
+_PROFILE_LINE = re.compile(r"^Apprentice profile: (.*)$", re.MULTILINE)
+
+
+class StubProvider:
+    """Deterministic offline provider for tests, benchmarks and local development.
+
+    Answers instantly in the shape each task expects; job matching scores word
+    overlap between the profile and each job, so rankings are still meaningful.
+    """
+
+    async def complete(
+        self, task: str, model: str, messages: list, max_tokens: int, timeout: float
+    ) -> str:
+        prompt = messages[-1]["content"]
+        if task == TASK_MATCH_JOBS:
+            return json.dumps(self._score_jobs(prompt))
+        if task == TASK_JOB_DESCRIPTION:
+            brief = prompt.split('"')[1] if prompt.count('"') >= 2 else prompt[:200]
+            return json.dumps(
+                {
+                    "title": brief[:60],
+                    "description": f"We are looking for help with: {brief}",
+                    "requirements": "- Relevant automation experience",
+                }
+            )
+        return "Hello,\n\nI would love to help with this project.\n\nBest regards"
+
+    def _score_jobs(self, prompt: str) -> list[dict]:
+        profile = _PROFILE_LINE.search(prompt)
+        profile_words = set(_WORD.findall(profile.group(1).lower())) if profile else set()
+        scores = []
+        for job_id, text in _JOB_LINE.findall(prompt):
+            job_words = set(_WORD.findall(text.lower()))
+            overlap = len(profile_words & job_words) / max(1, len(job_words))
+            scores.append(
+                {
+                    "job_id": job_id,
+                    "score": round(min(1.0, 0.3 + 2 * overlap), 2),
+                    "reason": "Keyword overlap with profile",
+                }
+            )
+        return scores
@@ -0,0 +1,223 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+
+from sqlalchemy import delete, or_, select, update
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models.ai_task import AITask, AITaskStatus
+from app.services.ai_service import AIServiceUnavailable, ai_service
+
+logger = logging.getLogger(__name__)
+
+TaskHandler = Callable[[dict], Awaitable[dict | list]]
+
+
+async def _generate_description(payload: dict) -> dict:
+    return await ai_service.generate_job_description(
+        payload["brief"], payload.get("requirements")
+    )
+
+
+async def _generate_cover_letter(payload: dict) -> dict:
+    cover_letter = await ai_service.generate_cover_letter(
+        job_title=payload["job_title"],
+        job_description=payload["job_description"],
+        apprentice_name=payload["apprentice_name"],
+        apprentice_bio=payload.get("apprentice_bio"),
+    )
+    return {"cover_letter": cover_letter}
+
+
+async def _match_jobs(payload: dict) -> list:
+    return await ai_service.match_jobs_for_apprentice(
+        apprentice_bio=payload.get("apprentice_bio"),
+        jobs=payload["jobs"],
+    )
+
+
+# Task kind -> coroutine producing a JSON-serializable result. Payloads carry
+# everything the handler needs so no DB session is held during the LLM call.
+HANDLERS: dict[str, TaskHandler] = {
+    "generate_description": _generate_description,
+    "generate_cover_letter": _generate_cover_letter,
+    "match_jobs": _match_jobs,
+}
+
+
+def enqueue(db: Session, user_id: UUID, kind: str, payload: dict) -> AITask:
+    """Persist a task and wake up local workers."""
+    if kind not in HANDLERS:
+        raise ValueError(f"Unknown AI task kind: {kind}")
+    task = AITask(user_id=user_id, kind=kind, payload=payload)
+    db.add(task)
+    db.commit()
+    db.refresh(task)
+    ai_worker_pool.notify()
+    return task
+
+
+def retry_delay(attempts: int) -> timedelta:
+    """Backoff before a task re-queued after `attempts` tries: 5s, 10s, 20s, ... up to 5 min."""
+    return timedelta(seconds=min(300, 5 * 2 ** (attempts - 1)))
+
+
+def claim_next(db: Session) -> AITask | None:
+    """Atomically mark the oldest runnable task as running and return it.
+
+    Re-queued tasks wait until their `available_at`. Tasks left running past
+    the stale timeout (a worker died) are reclaimed.
+    """
+    now = datetime.now(timezone.utc)
+    stale_before = now - timedelta(seconds=settings.AI_TASK_STALE_SECONDS)
+    candidate = (
+        select(AITask.id)
+        .where(
+            or_(
+                (AITask.status == AITaskStatus.QUEUED) & (AITask.available_at <= now),
+                (AITask.status == AITaskStatus.RUNNING) & (AITask.started_at < stale_before),
+            )
+        )
+        .order_by(AITask.created_at)
+        .limit(1)
+        .with_for_update(skip_locked=True)
+        .scalar_subquery()
+    )
+    task = db.execute(
+        update(AITask)
+        .where(AITask.id == candidate)
+        .values(
+            status=AITaskStatus.RUNNING,
+            started_at=now,
+            attempts=AITask.attempts + 1,
+        )
+        .returning(AITask)
+    ).scalar_one_or_none()
+    db.commit()
+    return task
+
+
+def _finish(task_id: UUID, **values) -> None:
+    with SessionLocal() as db:
+        db.execute(update(AITask).where(AITask.id == task_id).values(**values))
+        db.commit()
+
+
+def _claim() -> tuple[UUID, str, dict, int] | None:
+    with SessionLocal() as db:
+        task = claim_next(db)
+        if task is None:
+            return None
+        return task.id, task.kind, task.payload, task.attempts
+
+
+def purge_finished_tasks(db: Session) -> None:
+    """Scheduled task: drop finished tasks past the retention window."""
+    cutoff = datetime.now(timezone.utc) - timedelta(hours=settings.AI_TASK_RETENTION_HOURS)
+    db.execute(
+        delete(AITask).where(
+            AITask.status.in_([AITaskStatus.SUCCEEDED, AITaskStatus.FAILED]),
+            AITask.finished_at < cutoff,
+        )
+    )
+    db.commit()
+
+
+class AIWorkerPool:
+    """Fixed number of async workers draining the `ai_tasks` table."""
+
+    def __init__(self):
+        self._workers: list[asyncio.Task] = []
+        self._wakeup: asyncio.Event | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def start(self, concurrency: int) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        for _ in range(concurrency):
+            self._workers.append(asyncio.create_task(self._work()))
+
+    async def stop(self) -> None:
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers.clear()
+
+    def notify(self) -> None:
+        """Wake idle workers early (tasks enqueued by other processes are found by polling)."""
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    async def _work(self) -> None:
+        while True:
+            try:
+                claimed = await asyncio.to_thread(_claim)
+            except Exception:
+                logger.exception("Failed to claim AI task")
+                claimed = None
+
+            if claimed is None:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(
+                        self._wakeup.wait(), timeout=settings.AI_TASK_POLL_INTERVAL_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            await self._run(*claimed)
+
+    async def _run(self, task_id: UUID, kind: str, payload: dict, attempts: int) -> None:
+        try:
+            result = await HANDLERS[kind](payload)
+        except asyncio.CancelledError:
+            # Shutting down: hand the task back so another worker picks it up.
+            # Shielded so the write finishes even if cancelled again
+            await asyncio.shield(asyncio.to_thread(_finish, task_id, status=AITaskStatus.QUEUED))
+            raise
+        except AIServiceUnavailable as e:
+            # Upstream is degraded: put the task back, after a growing delay so a
+            # failing breaker doesn't burn its attempts at once, unless it has used them
+            if attempts < settings.AI_TASK_MAX_ATTEMPTS:
+                await asyncio.to_thread(
+                    _finish,
+                    task_id,
+                    status=AITaskStatus.QUEUED,
+                    available_at=datetime.now(timezone.utc) + retry_delay(attempts),
+                )
+            else:
+                await asyncio.to_thread(
+                    _finish,
+                    task_id,
+                    status=AITaskStatus.FAILED,
+                    error=str(e),
+                    finished_at=datetime.now(timezone.utc),
+                )
+            return
+        except Exception as e:
+            logger.exception("AI task %s failed", task_id)
+            await asyncio.to_thread(
+                _finish,
+                task_id,
+                status=AITaskStatus.FAILED,
+                error=str(e),
+                finished_at=datetime.now(timezone.utc),
+            )
+            return
+
+        await asyncio.to_thread(
+            _finish,
+            task_id,
+            status=AITaskStatus.SUCCEEDED,
+            result=result,
+            finished_at=datetime.now(timezone.utc),
+        )
+
+
+# Singleton instance
+ai_worker_pool = AIWorkerPool()
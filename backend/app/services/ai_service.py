@@ -1,37 +1,314 @@
+import asyncio
+import heapq
 import json
+import logging
+from typing import TYPE_CHECKING
 
-import httpx
+from pydantic import BaseModel, Field, ValidationError
 
 from app.config import settings
+from app.services.ai_providers import (
+    TASK_COVER_LETTER,
+    TASK_JOB_DESCRIPTION,
+    TASK_MATCH_JOBS,
+    Provider,
+    RouteHealth,
+    StubProvider,
+    task_policies,
+)
+from app.utils.resilience import (
+    CircuitBreaker,
+    CircuitBreakerOpen,
+    KeyedTokenBuckets,
+    backoff_delay,
+    parse_retry_after,
+)
+from app.utils.tokens import MESSAGE_OVERHEAD_TOKENS, estimate_tokens, truncate_to_tokens
+
+if TYPE_CHECKING:
+    # Imported on first use instead: most processes (and many workers) never call the AI
+    import httpx
+
+logger = logging.getLogger(__name__)
+
+# Upstream responses worth retrying (rate limited or transient server errors)
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+# Job matching: replies below this score are dropped, and each scored job
+# costs roughly this many output tokens ({"job_id", "score", "reason"})
+MIN_MATCH_SCORE = 0.5
+MATCH_OUTPUT_TOKENS_PER_JOB = 60
+
+
+class AIServiceUnavailable(ValueError):
+    """The LLM backend is degraded or saturated (surfaced as 503 by the API)."""
+
+
+class JobScore(BaseModel):
+    job_id: str
+    score: float = Field(ge=0.0, le=1.0)
+    reason: str = ""
+
+
+def _strip_code_fence(result: str) -> str:
+    """Extract the payload if the model wrapped it in a markdown code block."""
+    if "```json" in result:
+        result = result.split("```json")[1].split("```")[0]
+    elif "```" in result:
+        result = result.split("```")[1].split("```")[0]
+    return result.strip()
+
+
+def _match_job_line(job: dict) -> str:
+    description = truncate_to_tokens(
+        " ".join(job["description"].split()), settings.AI_MATCH_DESCRIPTION_TOKENS
+    )
+    return f"- Job ID {job['id']}: {job['title']} - {description}"
+
+
+def _match_prompt(bio_text: str, jobs_text: str) -> str:
+    return f"""You are a job matching assistant for an AI automation platform.
+
+Apprentice profile: {bio_text}
+
+Available jobs:
+{jobs_text}
+
+For each job, provide a match score (0.0 to 1.0) based on how well the apprentice's background matches the job requirements.
+
+Return only a JSON array, one object per job, using the exact job IDs given:
+[{{"job_id": "...", "score": 0.85, "reason": "Brief explanation"}}]"""
+
+
+def _parse_job_scores(result: str, job_ids: set[str]) -> list[JobScore]:
+    """Validate a scoring reply, keeping only well-formed entries for known jobs."""
+    try:
+        data = json.loads(_strip_code_fence(result))
+    except json.JSONDecodeError:
+        logger.warning("Job match reply was not valid JSON")
+        return []
+    if isinstance(data, dict):
+        data = data.get("matches") or data.get("jobs") or []
+    if not isinstance(data, list):
+        return []
+
+    scores = []
+    for item in data:
+        try:
+            score = JobScore.model_validate(item)
+        except ValidationError:
+            continue
+        if score.job_id in job_ids:
+            scores.append(score)
+    return scores
 
 
 class AIService:
-    def __init__(self):
+    def __init__(self, transport: "httpx.AsyncBaseTransport | None" = None):
         self.api_key = settings.OPENROUTER_API_KEY
         self.base_url = "https://openrouter.ai/api/v1"
-        self.model = "anthropic/claude-3-haiku-20240307"
 
-    async def _call_llm(self, messages: list, max_tokens: int = 1000) -> str:
+        # Per-task model routing; see app.services.ai_providers
+        self.policies = task_policies()
+        self.providers: dict[str, Provider] = {
+            "openrouter": _OpenRouterProvider(self),
+            "stub": StubProvider(),
+        }
+        self.route_health = RouteHealth(settings.AI_ROUTE_COOLDOWN_SECONDS)
+
+        # `transport` lets a local stub (e.g. a fault-injecting httpx.MockTransport)
+        # stand in for OpenRouter
+        self._transport = transport
+        self._client: "httpx.AsyncClient | None" = None
+        self._semaphore = asyncio.Semaphore(settings.AI_MAX_CONCURRENCY)
+        # One breaker per model, so an outage of one doesn't fail its fallback too
+        self.breakers: dict[str, CircuitBreaker] = {}
+        self.user_quota = KeyedTokenBuckets(
+            capacity=settings.AI_USER_QUOTA_BURST,
+            rate=settings.AI_USER_QUOTA_PER_MINUTE / 60,
+        )
+
+    def breaker_for(self, model: str) -> CircuitBreaker:
+        breaker = self.breakers.get(model)
+        if breaker is None:
+            breaker = self.breakers[model] = CircuitBreaker(
+                failure_threshold=settings.AI_BREAKER_FAILURE_THRESHOLD,
+                reset_timeout=settings.AI_BREAKER_RESET_SECONDS,
+            )
+        return breaker
+
+    def _get_client(self) -> "httpx.AsyncClient":
+        """Shared HTTP client so connections to OpenRouter are reused."""
+        import httpx
+
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=settings.AI_REQUEST_TIMEOUT_SECONDS,
+                limits=httpx.Limits(max_connections=settings.AI_MAX_CONCURRENCY),
+                transport=self._transport,
+            )
+        return self._client
+
+    async def warmup(self) -> None:
+        """Open a connection to OpenRouter ahead of the first AI request.
+
+        Without an API key this does nothing, so httpx stays unimported. With
+        one, paying the import and TLS handshake at boot instead of on a user's
+        first AI request is the point of warming up.
+        """
+        if not self.api_key:
+            return
+        import httpx
+
+        client = self._get_client()
+        try:
+            await client.get(
+                "/models", headers={"Authorization": f"Bearer {self.api_key}"}, timeout=5.0
+            )
+        except httpx.HTTPError as e:
+            logger.warning("OpenRouter warmup failed: %s", e)
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def register_provider(self, name: str, provider: Provider) -> None:
+        """Add a provider (e.g. an offline CPU model) that routes can name."""
+        self.providers[name] = provider
+
+    async def run_task(self, task: str, messages: list, max_tokens: int | None = None) -> str:
+        """Complete `messages` with the task's routes, falling back in order.
+
+        A route that fails or misses the task's latency SLO is skipped for
+        AI_ROUTE_COOLDOWN_SECONDS so later requests go straight to the fallback.
+        """
+        policy = self.policies[task]
+        max_tokens = max_tokens or policy.max_tokens
+        routes = [r for r in policy.routes if self.route_health.available(r)]
+        routes = routes or list(policy.routes)
+
+        last_error: Exception | None = None
+        for position, route in enumerate(routes):
+            provider = self.providers.get(route.provider)
+            if provider is None:
+                raise ValueError(f"Unknown AI provider: {route.provider}")
+            is_last = position == len(routes) - 1
+            try:
+                return await asyncio.wait_for(
+                    provider.complete(task, route.model, messages, max_tokens, policy.timeout),
+                    timeout=policy.timeout if is_last else policy.slo_seconds,
+                )
+            except (asyncio.TimeoutError, AIServiceUnavailable) as e:
+                last_error = e
+                if not is_last:
+                    self.route_health.mark_degraded(route)
+                    logger.warning("AI route %s failed or breached SLO for %s", route, task)
+
+        if isinstance(last_error, AIServiceUnavailable):
+            raise last_error
+        raise AIServiceUnavailable("AI service timed out, please retry shortly") from last_error
+
+    async def _call_llm(
+        self, messages: list, max_tokens: int, model: str, timeout: float | None = None
+    ) -> str:
         """Make a request to OpenRouter API."""
         if not self.api_key:
             raise ValueError("OpenRouter API key not configured")
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "model": self.model,
-                    "messages": messages,
-                    "max_tokens": max_tokens,
-                },
-                timeout=30.0,
+        # Fail fast without queueing while the breaker is open
+        breaker = self.breaker_for(model)
+        if breaker.state == CircuitBreaker.OPEN:
+            raise AIServiceUnavailable("AI service is temporarily unavailable")
+
+        try:
+            await asyncio.wait_for(
+                self._semaphore.acquire(), timeout=settings.AI_QUEUE_TIMEOUT_SECONDS
+            )
+        except asyncio.TimeoutError:
+            raise AIServiceUnavailable("AI service is busy, please retry shortly")
+
+        try:
+            try:
+                breaker.before_call()
+            except CircuitBreakerOpen:
+                raise AIServiceUnavailable("AI service is temporarily unavailable")
+
+            # Every exit must settle the call, or a half-open breaker stays
+            # waiting on a trial that never reports back
+            try:
+                response = await self._post_with_retries(messages, max_tokens, model, timeout)
+                # Non-retryable errors, e.g. a retired model id, fail this route
+                # so run_task falls back to the next one
+                if response.is_error:
+                    raise AIServiceUnavailable(
+                        f"AI model {model} returned {response.status_code}"
+                    ) from _status_error(response)
+            except asyncio.CancelledError:
+                breaker.release()
+                raise
+            except BaseException:
+                breaker.record_failure()
+                raise
+            breaker.record_success()
+        finally:
+            self._semaphore.release()
+
+        return response.json()["choices"][0]["message"]["content"]
+
+    async def _post_with_retries(
+        self, messages: list, max_tokens: int, model: str, timeout: float | None
+    ) -> "httpx.Response":
+        """POST the completion, retrying transient failures with jittered backoff.
+
+        Returns the first non-retryable response; raises AIServiceUnavailable once
+        retries are exhausted.
+        """
+        import httpx
+
+        client = self._get_client()
+        last_error: Exception | None = None
+        for attempt in range(settings.AI_MAX_RETRIES + 1):
+            retry_after = None
+            try:
+                response = await client.post(
+                    "/chat/completions",
+                    headers={
+                        "Authorization": f"Bearer {self.api_key}",
+                        "Content-Type": "application/json",
+                    },
+                    json={
+                        "model": model,
+                        "messages": messages,
+                        "max_tokens": max_tokens,
+                    },
+                    timeout=timeout or settings.AI_REQUEST_TIMEOUT_SECONDS,
+                )
+            except httpx.TransportError as e:
+                last_error = e
+            else:
+                if response.status_code not in RETRYABLE_STATUS_CODES:
+                    return response
+                last_error = _status_error(response)
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+
+            if attempt == settings.AI_MAX_RETRIES:
+                break
+            delay = (
+                retry_after
+                if retry_after is not None
+                else backoff_delay(
+                    attempt, settings.AI_RETRY_BASE_DELAY, settings.AI_RETRY_MAX_DELAY
+                )
             )
-            response.raise_for_status()
-            return response.json()["choices"][0]["message"]["content"]
+            # Don't hold the request for longer than the upstream asks us to back off
+            if delay > settings.AI_RETRY_MAX_DELAY:
+                break
+            await asyncio.sleep(delay)
+
+        raise AIServiceUnavailable("AI service is temporarily unavailable") from last_error
 
     async def generate_job_description(
         self, brief: str, requirements: list[str] | None = None
@@ -59,16 +336,11 @@ Return your response as JSON with these fields:
 Keep the tone professional but approachable. Focus on automation/AI tasks."""
 
         messages = [{"role": "user", "content": prompt}]
-        result = await self._call_llm(messages)
+        result = await self.run_task(TASK_JOB_DESCRIPTION, messages)
 
         # Parse JSON from response
         try:
-            # Try to extract JSON if wrapped in markdown code blocks
-            if "```json" in result:
-                result = result.split("```json")[1].split("```")[0]
-            elif "```" in result:
-                result = result.split("```")[1].split("```")[0]
-            return json.loads(result.strip())
+            return json.loads(_strip_code_fence(result))
         except json.JSONDecodeError:
             # Fallback: return as-is in description
             return {
@@ -104,47 +376,112 @@ Write a cover letter that:
 Keep it professional but personable. Don't be overly formal or use cliches."""
 
         messages = [{"role": "user", "content": prompt}]
-        return await self._call_llm(messages)
+        return await self.run_task(TASK_COVER_LETTER, messages)
 
     async def match_jobs_for_apprentice(
         self,
         apprentice_bio: str | None,
         jobs: list[dict],
+        top_k: int | None = None,
     ) -> list[dict]:
-        """Score and rank jobs for an apprentice based on their profile."""
+        """Score and rank jobs for an apprentice based on their profile.
+
+        Jobs are split into token-budgeted chunks scored concurrently, and the
+        validated scores are merged into a global top-k.
+        """
         if not jobs:
             return []
 
         bio_text = apprentice_bio if apprentice_bio else "No bio available"
-        jobs_text = "\n".join(
-            [f"- Job ID {j['id']}: {j['title']} - {j['description'][:200]}..." for j in jobs]
+        bio_text = truncate_to_tokens(bio_text, settings.AI_MATCH_BIO_TOKENS)
+        chunks = self._chunk_jobs_for_matching(bio_text, jobs)
+
+        parallelism = asyncio.Semaphore(settings.AI_MATCH_PARALLELISM)
+
+        async def score(chunk: list[tuple[str, str]]) -> list[JobScore]:
+            async with parallelism:
+                return await self._score_job_chunk(bio_text, chunk)
+
+        results = await asyncio.gather(*(score(c) for c in chunks), return_exceptions=True)
+
+        scores: dict[str, JobScore] = {}
+        failures = [r for r in results if isinstance(r, BaseException)]
+        if failures and len(failures) == len(results):
+            raise failures[0]
+        for chunk_scores in results:
+            if isinstance(chunk_scores, BaseException):
+                logger.warning("Job match chunk failed: %s", chunk_scores)
+                continue
+            for item in chunk_scores:
+                scores[item.job_id] = item
+
+        ranked = heapq.nlargest(
+            top_k or settings.AI_MATCH_TOP_K,
+            (s for s in scores.values() if s.score >= MIN_MATCH_SCORE),
+            key=lambda s: s.score,
         )
+        return [s.model_dump() for s in ranked]
+
+    def _chunk_jobs_for_matching(
+        self, bio_text: str, jobs: list[dict]
+    ) -> list[list[tuple[str, str]]]:
+        """Greedily pack (job_id, prompt line) pairs into chunks whose prompt and
+        expected reply fit the token budget."""
+        budget = min(
+            settings.AI_MATCH_CHUNK_TOKENS,
+            settings.AI_MODEL_CONTEXT_TOKENS - settings.AI_MATCH_MAX_OUTPUT_TOKENS,
+        )
+        max_jobs = max(1, (settings.AI_MATCH_MAX_OUTPUT_TOKENS - 50) // MATCH_OUTPUT_TOKENS_PER_JOB)
+        base_tokens = estimate_tokens(_match_prompt(bio_text, "")) + MESSAGE_OVERHEAD_TOKENS
+
+        chunks: list[list[tuple[str, str]]] = []
+        current: list[tuple[str, str]] = []
+        used = base_tokens
+        for job in jobs:
+            line = _match_job_line(job)
+            cost = estimate_tokens(line) + 1
+            if current and (used + cost > budget or len(current) >= max_jobs):
+                chunks.append(current)
+                current, used = [], base_tokens
+            current.append((str(job["id"]), line))
+            used += cost
+        if current:
+            chunks.append(current)
+        return chunks
+
+    async def _score_job_chunk(
+        self, bio_text: str, chunk: list[tuple[str, str]]
+    ) -> list[JobScore]:
+        jobs_text = "\n".join(line for _, line in chunk)
+        messages = [{"role": "user", "content": _match_prompt(bio_text, jobs_text)}]
+        max_tokens = min(
+            settings.AI_MATCH_MAX_OUTPUT_TOKENS,
+            len(chunk) * MATCH_OUTPUT_TOKENS_PER_JOB + 50,
+        )
+        result = await self.run_task(TASK_MATCH_JOBS, messages, max_tokens=max_tokens)
+        return _parse_job_scores(result, {job_id for job_id, _ in chunk})
 
-        prompt = f"""You are a job matching assistant for an AI automation platform.
-
-Apprentice profile: {bio_text}
 
-Available jobs:
-{jobs_text}
+def _status_error(response: "httpx.Response") -> "httpx.HTTPStatusError":
+    import httpx
 
-For each job, provide a match score (0.0 to 1.0) based on how well the apprentice's background matches the job requirements.
+    return httpx.HTTPStatusError(
+        f"OpenRouter returned {response.status_code}",
+        request=response.request,
+        response=response,
+    )
 
-Return JSON array:
-[{{"job_id": "...", "score": 0.85, "reason": "Brief explanation"}}]
 
-Only include jobs with score >= 0.5. Sort by score descending."""
+class _OpenRouterProvider:
+    """Routes to OpenRouter through the service's shared client, retries and breaker."""
 
-        messages = [{"role": "user", "content": prompt}]
-        result = await self._call_llm(messages)
+    def __init__(self, service: AIService):
+        self.service = service
 
-        try:
-            if "```json" in result:
-                result = result.split("```json")[1].split("```")[0]
-            elif "```" in result:
-                result = result.split("```")[1].split("```")[0]
-            return json.loads(result.strip())
-        except json.JSONDecodeError:
-            return []
+    async def complete(
+        self, task: str, model: str, messages: list, max_tokens: int, timeout: float
+    ) -> str:
+        return await self.service._call_llm(messages, max_tokens, model, timeout)
 
 
 # Singleton instance
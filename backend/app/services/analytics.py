@@ -0,0 +1,136 @@
+import logging
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Upper-exclusive budget band edges: band 0 is below the first edge, band
+# len(edges) is at or above the last. Jobs without a budget get band -1.
+BUDGET_BAND_EDGES = (100, 250, 500, 1000, 2500, 5000, 10000)
+
+ROLLUP_TABLES = {"hour": "analytics_hourly", "day": "analytics_daily"}
+
+_EDGES = "ARRAY[" + ", ".join(str(edge) for edge in BUDGET_BAND_EDGES) + "]"
+
+# Budget of a job row aliased `j`: the top of the range when given
+_BUDGET = "coalesce(j.budget_max, j.budget_min)"
+
+# Each source yields (at, budget_type, budget) facts in the window
+# (:since, :until] plus the measures it contributes. Archived rows only
+# matter for the first run, which backfills all history.
+_SOURCES = {
+    "jobs": (
+        f"""
+        SELECT j.created_at AS at, j.budget_type, {_BUDGET} AS budget FROM jobs j
+        WHERE j.created_at > :since AND j.created_at <= :until
+        UNION ALL
+        SELECT j.created_at, j.budget_type, {_BUDGET} FROM jobs_archive j
+        WHERE j.created_at > :since AND j.created_at <= :until
+        """,
+        {
+            "jobs_posted": "count(*)",
+            "budget_total": "coalesce(sum(budget), 0)",
+            "budget_count": "count(budget)",
+        },
+    ),
+    "applications": (
+        f"""
+        SELECT a.created_at AS at, coalesce(j.budget_type, ja.budget_type) AS budget_type,
+               coalesce({_BUDGET}, ja.budget_max, ja.budget_min) AS budget
+        FROM (
+            SELECT job_id, created_at FROM applications
+            WHERE created_at > :since AND created_at <= :until
+            UNION ALL
+            SELECT job_id, created_at FROM applications_archive
+            WHERE created_at > :since AND created_at <= :until
+        ) a
+        LEFT JOIN jobs j ON j.id = a.job_id
+        LEFT JOIN jobs_archive ja ON ja.id = a.job_id
+        """,
+        {"applications": "count(*)"},
+    ),
+    "acceptances": (
+        f"""
+        SELECT e.changed_at AS at, coalesce(j.budget_type, ja.budget_type) AS budget_type,
+               coalesce({_BUDGET}, ja.budget_max, ja.budget_min) AS budget
+        FROM application_status_events e
+        LEFT JOIN jobs j ON j.id = e.job_id
+        LEFT JOIN jobs_archive ja ON ja.id = e.job_id
+        WHERE e.to_status = 'accepted' AND e.changed_at > :since AND e.changed_at <= :until
+        """,
+        {"acceptances": "count(*)"},
+    ),
+}
+
+
+def _upsert(unit: str, facts: str, measures: dict[str, str]):
+    columns = ", ".join(measures)
+    aggregates = ", ".join(measures.values())
+    updates = ", ".join(f"{column} = t.{column} + excluded.{column}" for column in measures)
+    return text(
+        f"""
+        INSERT INTO {ROLLUP_TABLES[unit]} AS t (bucket, budget_type, budget_band, {columns})
+        SELECT date_trunc('{unit}', at AT TIME ZONE 'UTC'),
+               coalesce(budget_type, 'unknown'),
+               coalesce(width_bucket(budget, {_EDGES}), -1),
+               {aggregates}
+        FROM ({facts}) AS facts
+        GROUP BY 1, 2, 3
+        ON CONFLICT (bucket, budget_type, budget_band) DO UPDATE SET {updates}
+        """
+    )
+
+
+_UPSERTS = [
+    _upsert(unit, facts, measures)
+    for facts, measures in _SOURCES.values()
+    for unit in ROLLUP_TABLES
+]
+
+_LOCK_STATE = text(
+    "SELECT processed_until FROM analytics_rollup_state WHERE name = 'activity' FOR UPDATE"
+)
+_SAVE_STATE = text(
+    "UPDATE analytics_rollup_state SET processed_until = :until WHERE name = 'activity'"
+)
+
+
+def rollup_window(db: Session) -> tuple[datetime | None, datetime] | None:
+    """Fold everything created since the last run into the rollups, in one transaction.
+
+    Stops `ANALYTICS_ROLLUP_LAG_SECONDS` short of now so rows from transactions
+    still in flight (and status events still in the write-behind buffer) are
+    picked up by a later run instead of being skipped.
+    """
+    since = db.execute(_LOCK_STATE).scalar_one()
+    until = datetime.now(timezone.utc) - timedelta(seconds=settings.ANALYTICS_ROLLUP_LAG_SECONDS)
+    if since is not None and until <= since:
+        db.rollback()
+        return None
+    # The first run (nothing processed yet) takes all history
+    params = {"since": since or datetime.min.replace(tzinfo=timezone.utc), "until": until}
+    for statement in _UPSERTS:
+        db.execute(statement, params)
+    db.execute(_SAVE_STATE, {"until": until})
+    db.commit()
+    return since, until
+
+
+def rollup_analytics(db: Session) -> None:
+    """Scheduled task: bring the hourly and daily rollups up to date."""
+    window = rollup_window(db)
+    if window is not None and window[0] is None:
+        logger.info("Backfilled analytics rollups up to %s", window[1].isoformat())
+
+
+def band_range(band: int) -> tuple[int | None, int | None]:
+    """(low, high) budget of a band, high exclusive; None for open ends."""
+    if band < 0:
+        return None, None
+    low = BUDGET_BAND_EDGES[band - 1] if band > 0 else None
+    high = BUDGET_BAND_EDGES[band] if band < len(BUDGET_BAND_EDGES) else None
+    return low, high
@@ -0,0 +1,104 @@
+import logging
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import func, select, text
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.application import Application
+from app.models.job import Job, JobStatus
+
+logger = logging.getLogger(__name__)
+
+# Jobs in these states are never written again and can leave the hot table
+ARCHIVABLE_JOB_STATUSES = [JobStatus.COMPLETED, JobStatus.CANCELLED]
+
+_JOB_COLUMNS = ", ".join(c.name for c in Job.__table__.columns)
+_APPLICATION_COLUMNS = ", ".join(c.name for c in Application.__table__.columns)
+
+_MOVE_APPLICATIONS = text(
+    f"""
+    WITH moved AS (
+        DELETE FROM applications WHERE job_id = ANY(:job_ids) RETURNING {_APPLICATION_COLUMNS}
+    )
+    INSERT INTO applications_archive ({_APPLICATION_COLUMNS})
+    SELECT {_APPLICATION_COLUMNS} FROM moved
+    """
+)
+
+_MOVE_JOBS = text(
+    f"""
+    WITH moved AS (
+        DELETE FROM jobs WHERE id = ANY(:job_ids) RETURNING {_JOB_COLUMNS}
+    )
+    INSERT INTO jobs_archive ({_JOB_COLUMNS})
+    SELECT {_JOB_COLUMNS} FROM moved
+    """
+)
+
+
+# Applications and stats go with the job via ON DELETE CASCADE
+_PURGE_DELETED_JOBS = text(
+    """
+    DELETE FROM jobs WHERE id IN (
+        SELECT id FROM jobs
+        WHERE deleted_at < :cutoff
+        LIMIT :batch_size
+        FOR UPDATE SKIP LOCKED
+    )
+    """
+)
+
+
+def archive_batch(db: Session, cutoff: datetime, batch_size: int) -> int:
+    """Move one batch of finished jobs (and their applications) to the archive tables."""
+    job_ids = (
+        db.execute(
+            select(Job.id)
+            .where(
+                Job.status.in_(ARCHIVABLE_JOB_STATUSES),
+                func.coalesce(Job.updated_at, Job.created_at) < cutoff,
+            )
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        .scalars()
+        .all()
+    )
+    if not job_ids:
+        db.rollback()
+        return 0
+
+    # Children first so the FK from applications to jobs is never violated
+    db.execute(_MOVE_APPLICATIONS, {"job_ids": job_ids})
+    db.execute(_MOVE_JOBS, {"job_ids": job_ids})
+    db.commit()
+    return len(job_ids)
+
+
+def archive_finished_jobs(db: Session) -> None:
+    """Scheduled task: drain finished jobs older than the cutoff into the archive."""
+    cutoff = datetime.now(timezone.utc) - timedelta(days=settings.ARCHIVE_AFTER_DAYS)
+    total = 0
+    while True:
+        moved = archive_batch(db, cutoff, settings.ARCHIVE_BATCH_SIZE)
+        total += moved
+        if moved < settings.ARCHIVE_BATCH_SIZE:
+            break
+    if total:
+        logger.info("Archived %d finished jobs", total)
+
+
+def purge_deleted_jobs(db: Session) -> None:
+    """Scheduled task: hard-delete jobs soft-deleted longer than the retention window."""
+    cutoff = datetime.now(timezone.utc) - timedelta(days=settings.JOB_SOFT_DELETE_RETENTION_DAYS)
+    params = {"cutoff": cutoff, "batch_size": settings.ARCHIVE_BATCH_SIZE}
+    total = 0
+    while True:
+        purged = db.execute(_PURGE_DELETED_JOBS, params).rowcount
+        db.commit()
+        total += purged
+        if purged < settings.ARCHIVE_BATCH_SIZE:
+            break
+    if total:
+        logger.info("Purged %d soft-deleted jobs", total)
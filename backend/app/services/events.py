@@ -0,0 +1,121 @@
+import asyncio
+import json
+import logging
+from collections.abc import Callable
+
+import psycopg
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Postgres NOTIFY channel carrying job/application change events
+CHANNEL = "jobboard_events"
+
+
+def publish_event(db: Session, topic: str, event_type: str, data: dict) -> None:
+    """Queue a NOTIFY in the current transaction; listeners receive it on commit.
+
+    Payloads must stay small (Postgres caps them at 8000 bytes), so events carry
+    ids and status only and clients refetch what they need.
+    """
+    payload = json.dumps({"topic": topic, "type": event_type, **data}, default=str)
+    db.execute(
+        text("SELECT pg_notify(:channel, :payload)"), {"channel": CHANNEL, "payload": payload}
+    )
+
+
+class Subscriber:
+    """A connected client's bounded event queue."""
+
+    def __init__(self, topics: set[str], user_id: str | None, max_queue: int):
+        self.topics = topics
+        self.user_id = user_id
+        self.queue: asyncio.Queue[dict] = asyncio.Queue(maxsize=max_queue)
+
+    def wants(self, event: dict) -> bool:
+        topic = event.get("topic")
+        if topic not in self.topics:
+            return False
+        # Application events are private to the apprentice and the job's sponsor
+        if topic == "applications":
+            return self.user_id in (event.get("apprentice_id"), event.get("sponsor_id"))
+        return True
+
+    def offer(self, event: dict) -> None:
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # Slow consumer: drop what it has not read and ask it to refetch instead
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait({"topic": "system", "type": "resync"})
+
+
+class EventBroker:
+    """Fans NOTIFY events from one shared LISTEN connection out to subscribers."""
+
+    def __init__(self):
+        self._subscribers: set[Subscriber] = set()
+        self._listener: asyncio.Task | None = None
+        # In-process consumers (e.g. cache invalidation), called for every event
+        self._callbacks: list[Callable[[dict], None]] = []
+
+    def start(self) -> None:
+        self._listener = asyncio.create_task(self._listen_forever())
+
+    async def stop(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            await asyncio.gather(self._listener, return_exceptions=True)
+            self._listener = None
+
+    def subscribe(self, topics: set[str], user_id: str | None = None) -> Subscriber:
+        subscriber = Subscriber(topics, user_id, settings.EVENTS_MAX_QUEUE)
+        self._subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        self._subscribers.discard(subscriber)
+
+    def add_callback(self, callback: Callable[[dict], None]) -> None:
+        self._callbacks.append(callback)
+
+    def dispatch(self, event: dict) -> None:
+        for callback in self._callbacks:
+            try:
+                callback(event)
+            except Exception:
+                logger.exception("Event callback failed")
+        for subscriber in list(self._subscribers):
+            if event.get("topic") == "system" or subscriber.wants(event):
+                subscriber.offer(event)
+
+    async def _listen_forever(self) -> None:
+        # psycopg wants a plain libpq URL, without SQLAlchemy's driver suffix
+        dsn = settings.DATABASE_URL.replace("postgresql+psycopg://", "postgresql://", 1)
+        delay = 1.0
+        while True:
+            try:
+                async with await psycopg.AsyncConnection.connect(dsn, autocommit=True) as conn:
+                    await conn.execute(f"LISTEN {CHANNEL}")
+                    delay = 1.0
+                    async for notify in conn.notifies():
+                        try:
+                            self.dispatch(json.loads(notify.payload))
+                        except json.JSONDecodeError:
+                            logger.warning("Ignoring malformed event payload")
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Event listener connection lost, reconnecting")
+                # Events may have been missed while disconnected
+                self.dispatch({"topic": "system", "type": "resync"})
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 30.0)
+
+
+# Singleton instance
+event_broker = EventBroker()
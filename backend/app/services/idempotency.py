@@ -0,0 +1,91 @@
+import hashlib
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.idempotency import IdempotencyKey
+
+
+def _request_hash(endpoint: str, payload: BaseModel) -> str:
+    return hashlib.sha256(f"{endpoint}\n{payload.model_dump_json()}".encode()).hexdigest()
+
+
+def claim_idempotency_key(
+    db: Session,
+    user_id: UUID,
+    key: str | None,
+    endpoint: str,
+    payload: BaseModel,
+) -> JSONResponse | None:
+    """Claim `key` for this request, or return the stored response to replay.
+
+    The key row is inserted in the caller's transaction, so it only becomes
+    visible together with the domain write; a concurrent retry blocks on the
+    insert until the first request commits and then replays its response.
+    """
+    if key is None:
+        return None
+
+    request_hash = _request_hash(endpoint, payload)
+    expires_at = datetime.now(timezone.utc) + timedelta(hours=settings.IDEMPOTENCY_TTL_HOURS)
+    values = {
+        "user_id": user_id,
+        "key": key,
+        "endpoint": endpoint,
+        "request_hash": request_hash,
+        "expires_at": expires_at,
+    }
+    stmt = insert(IdempotencyKey).values(**values)
+    # Expired keys are taken over as if they were new
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[IdempotencyKey.user_id, IdempotencyKey.key],
+        set_={**values, "status_code": None, "response_body": None},
+        where=IdempotencyKey.expires_at < func.now(),
+    ).returning(IdempotencyKey.key)
+    if db.execute(stmt).first() is not None:
+        return None
+
+    stored = db.execute(
+        select(IdempotencyKey).where(IdempotencyKey.user_id == user_id, IdempotencyKey.key == key)
+    ).scalar_one()
+    if stored.endpoint != endpoint or stored.request_hash != request_hash:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Idempotency-Key was already used for a different request",
+        )
+    return JSONResponse(
+        status_code=stored.status_code,
+        content=stored.response_body,
+        headers={"Idempotent-Replayed": "true"},
+    )
+
+
+def store_idempotent_response(
+    db: Session,
+    user_id: UUID,
+    key: str | None,
+    status_code: int,
+    response: BaseModel,
+) -> None:
+    """Record the response for a claimed key; committed with the caller's transaction."""
+    if key is None:
+        return
+    db.execute(
+        update(IdempotencyKey)
+        .where(IdempotencyKey.user_id == user_id, IdempotencyKey.key == key)
+        .values(status_code=status_code, response_body=jsonable_encoder(response))
+    )
+
+
+def purge_expired_keys(db: Session) -> None:
+    """Scheduled task: drop keys past their TTL."""
+    db.execute(delete(IdempotencyKey).where(IdempotencyKey.expires_at < func.now()))
+    db.commit()
@@ -0,0 +1,23 @@
+from uuid import UUID
+
+from app.config import settings
+from app.utils.cache import TTLCache
+
+# Rendered `JobResponse`s for GET /api/jobs/{id}, per worker. Writers invalidate
+# their own worker directly; other workers drop entries when the change event
+# arrives over LISTEN/NOTIFY (see `handle_event`), and the TTL bounds staleness
+# for anything that changes jobs without publishing an event.
+job_cache = TTLCache(settings.JOB_CACHE_SIZE, settings.JOB_CACHE_TTL_SECONDS)
+
+
+def invalidate_job(job_id: UUID | str) -> None:
+    job_cache.invalidate(str(job_id))
+
+
+def handle_event(event: dict) -> None:
+    """Event broker listener: job and application changes touch the job's entry."""
+    if event.get("topic") == "system":
+        # Listener reconnected, so invalidations may have been missed
+        job_cache.clear()
+    elif event.get("job_id"):
+        invalidate_job(event["job_id"])
@@ -0,0 +1,166 @@
+import asyncio
+import logging
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models.job import Job, JobStatus
+from app.utils.minhash import MinHashLSH, shingles, signature
+
+logger = logging.getLogger(__name__)
+
+
+def job_signature(title: str, description: str) -> tuple[int, ...]:
+    return signature(shingles(f"{title} {description}"))
+
+
+class JobDuplicateIndex:
+    """Per-worker MinHash LSH index of open jobs, for near-duplicate checks.
+
+    Built from the database at startup, and again after the event listener
+    reconnects. This worker's writes update it directly; other workers' writes
+    and the scheduled expiry arrive as job events (see `handle_event`). Matches
+    are confirmed open against the database, so a lagging entry is never
+    reported (and is dropped when found).
+    """
+
+    def __init__(self):
+        self.index = MinHashLSH()
+        self._build: asyncio.Task | None = None
+
+    def rebuild(self) -> None:
+        """Index every open job. Adds in place, so writes made meanwhile are kept."""
+        db = SessionLocal()
+        try:
+            rows = (
+                db.query(Job.id, Job.title, Job.description)
+                .filter(Job.status == JobStatus.OPEN)
+                .yield_per(1000)
+            )
+            for job_id, title, description in rows:
+                self.index.add(job_id, job_signature(title, description))
+        finally:
+            db.close()
+        logger.info("Duplicate index built over %d open jobs", len(self.index))
+
+    def start_rebuild(self) -> None:
+        """Build in a thread without holding up startup (nothing is flagged until done)."""
+
+        async def build() -> None:
+            try:
+                await asyncio.to_thread(self.rebuild)
+            except Exception:
+                logger.exception("Building the duplicate job index failed")
+
+        self._build = asyncio.create_task(build())
+
+    def find_duplicates(
+        self, db: Session, title: str, description: str, exclude: UUID | None = None
+    ) -> list[tuple[UUID, float]]:
+        matches = self.index.query(
+            job_signature(title, description), settings.JOB_DUPLICATE_THRESHOLD, exclude
+        )
+        if not matches:
+            return matches
+        open_ids = {
+            job_id
+            for (job_id,) in db.query(Job.id).filter(
+                Job.id.in_([job_id for job_id, _ in matches]), Job.status == JobStatus.OPEN
+            )
+        }
+        for job_id, _ in matches:
+            if job_id not in open_ids:
+                self.index.remove(job_id)
+        return [(job_id, score) for job_id, score in matches if job_id in open_ids]
+
+    def update(self, job: Job) -> None:
+        """Index an open job, or drop it once it is no longer open."""
+        if job.status == JobStatus.OPEN:
+            self.index.add(job.id, job_signature(job.title, job.description))
+        else:
+            self.index.remove(job.id)
+
+    def remove(self, job_id: UUID) -> None:
+        self.index.remove(job_id)
+
+    def _refresh(self, job_id: UUID) -> None:
+        db = SessionLocal()
+        try:
+            job = db.query(Job).filter(Job.id == job_id).first()
+            if job is None:
+                self.remove(job_id)
+            else:
+                self.update(job)
+        finally:
+            db.close()
+
+    def handle_event(self, event: dict) -> None:
+        """Event broker callback: apply other workers' job writes."""
+        if event.get("topic") == "system":
+            # Writes may have been missed while the listener was down; start over
+            self.index.clear()
+            self.start_rebuild()
+            return
+        if event.get("topic") != "jobs" or not event.get("job_id"):
+            return
+        job_id = UUID(event["job_id"])
+        if event.get("type") == "job.deleted":
+            self.remove(job_id)
+        else:
+            # Events carry ids only; fetch the text off the event loop
+            asyncio.get_running_loop().run_in_executor(None, self._refresh, job_id)
+
+
+def duplicate_clusters(db: Session, threshold: float) -> list[list[tuple[UUID, str]]]:
+    """Batch report: groups of open jobs that are near-duplicates of each other."""
+    rows = (
+        db.query(Job.id, Job.title, Job.description)
+        .filter(Job.status == JobStatus.OPEN)
+        .order_by(Job.created_at)
+        .all()
+    )
+    index = MinHashLSH()
+    titles: dict[UUID, str] = {}
+    parent: dict[UUID, UUID] = {}
+
+    def find(job_id: UUID) -> UUID:
+        while parent[job_id] != job_id:
+            parent[job_id] = parent[parent[job_id]]
+            job_id = parent[job_id]
+        return job_id
+
+    # Union each job with the earlier jobs it duplicates
+    for job_id, title, description in rows:
+        sig = job_signature(title, description)
+        parent[job_id] = job_id
+        titles[job_id] = title
+        for other, _ in index.query(sig, threshold):
+            parent[find(job_id)] = find(other)
+        index.add(job_id, sig)
+
+    clusters: dict[UUID, list[tuple[UUID, str]]] = {}
+    for job_id in parent:
+        clusters.setdefault(find(job_id), []).append((job_id, titles[job_id]))
+    return sorted(
+        (members for members in clusters.values() if len(members) > 1), key=len, reverse=True
+    )
+
+
+# Singleton instance
+job_duplicate_index = JobDuplicateIndex()
+
+
+if __name__ == "__main__":
+    # python -m app.services.job_dedupe  -> near-duplicate report over open jobs
+    db = SessionLocal()
+    try:
+        clusters = duplicate_clusters(db, settings.JOB_DUPLICATE_THRESHOLD)
+    finally:
+        db.close()
+    print(f"{len(clusters)} groups of near-duplicate open jobs")
+    for members in clusters:
+        print(f"\n{len(members)} jobs:")
+        for job_id, title in members:
+            print(f"  {job_id}  {title}")
@@ -0,0 +1,149 @@
+import logging
+from datetime import date, datetime, timezone
+
+from sqlalchemy import insert, select, update
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.application import Application, ApplicationStatus
+from app.models.application_event import ApplicationStatusEvent
+from app.models.job import Job, JobStatus
+from app.services import outbox
+from app.services.events import publish_event
+from app.services.job_cache import invalidate_job
+
+logger = logging.getLogger(__name__)
+
+
+def close_expired_jobs(db: Session, batch_size: int | None = None) -> int:
+    """Cancel open jobs whose deadline has passed, one batch per transaction.
+
+    Publishes `job.updated` for each, as the API does, so every worker's
+    caches and indexes of open jobs drop them.
+    """
+    batch_size = batch_size or settings.EXPIRY_BATCH_SIZE
+    total = 0
+    while True:
+        batch = (
+            select(Job.id)
+            .where(Job.status == JobStatus.OPEN, Job.deadline < date.today())
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        closed = db.execute(
+            update(Job)
+            .where(Job.id.in_(batch))
+            .values(status=JobStatus.CANCELLED)
+            .returning(Job.id, Job.sponsor_id)
+        ).all()
+        for job_id, sponsor_id in closed:
+            publish_event(
+                db,
+                "jobs",
+                "job.updated",
+                {
+                    "job_id": str(job_id),
+                    "sponsor_id": str(sponsor_id),
+                    "status": JobStatus.CANCELLED,
+                },
+            )
+        db.commit()
+        for job_id, _ in closed:
+            invalidate_job(job_id)
+        total += len(closed)
+        if len(closed) < batch_size:
+            return total
+
+
+def reject_stale_applications(db: Session, batch_size: int | None = None) -> int:
+    """Reject applications still pending on jobs that have closed.
+
+    Applications on open jobs are left for the sponsor to decide. Each
+    rejection publishes `application.status_changed` and notifies the
+    apprentice, as the API does, and is written to the status history in the
+    same transaction.
+    """
+    batch_size = batch_size or settings.EXPIRY_BATCH_SIZE
+    total = 0
+    while True:
+        batch = (
+            select(Application.id)
+            .join(Job, Job.id == Application.job_id)
+            .where(Application.status == ApplicationStatus.PENDING, Job.status != JobStatus.OPEN)
+            .limit(batch_size)
+            .with_for_update(of=Application, skip_locked=True)
+            .scalar_subquery()
+        )
+        rejected = db.execute(
+            update(Application)
+            .where(Application.id.in_(batch), Application.job_id == Job.id)
+            .values(status=ApplicationStatus.REJECTED)
+            .returning(
+                Application.id,
+                Application.job_id,
+                Application.apprentice_id,
+                Job.sponsor_id,
+                Job.title,
+            )
+        ).all()
+        if rejected:
+            changed_at = datetime.now(timezone.utc)
+            db.execute(
+                insert(ApplicationStatusEvent),
+                [
+                    {
+                        "application_id": row.id,
+                        "job_id": row.job_id,
+                        "apprentice_id": row.apprentice_id,
+                        "from_status": ApplicationStatus.PENDING,
+                        "to_status": ApplicationStatus.REJECTED,
+                        # NULL: decided by the system, not a user
+                        "changed_by": None,
+                        "changed_at": changed_at,
+                    }
+                    for row in rejected
+                ],
+            )
+        for application_id, job_id, apprentice_id, sponsor_id, job_title in rejected:
+            publish_event(
+                db,
+                "applications",
+                "application.status_changed",
+                {
+                    "application_id": str(application_id),
+                    "job_id": str(job_id),
+                    "apprentice_id": str(apprentice_id),
+                    "sponsor_id": str(sponsor_id),
+                    "status": ApplicationStatus.REJECTED,
+                },
+            )
+            outbox.enqueue(
+                db,
+                apprentice_id,
+                outbox.APPLICATION_REJECTED,
+                {
+                    "application_id": str(application_id),
+                    "job_id": str(job_id),
+                    "job_title": job_title,
+                },
+            )
+        db.commit()
+        # Cached application counts by status are now stale
+        for job_id in {row.job_id for row in rejected}:
+            invalidate_job(job_id)
+        total += len(rejected)
+        if len(rejected) < batch_size:
+            return total
+
+
+def expire_jobs(db: Session) -> None:
+    """Scheduled task: close past-deadline jobs, then reject what is pending on closed ones."""
+    jobs_closed = close_expired_jobs(db)
+    applications_rejected = reject_stale_applications(db)
+    if jobs_closed or applications_rejected:
+        logger.info(
+            "Expired %d jobs and rejected %d stale applications",
+            jobs_closed,
+            applications_rejected,
+        )
@@ -0,0 +1,45 @@
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.models.application import Application
+from app.models.archive import ApplicationArchive, JobArchive
+from app.models.job import Job
+from app.schemas.job import JobResponse
+
+
+def job_to_response(job: Job | JobArchive, db: Session) -> JobResponse:
+    """Convert Job model to JobResponse with application count."""
+    app_model = ApplicationArchive if isinstance(job, JobArchive) else Application
+    app_count = db.query(func.count(app_model.id)).filter(app_model.job_id == job.id).scalar()
+    return _response(job, app_count or 0)
+
+
+def jobs_to_responses(jobs: list[Job], db: Session) -> list[JobResponse]:
+    """`job_to_response` for many live jobs, counting applications in one query."""
+    counts = dict(
+        db.query(Application.job_id, func.count(Application.id))
+        .filter(Application.job_id.in_([job.id for job in jobs]))
+        .group_by(Application.job_id)
+        .all()
+    )
+    return [_response(job, counts.get(job.id, 0)) for job in jobs]
+
+
+def _response(job: Job | JobArchive, app_count: int) -> JobResponse:
+    return JobResponse(
+        id=job.id,
+        sponsor_id=job.sponsor_id,
+        title=job.title,
+        description=job.description,
+        requirements=job.requirements,
+        budget_min=job.budget_min,
+        budget_max=job.budget_max,
+        budget_type=job.budget_type,
+        estimated_hours=job.estimated_hours,
+        deadline=job.deadline,
+        status=job.status,
+        ai_generated_description=job.ai_generated_description,
+        created_at=job.created_at,
+        application_count=app_count,
+        sponsor=job.sponsor,
+    )
@@ -0,0 +1,357 @@
+import asyncio
+import json
+import logging
+import smtplib
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from email.message import EmailMessage
+from pathlib import Path
+from typing import Protocol
+from uuid import UUID
+
+from sqlalchemy import delete, or_, select
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models.outbox import OutboxMessage
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
+
+# Message kinds
+APPLICATION_RECEIVED = "application.received"
+APPLICATION_ACCEPTED = "application.accepted"
+APPLICATION_REJECTED = "application.rejected"
+
+_SUBJECTS = {
+    APPLICATION_RECEIVED: "New application for {job_title}",
+    APPLICATION_ACCEPTED: "Your application for {job_title} was accepted",
+    APPLICATION_REJECTED: "Your application for {job_title} was not selected",
+}
+
+
+def enqueue(db: Session, recipient_id: UUID, kind: str, payload: dict) -> None:
+    """Add a notification to the caller's transaction; it is sent only if that commits."""
+    db.add(OutboxMessage(recipient_id=recipient_id, kind=kind, payload=payload))
+
+
+@dataclass
+class Recipient:
+    id: UUID
+    email: str
+    name: str
+
+
+@dataclass
+class Notification:
+    """One delivery to one recipient, covering one or more outbox messages."""
+
+    recipient: Recipient
+    subject: str
+    lines: list[str]
+    messages: list[dict]
+
+    @property
+    def text(self) -> str:
+        return f"Hi {self.recipient.name},\n\n" + "\n".join(self.lines) + "\n"
+
+
+class Transport(Protocol):
+    """Delivers notifications. Raise to have the messages retried later.
+
+    `dispatch_batch` enters the transport around each batch's sends, so a
+    transport can hold one connection for the whole batch.
+    """
+
+    def __enter__(self) -> "Transport": ...
+
+    def __exit__(self, *exc_info) -> None: ...
+
+    def send(self, notification: Notification) -> None: ...
+
+
+class BaseTransport:
+    """No per-batch setup; each `send` stands alone."""
+
+    def __enter__(self) -> "BaseTransport":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+
+class FileTransport(BaseTransport):
+    """Appends each notification as a JSON line; for development and tests."""
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def send(self, notification: Notification) -> None:
+        record = {
+            "to": notification.recipient.email,
+            "subject": notification.subject,
+            "text": notification.text,
+            "messages": notification.messages,
+            "sent_at": datetime.now(timezone.utc).isoformat(),
+        }
+        with self._lock, self.path.open("a") as f:
+            f.write(json.dumps(record, default=str) + "\n")
+
+
+class SMTPTransport(BaseTransport):
+    """Sends each notification as an email, over one connection per batch.
+
+    The connection is opened on the first send and closed when the batch
+    ends; a failed send drops it, and the next send reconnects.
+    """
+
+    def __init__(self):
+        self._smtp: smtplib.SMTP | None = None
+
+    def _connect(self) -> smtplib.SMTP:
+        smtp = smtplib.SMTP(settings.SMTP_HOST, settings.SMTP_PORT, timeout=30)
+        try:
+            smtp.starttls()
+            if settings.SMTP_USERNAME:
+                smtp.login(settings.SMTP_USERNAME, settings.SMTP_PASSWORD)
+        except BaseException:
+            smtp.close()
+            raise
+        return smtp
+
+    def _disconnect(self) -> None:
+        smtp, self._smtp = self._smtp, None
+        if smtp is None:
+            return
+        try:
+            smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            smtp.close()
+
+    def __exit__(self, *exc_info) -> None:
+        self._disconnect()
+
+    def send(self, notification: Notification) -> None:
+        email = EmailMessage()
+        email["From"] = settings.SMTP_FROM
+        email["To"] = notification.recipient.email
+        email["Subject"] = notification.subject
+        email.set_content(notification.text)
+        if self._smtp is None:
+            self._smtp = self._connect()
+        try:
+            self._smtp.send_message(email)
+        except BaseException:
+            # The connection may be unusable; start the next send afresh
+            self._disconnect()
+            raise
+
+
+class WebhookTransport(BaseTransport):
+    """POSTs each notification as JSON to OUTBOX_WEBHOOK_URL."""
+
+    def send(self, notification: Notification) -> None:
+        import httpx
+
+        response = httpx.post(
+            settings.OUTBOX_WEBHOOK_URL,
+            json={
+                "recipient_id": str(notification.recipient.id),
+                "email": notification.recipient.email,
+                "subject": notification.subject,
+                "text": notification.text,
+                "messages": notification.messages,
+            },
+            timeout=30,
+        )
+        response.raise_for_status()
+
+
+TRANSPORTS: dict[str, Callable[[], Transport]] = {
+    "file": lambda: FileTransport(settings.OUTBOX_FILE_PATH),
+    "smtp": SMTPTransport,
+    "webhook": WebhookTransport,
+}
+
+
+def register_transport(name: str, factory: Callable[[], Transport]) -> None:
+    """Make another transport selectable through OUTBOX_TRANSPORT (see `BaseTransport`)."""
+    TRANSPORTS[name] = factory
+
+
+def _describe(kind: str, payload: dict) -> str:
+    if kind == APPLICATION_RECEIVED:
+        return f"- {payload['apprentice_name']} applied to {payload['job_title']}"
+    if kind == APPLICATION_ACCEPTED:
+        return f"- Your application for {payload['job_title']} was accepted"
+    if kind == APPLICATION_REJECTED:
+        return f"- Your application for {payload['job_title']} was not selected"
+    return f"- {kind}"
+
+
+def coalesce(recipient: Recipient, rows: list[OutboxMessage]) -> Notification:
+    """Fold one recipient's pending messages (oldest first) into one notification.
+
+    A later status message for the same application replaces an earlier one,
+    so accept-then-reject within a batch sends only the rejection.
+    """
+    latest: dict[object, OutboxMessage] = {}
+    for row in rows:
+        key = row.payload.get("application_id") if row.kind != APPLICATION_RECEIVED else row.id
+        latest.pop(key, None)
+        latest[key] = row
+    kept = list(latest.values())
+    if len(kept) == 1:
+        subject = _SUBJECTS.get(kept[0].kind, "Job board update").format(**kept[0].payload)
+    else:
+        subject = f"{len(kept)} updates on the job board"
+    return Notification(
+        recipient=recipient,
+        subject=subject,
+        lines=[_describe(row.kind, row.payload) for row in kept],
+        messages=[{"kind": row.kind, **row.payload} for row in kept],
+    )
+
+
+def dispatch_batch(db: Session, transport: Transport, batch_size: int | None = None) -> int:
+    """Claim up to `batch_size` pending messages, deliver them per recipient and
+    record the outcome. Returns how many were claimed.
+
+    Claiming sets a lease (`claimed_until`) and commits, so no transaction or
+    row lock is held while the transport talks to the outside world; SKIP
+    LOCKED and the lease keep concurrent workers off each other's rows. The
+    outcome is recorded in a second short transaction. If the worker dies in
+    between, the lease runs out and the messages are delivered again.
+    """
+    now = datetime.now(timezone.utc)
+    rows = (
+        db.execute(
+            select(OutboxMessage)
+            .where(
+                OutboxMessage.sent_at.is_(None),
+                OutboxMessage.failed_at.is_(None),
+                OutboxMessage.available_at <= now,
+                or_(OutboxMessage.claimed_until.is_(None), OutboxMessage.claimed_until < now),
+            )
+            .order_by(OutboxMessage.id)
+            .limit(batch_size or settings.OUTBOX_BATCH_SIZE)
+            .with_for_update(skip_locked=True)
+        )
+        .scalars()
+        .all()
+    )
+    if not rows:
+        db.rollback()
+        return 0
+
+    by_recipient: dict[UUID, list[OutboxMessage]] = {}
+    for row in rows:
+        by_recipient.setdefault(row.recipient_id, []).append(row)
+    users = {
+        user.id: user
+        for user in db.query(User.id, User.email, User.full_name).filter(
+            User.id.in_(list(by_recipient))
+        )
+    }
+
+    # Everything the sends need is read now: the rows expire at commit
+    deliveries: list[tuple[Notification, list[int]]] = []
+    for recipient_id, messages in by_recipient.items():
+        user = users.get(recipient_id)
+        if user is None:
+            # Recipient deleted since (their messages are about to cascade away)
+            continue
+        notification = coalesce(Recipient(user.id, user.email, user.full_name), messages)
+        deliveries.append((notification, [row.id for row in messages]))
+    claimed_until = now + timedelta(seconds=settings.OUTBOX_CLAIM_SECONDS)
+    for row in rows:
+        row.claimed_until = claimed_until
+    db.commit()
+
+    # Message id -> delivery error, None when sent
+    outcomes: dict[int, str | None] = {}
+    with transport:
+        for notification, ids in deliveries:
+            try:
+                transport.send(notification)
+            except Exception as e:
+                logger.warning(
+                    "Delivering %d messages to %s failed: %s",
+                    len(ids),
+                    notification.recipient.email,
+                    e,
+                )
+                outcomes.update(dict.fromkeys(ids, str(e)))
+            else:
+                outcomes.update(dict.fromkeys(ids))
+
+    now = datetime.now(timezone.utc)
+    for row in db.query(OutboxMessage).filter(OutboxMessage.id.in_(list(outcomes))):
+        error = outcomes[row.id]
+        row.attempts += 1
+        row.claimed_until = None
+        if error is None:
+            row.sent_at = now
+            continue
+        row.last_error = error
+        if row.attempts >= settings.OUTBOX_MAX_ATTEMPTS:
+            row.failed_at = now
+        else:
+            # Exponential backoff: 30s, 1m, 2m, ... capped at an hour
+            delay = min(3600, 30 * 2 ** (row.attempts - 1))
+            row.available_at = now + timedelta(seconds=delay)
+    db.commit()
+    return len(rows)
+
+
+def purge_sent_messages(db: Session) -> None:
+    """Scheduled task: drop delivered and given-up messages past the retention window."""
+    cutoff = datetime.now(timezone.utc) - timedelta(days=settings.OUTBOX_RETENTION_DAYS)
+    db.execute(
+        delete(OutboxMessage).where(
+            (OutboxMessage.sent_at < cutoff) | (OutboxMessage.failed_at < cutoff)
+        )
+    )
+    db.commit()
+
+
+class OutboxDispatcher:
+    """Background loop draining the outbox in batches, one per worker."""
+
+    def __init__(self):
+        self._runner: asyncio.Task | None = None
+        self.transport: Transport | None = None
+
+    def start(self) -> None:
+        self.transport = TRANSPORTS[settings.OUTBOX_TRANSPORT]()
+        self._runner = asyncio.create_task(self._run_forever())
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            self._runner.cancel()
+            await asyncio.gather(self._runner, return_exceptions=True)
+            self._runner = None
+
+    def _dispatch(self) -> int:
+        with SessionLocal() as db:
+            return dispatch_batch(db, self.transport)
+
+    async def _run_forever(self) -> None:
+        while True:
+            try:
+                claimed = await asyncio.to_thread(self._dispatch)
+            except Exception:
+                logger.exception("Outbox dispatch failed")
+                claimed = 0
+            # Keep going while there is a backlog; otherwise wait, which also
+            # gives bursts for the same recipient time to coalesce
+            if claimed < settings.OUTBOX_BATCH_SIZE:
+                await asyncio.sleep(settings.OUTBOX_POLL_SECONDS)
+
+
+# Singleton instance
+outbox_dispatcher = OutboxDispatcher()
@@ -0,0 +1,48 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from app.config import settings
+from app.utils.security import get_password_hash
+
+# Below this many passwords the pool's IPC overhead isn't worth it
+MIN_PARALLEL_BATCH = 4
+
+
+def default_workers() -> int:
+    return max(1, (os.cpu_count() or 1) // max(1, settings.WEB_CONCURRENCY))
+
+
+class PasswordHashPool:
+    """bcrypt across worker processes, so bulk registration uses every core.
+
+    bcrypt holds the GIL for its whole ~250 ms, so threads would not help. The
+    pool is started on first use (spawned, not forked, because the server
+    process runs threads and an event loop) and kept for later batches. Every
+    server worker has its own pool, so by default they split the CPUs.
+    """
+
+    def __init__(self):
+        self._executor: ProcessPoolExecutor | None = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=settings.PASSWORD_HASH_WORKERS or default_workers(),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    def hash_all(self, passwords: list[str]) -> list[str]:
+        if len(passwords) < MIN_PARALLEL_BATCH:
+            return [get_password_hash(password) for password in passwords]
+        return list(self._get_executor().map(get_password_hash, passwords))
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+# Singleton instance
+password_hash_pool = PasswordHashPool()
@@ -0,0 +1,65 @@
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.database import engine
+
+# Every policy refills a bucket within its period (a minute at most), so rows
+# idle this long are full and dropping them changes nothing
+IDLE_BUCKET_SECONDS = 3600
+
+_ENSURE_BUCKET = text(
+    """
+    INSERT INTO rate_limit_buckets (key, tokens, updated_at)
+    VALUES (:key, :capacity, now())
+    ON CONFLICT (key) DO NOTHING
+    """
+)
+
+# Refill by elapsed time, then take up to :want whole tokens, atomically under
+# the row lock
+_TAKE_TOKENS = text(
+    """
+    UPDATE rate_limit_buckets AS b
+    SET tokens = s.available - s.granted, updated_at = now()
+    FROM (
+        SELECT
+            key,
+            avail AS available,
+            least(:want, floor(avail)) AS granted
+        FROM (
+            SELECT
+                key,
+                least(
+                    :capacity,
+                    tokens + extract(epoch FROM now() - updated_at) * :rate
+                ) AS avail
+            FROM rate_limit_buckets
+            WHERE key = :key
+            FOR UPDATE
+        ) AS locked
+    ) AS s
+    WHERE b.key = s.key
+    RETURNING s.granted, s.available
+    """
+)
+
+_PURGE_IDLE = text(
+    "DELETE FROM rate_limit_buckets WHERE updated_at < now() - make_interval(secs => :idle)"
+)
+
+
+class PostgresBucketStore:
+    """Token buckets shared by every node, in the UNLOGGED `rate_limit_buckets` table."""
+
+    def acquire(self, key: str, capacity: int, rate: float, want: int) -> tuple[int, float]:
+        params = {"key": key, "capacity": capacity, "rate": rate, "want": want}
+        with engine.begin() as conn:
+            conn.execute(_ENSURE_BUCKET, params)
+            granted, available = conn.execute(_TAKE_TOKENS, params).one()
+        return int(granted), float(available)
+
+
+def purge_idle_buckets(db: Session) -> None:
+    """Scheduled task: drop buckets nobody has hit for IDLE_BUCKET_SECONDS."""
+    db.execute(_PURGE_IDLE, {"idle": IDLE_BUCKET_SECONDS})
+    db.commit()
@@ -0,0 +1,246 @@
+import asyncio
+import heapq
+import logging
+import math
+import threading
+from array import array
+from uuid import UUID
+
+from sqlalchemy import select
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models.application import Application, ApplicationStatus
+from app.models.archive import ApplicationArchive
+from app.models.job import Job, JobStatus
+from app.utils.sparse import SparseVector
+
+logger = logging.getLogger(__name__)
+
+# Interaction weights: applying is interest, being accepted is a strong match
+APPLIED_WEIGHT = 1.0
+ACCEPTED_WEIGHT = 3.0
+
+
+def interaction_weight(status: str) -> float:
+    return ACCEPTED_WEIGHT if status == ApplicationStatus.ACCEPTED else APPLIED_WEIGHT
+
+
+class CoApplicationRecommender:
+    """Item-item recommendations from who applied to (and was accepted on) what.
+
+    Jobs get dense integer ids; the co-application matrix is one `SparseVector`
+    row per job and item norms live in a flat array. Each apprentice's top-N is
+    precomputed, so a request is a dict lookup. Writes arrive as application
+    events; apprentices whose neighbourhood changed are recomputed by a
+    background refresh.
+
+    Each (apprentice, job) weight is set from the application's current
+    status, never accumulated, so replaying an event is harmless. Events that
+    arrive while `rebuild` reads its snapshot are held back and applied after
+    it, so they can't be overwritten by older rows. Rebuilds run one at a time.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._job_index: dict[UUID, int] = {}
+        self._job_ids: list[UUID] = []
+        self._open = bytearray()
+        self._norms = array("d")
+        self._rows: list[SparseVector] = []
+        # apprentice -> {job index: weight}; job index -> apprentices with history on it
+        self._history: dict[UUID, dict[int, float]] = {}
+        self._appliers: list[set[UUID]] = []
+        self._cache: dict[UUID, list[tuple[UUID, float]]] = {}
+        self._dirty: set[UUID] = set()
+        # Events held back while a rebuild is reading; None when not rebuilding
+        self._pending: list[dict] | None = None
+        self._tasks: list[asyncio.Task] = []
+        # Serializes rebuilds; at most one resync waits behind a running one
+        self._rebuilding = asyncio.Lock()
+        self._resync_queued = False
+
+    def _job(self, job_id: UUID) -> int:
+        index = self._job_index.get(job_id)
+        if index is None:
+            index = len(self._job_ids)
+            self._job_index[job_id] = index
+            self._job_ids.append(job_id)
+            self._open.append(0)
+            self._norms.append(0.0)
+            self._rows.append(SparseVector())
+            self._appliers.append(set())
+        return index
+
+    def _set(self, apprentice_id: UUID, job_id: UUID, weight: float) -> None:
+        """Set one (apprentice, job) interaction to `weight`. Caller holds the lock."""
+        j = self._job(job_id)
+        history = self._history.setdefault(apprentice_id, {})
+        old = history.get(j, 0.0)
+        delta = weight - old
+        if not delta:
+            return
+        history[j] = weight
+        # Co-occurrence is the dot product of item columns, so only the delta
+        # against the apprentice's other jobs needs adding
+        for k, w in history.items():
+            if k != j:
+                self._rows[j].add(k, delta * w)
+                self._rows[k].add(j, delta * w)
+        self._norms[j] += weight * weight - old * old
+        self._appliers[j].add(apprentice_id)
+        for neighbour in history:
+            self._dirty.update(self._appliers[neighbour])
+
+    def _apply(self, event: dict) -> None:
+        """Fold one job or application event in. Caller holds the lock."""
+        topic, event_type = event.get("topic"), event.get("type")
+        if topic == "jobs" and event.get("job_id"):
+            is_open = event_type != "job.deleted" and event.get("status") == JobStatus.OPEN
+            self._open[self._job(UUID(event["job_id"]))] = int(is_open)
+        elif topic == "applications" and event.get("job_id"):
+            if event_type in ("application.created", "application.status_changed"):
+                self._set(
+                    UUID(event["apprentice_id"]),
+                    UUID(event["job_id"]),
+                    interaction_weight(event.get("status")),
+                )
+
+    def _compute(self, apprentice_id: UUID) -> list[tuple[UUID, float]]:
+        history = self._history.get(apprentice_id)
+        if not history:
+            return []
+        scores: dict[int, float] = {}
+        for j, w in history.items():
+            norm_j = self._norms[j]
+            if norm_j <= 0:
+                continue
+            for k, co in self._rows[j].items():
+                if k in history or not self._open[k] or self._norms[k] <= 0:
+                    continue
+                scores[k] = scores.get(k, 0.0) + w * co / math.sqrt(norm_j * self._norms[k])
+        top = heapq.nlargest(settings.RECOMMENDATIONS_TOP_N, scores.items(), key=lambda s: s[1])
+        return [(self._job_ids[k], round(score, 4)) for k, score in top]
+
+    def recommend(self, apprentice_id: UUID) -> list[tuple[UUID, float]]:
+        """Precomputed top-N open jobs for the apprentice (computed once if missing)."""
+        cached = self._cache.get(apprentice_id)
+        if cached is not None:
+            return cached
+        with self._lock:
+            recommendations = self._compute(apprentice_id)
+        self._cache[apprentice_id] = recommendations
+        return recommendations
+
+    def refresh_dirty(self) -> int:
+        """Recompute cached lists whose neighbourhood changed since the last refresh."""
+        with self._lock:
+            dirty, self._dirty = self._dirty, set()
+            fresh = {apprentice_id: self._compute(apprentice_id) for apprentice_id in dirty}
+        self._cache.update(fresh)
+        return len(fresh)
+
+    def rebuild(self) -> None:
+        """Load open jobs and the full application history, archive included."""
+        with self._lock:
+            self._pending = []
+        db = SessionLocal()
+        try:
+            # One snapshot for every query below; events held back meanwhile are
+            # applied on top of it
+            db.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+            # Batches are fetched without the lock and only folded in under it,
+            # so `handle_event` (on the event loop) never waits for the database
+            stream = {"yield_per": 5000}
+            open_jobs = db.execute(
+                select(Job.id).where(Job.status == JobStatus.OPEN), execution_options=stream
+            )
+            for batch in open_jobs.partitions():
+                with self._lock:
+                    for (job_id,) in batch:
+                        self._open[self._job(job_id)] = 1
+            for model in (Application, ApplicationArchive):
+                rows = db.execute(
+                    select(model.apprentice_id, model.job_id, model.status),
+                    execution_options=stream,
+                )
+                for batch in rows.partitions():
+                    with self._lock:
+                        for apprentice_id, job_id, app_status in batch:
+                            self._set(apprentice_id, job_id, interaction_weight(app_status))
+        finally:
+            db.close()
+            with self._lock:
+                pending, self._pending = self._pending, None
+                for event in pending:
+                    self._apply(event)
+        self.refresh_dirty()
+        logger.info(
+            "Recommendations built over %d jobs and %d apprentices",
+            len(self._job_ids),
+            len(self._history),
+        )
+
+    def handle_event(self, event: dict) -> None:
+        """Event broker callback: fold application and job writes in incrementally."""
+        if event.get("topic") == "system":
+            # Missed events while the listener was down; start over
+            if not self._resync_queued:
+                self._resync_queued = True
+                self._tasks.append(asyncio.create_task(self._rebuild(reset=True)))
+            return
+        with self._lock:
+            if self._pending is not None:
+                self._pending.append(event)
+            else:
+                self._apply(event)
+
+    def _reset(self) -> None:
+        with self._lock:
+            self._job_index.clear()
+            self._job_ids.clear()
+            self._open = bytearray()
+            self._norms = array("d")
+            self._rows.clear()
+            self._history.clear()
+            self._appliers.clear()
+            self._dirty.clear()
+        self.rebuild()
+        # Anyone not rebuilt above has no history left; drop stale lists
+        with self._lock:
+            for apprentice_id in set(self._cache) - set(self._history):
+                del self._cache[apprentice_id]
+
+    async def _rebuild(self, reset: bool = False) -> None:
+        """Rebuild (from scratch if `reset`) in a thread, after any rebuild in progress."""
+        async with self._rebuilding:
+            if reset:
+                self._resync_queued = False
+            try:
+                await asyncio.to_thread(self._reset if reset else self.rebuild)
+            except Exception:
+                logger.exception("Building recommendations failed")
+
+    def start(self) -> None:
+        """Build in a thread, then keep refreshing changed apprentices."""
+
+        async def run() -> None:
+            await self._rebuild()
+            while True:
+                await asyncio.sleep(settings.RECOMMENDATIONS_REFRESH_SECONDS)
+                try:
+                    await asyncio.to_thread(self.refresh_dirty)
+                except Exception:
+                    logger.exception("Refreshing recommendations failed")
+
+        self._tasks.append(asyncio.create_task(run()))
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+
+
+# Singleton instance
+recommender = CoApplicationRecommender()
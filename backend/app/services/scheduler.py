@@ -0,0 +1,93 @@
+import asyncio
+import logging
+import time
+import zlib
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal, engine
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PeriodicTask:
+    name: str
+    interval: float
+    func: Callable[[Session], object]
+
+
+class Scheduler:
+    """In-process periodic task runner.
+
+    Every worker runs the same loop, but each task run is guarded by a
+    Postgres advisory lock so only one worker executes a given task at a time.
+    Due tasks run one after another, so the scheduler holds at most one pooled
+    connection per worker.
+    """
+
+    def __init__(self):
+        self._tasks: list[PeriodicTask] = []
+        self._runner: asyncio.Task | None = None
+
+    def register(self, name: str, interval: float, func: Callable[[Session], object]) -> None:
+        """Register a sync task taking a DB session, run every `interval` seconds."""
+        self._tasks.append(PeriodicTask(name=name, interval=interval, func=func))
+
+    def start(self) -> None:
+        self._runner = asyncio.create_task(self._run_forever())
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            self._runner.cancel()
+            await asyncio.gather(self._runner, return_exceptions=True)
+            self._runner = None
+
+    async def _run_forever(self) -> None:
+        if not self._tasks:
+            return
+        # Every task is due at startup; they still run one at a time
+        due = {task.name: time.monotonic() for task in self._tasks}
+        while True:
+            for task in sorted(self._tasks, key=lambda t: due[t.name]):
+                if due[task.name] > time.monotonic():
+                    break
+                try:
+                    await asyncio.to_thread(self.run_once, task)
+                except Exception:
+                    logger.exception("Scheduled task %s failed", task.name)
+                due[task.name] = time.monotonic() + task.interval
+            await asyncio.sleep(max(0.0, min(due.values()) - time.monotonic()))
+
+    def run_once(self, task: PeriodicTask) -> bool:
+        """Run a task if this worker wins its advisory lock. Returns whether it ran."""
+        key = _lock_key(task.name)
+        # The lock is session-level, so it outlives the task's commits; the
+        # task's session is bound to the same connection, so a run uses one
+        with engine.connect() as conn:
+            acquired = conn.execute(
+                text("SELECT pg_try_advisory_lock(:key)"), {"key": key}
+            ).scalar()
+            conn.commit()
+            if not acquired:
+                return False
+            try:
+                with SessionLocal(bind=conn) as db:
+                    task.func(db)
+            finally:
+                conn.rollback()
+                conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": key})
+                conn.commit()
+        return True
+
+
+def _lock_key(name: str) -> int:
+    """Stable advisory lock key for a task name."""
+    return zlib.crc32(f"scheduler:{name}".encode())
+
+
+# Singleton instance
+scheduler = Scheduler()
@@ -0,0 +1,257 @@
+import gzip
+import json
+import logging
+import os
+import tempfile
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from uuid import UUID
+from xml.sax.saxutils import escape
+
+from sqlalchemy import or_
+from sqlalchemy.orm import Session, selectinload
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models.job import Job, JobStatus
+from app.models.job_stats import JobApplicationStats
+from app.services.job_responses import jobs_to_responses
+
+logger = logging.getLogger(__name__)
+
+# Each run re-checks this much before the previous one, so jobs committed by
+# transactions that started earlier are not missed (rewrites are no-ops)
+_OVERLAP = timedelta(seconds=60)
+
+# Jobs loaded and rendered per query
+_RENDER_BATCH = 500
+
+
+class JobSnapshotStore:
+    """Gzipped, pre-rendered copies of the public job endpoints on disk.
+
+    Layout under `root`:
+
+        jobs/<job id>.json.gz   GET /api/jobs/<job id>       (open jobs only)
+        pages/<n>.json.gz       GET /api/jobs?skip=<n * page size>&limit=<page size>
+        sitemap.xml.gz          GET /sitemap.xml
+        manifest.json           how far job changes have been applied, and
+                                which jobs are rendered, in list order
+
+    Files are written atomically and only when their content changed, so
+    readers never see a partial file and unchanged pages keep their mtime.
+    """
+
+    def __init__(self, root: str | Path, page_size: int):
+        self.root = Path(root)
+        self.page_size = page_size
+
+    def job_path(self, job_id: UUID | str) -> Path:
+        return self.root / "jobs" / f"{job_id}.json.gz"
+
+    def page_path(self, page: int) -> Path:
+        return self.root / "pages" / f"{page}.json.gz"
+
+    @property
+    def sitemap_path(self) -> Path:
+        return self.root / "sitemap.xml.gz"
+
+    @property
+    def manifest_path(self) -> Path:
+        return self.root / "manifest.json"
+
+    def write(self, path: Path, body: bytes) -> bool:
+        """Gzip `body` to `path` unless the file already holds exactly that. Returns
+        whether the file was written."""
+        data = gzip.compress(body, compresslevel=9, mtime=0)
+        try:
+            if path.read_bytes() == data:
+                return False
+        except FileNotFoundError:
+            path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        return True
+
+    def read(self, path: Path) -> bytes:
+        return gzip.decompress(path.read_bytes())
+
+    def load_manifest(self) -> dict:
+        try:
+            return json.loads(self.manifest_path.read_text())
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def save_manifest(self, manifest: dict) -> None:
+        tmp = self.manifest_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(manifest))
+        os.replace(tmp, self.manifest_path)
+
+
+def _sitemap(rows) -> bytes:
+    base = settings.SNAPSHOT_SITE_URL.rstrip("/")
+    urls = [f"<url><loc>{escape(base)}/jobs</loc><changefreq>hourly</changefreq></url>"]
+    for job_id, created_at, updated_at in rows:
+        lastmod = (updated_at or created_at).date().isoformat()
+        urls.append(
+            f"<url><loc>{escape(base)}/jobs/{job_id}</loc><lastmod>{lastmod}</lastmod></url>"
+        )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+        + "\n".join(urls)
+        + "\n</urlset>\n"
+    ).encode()
+
+
+def refresh_snapshots(db: Session, store: JobSnapshotStore, full: bool = False) -> dict:
+    """Bring the snapshot files in line with the open jobs.
+
+    Only jobs created, edited or applied to since the last run are rendered
+    from the database, in batches. The manifest records which jobs are
+    rendered and in what order, so only the list pages holding a changed job
+    are reassembled (all of them when jobs open or close, since every page
+    carries the total). Every file is rewritten only if its content changed.
+    """
+    started = datetime.now(timezone.utc)
+    manifest = {} if full else store.load_manifest()
+    # Manifests without the rendered job list predate incremental pages
+    since = manifest.get("generated_until") if "jobs" in manifest else None
+    previous = [UUID(job_id) for job_id in manifest.get("jobs", [])] if since else []
+    rendered = set(previous)
+
+    # Newest first, matching GET /api/jobs
+    open_rows = (
+        db.query(Job.id, Job.created_at, Job.updated_at)
+        .filter(Job.status == JobStatus.OPEN)
+        .order_by(Job.created_at.desc(), Job.id)
+        .all()
+    )
+    order = [row.id for row in open_rows]
+    open_ids = set(order)
+
+    # Jobs whose rendering may have changed: new, edited or with new applications
+    if since is None:
+        stale = set(open_ids)
+    else:
+        cutoff = datetime.fromisoformat(since) - _OVERLAP
+        changed = (
+            db.query(Job.id)
+            .outerjoin(JobApplicationStats, JobApplicationStats.job_id == Job.id)
+            .filter(
+                Job.status == JobStatus.OPEN,
+                or_(
+                    Job.created_at > cutoff,
+                    Job.updated_at > cutoff,
+                    JobApplicationStats.last_application_at > cutoff,
+                ),
+            )
+            .all()
+        )
+        stale = {job_id for (job_id,) in changed}
+        # Jobs that reopened, or whose file went missing last run
+        stale |= open_ids - rendered
+
+    written = 0
+    bodies: dict[UUID, bytes] = {}
+    stale_ids = list(stale)
+    for start in range(0, len(stale_ids), _RENDER_BATCH):
+        jobs = (
+            db.query(Job)
+            .options(selectinload(Job.sponsor))
+            .filter(Job.id.in_(stale_ids[start : start + _RENDER_BATCH]))
+            .all()
+        )
+        for response in jobs_to_responses(jobs, db):
+            bodies[response.id] = response.model_dump_json().encode()
+            written += store.write(store.job_path(response.id), bodies[response.id])
+
+    # Closed, deleted and archived jobs fall back to the API
+    removed = 0
+    if since is None:
+        # No record of what was rendered before; check the directory
+        jobs_dir = store.root / "jobs"
+        gone = [
+            path
+            for path in (jobs_dir.glob("*.json.gz") if jobs_dir.exists() else [])
+            if UUID(path.name.removesuffix(".json.gz")) not in open_ids
+        ]
+    else:
+        gone = [store.job_path(job_id) for job_id in rendered - open_ids]
+    for path in gone:
+        path.unlink(missing_ok=True)
+        removed += 1
+
+    # Pages are the per-job files joined; the bytes match JobListResponse's JSON
+    total = len(order)
+    size = store.page_size
+    rewrite_all = since is None or total != len(previous)
+    missing: set[UUID] = set()
+    pages = 0
+    page_count = max(1, -(-total // size))
+    for page in range(page_count):
+        ids = order[page * size : (page + 1) * size]
+        before = previous[page * size : (page + 1) * size]
+        if not rewrite_all and ids == before and stale.isdisjoint(ids):
+            continue
+        parts = []
+        for job_id in ids:
+            body = bodies.get(job_id)
+            if body is None:
+                try:
+                    body = store.read(store.job_path(job_id))
+                except FileNotFoundError:
+                    # Rendered next run; the page is rewritten then
+                    missing.add(job_id)
+                    continue
+            parts.append(body)
+        body = b'{"jobs":[' + b",".join(parts) + b'],"total":' + str(total).encode() + b"}"
+        written += store.write(store.page_path(page), body)
+        pages += 1
+    pages_dir = store.root / "pages"
+    if pages_dir.exists():
+        for path in pages_dir.glob("*.json.gz"):
+            if int(path.name.removesuffix(".json.gz")) >= page_count:
+                path.unlink(missing_ok=True)
+    if since is None or stale or removed or order != previous:
+        written += store.write(store.sitemap_path, _sitemap(open_rows))
+
+    store.save_manifest(
+        {
+            "generated_until": started.isoformat(),
+            "open_jobs": total,
+            "jobs": [str(job_id) for job_id in order if job_id not in missing],
+        }
+    )
+    return {"rendered": len(bodies), "written": written, "removed": removed, "pages": pages}
+
+
+def refresh_job_snapshots(db: Session) -> None:
+    """Scheduled task: apply job changes since the last run to the snapshot files."""
+    stats = refresh_snapshots(db, snapshot_store)
+    if stats["written"] or stats["removed"]:
+        logger.info(
+            "Job snapshots: %d files written, %d removed (%d jobs rendered)",
+            stats["written"],
+            stats["removed"],
+            stats["rendered"],
+        )
+
+
+# Singleton instance
+snapshot_store = JobSnapshotStore(settings.SNAPSHOT_DIR, settings.SNAPSHOT_PAGE_SIZE)
+
+
+if __name__ == "__main__":
+    # python -m app.services.snapshots  -> regenerate every snapshot file
+    db = SessionLocal()
+    try:
+        print(refresh_snapshots(db, snapshot_store, full=True))
+    finally:
+        db.close()
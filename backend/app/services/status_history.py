@@ -0,0 +1,114 @@
+import asyncio
+import logging
+import threading
+from datetime import datetime, timezone
+from uuid import UUID
+
+from sqlalchemy import insert
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models.application import Application, ApplicationStatus
+from app.models.application_event import ApplicationStatusEvent
+
+logger = logging.getLogger(__name__)
+
+
+class StatusEventBuffer:
+    """Write-behind buffer for `application_status_events`.
+
+    Request handlers append after their own commit and return; a background
+    loop inserts the buffered rows in one statement per batch. Shutdown
+    flushes whatever is left. A crash loses at most one flush interval of
+    history (never the status change itself).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending: list[dict] = []
+        self._wakeup: asyncio.Event | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._flusher: asyncio.Task | None = None
+
+    def record(
+        self,
+        application: Application,
+        from_status: ApplicationStatus | None,
+        changed_by: UUID | None,
+    ) -> None:
+        """Queue one transition of a committed application."""
+        row = {
+            "application_id": application.id,
+            "job_id": application.job_id,
+            "apprentice_id": application.apprentice_id,
+            "from_status": from_status,
+            "to_status": application.status,
+            "changed_by": changed_by,
+            "changed_at": datetime.now(timezone.utc),
+        }
+        with self._lock:
+            self._pending.append(row)
+            overflow = len(self._pending) - settings.STATUS_HISTORY_MAX_BUFFER
+            if overflow > 0:
+                # The database has been unreachable for a while; keep the newest
+                del self._pending[:overflow]
+                logger.warning("Status history buffer full, dropped %d events", overflow)
+            full = len(self._pending) >= settings.STATUS_HISTORY_BATCH_SIZE
+        if full and self._loop is not None:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    def flush(self) -> int:
+        """Insert everything buffered so far. Rows are put back if the insert fails."""
+        with self._lock:
+            batch, self._pending = self._pending, []
+        if not batch:
+            return 0
+        try:
+            with SessionLocal() as db:
+                for start in range(0, len(batch), settings.STATUS_HISTORY_BATCH_SIZE):
+                    chunk = batch[start : start + settings.STATUS_HISTORY_BATCH_SIZE]
+                    db.execute(insert(ApplicationStatusEvent), chunk)
+                db.commit()
+        except Exception:
+            with self._lock:
+                self._pending[:0] = batch
+            raise
+        return len(batch)
+
+    def start(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self._flusher = asyncio.create_task(self._flush_forever())
+
+    async def stop(self) -> None:
+        """Stop the loop and flush the remainder."""
+        if self._flusher is not None:
+            self._flusher.cancel()
+            await asyncio.gather(self._flusher, return_exceptions=True)
+            self._flusher = None
+        self._loop = None
+        try:
+            flushed = await asyncio.to_thread(self.flush)
+        except Exception:
+            logger.exception("Final status history flush failed (%d events)", len(self._pending))
+        else:
+            if flushed:
+                logger.info("Flushed %d status history events on shutdown", flushed)
+
+    async def _flush_forever(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(
+                    self._wakeup.wait(), timeout=settings.STATUS_HISTORY_FLUSH_SECONDS
+                )
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                await asyncio.to_thread(self.flush)
+            except Exception:
+                logger.exception("Status history flush failed, will retry")
+
+
+# Singleton instance
+status_history = StatusEventBuffer()
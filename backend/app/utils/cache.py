@@ -0,0 +1,80 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+
+# Invalidations are counted per shard of keys: enough shards that a write
+# rarely cancels a load of another key, while the counters stay a fixed size
+_SHARDS = 256
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries also expire after `ttl` seconds.
+
+    `get_or_load` refuses to store a value if its key (or another key in the
+    same shard) was invalidated while it was loading, so a read racing a write
+    can't re-cache the old object.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        # key -> (expires_at, value), least recently used first
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._generations = [0] * _SHARDS
+        # Bumped by `clear`, which cancels every load in flight
+        self._epoch = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """Cached value, or `loader()` (cached unless it returns None)."""
+        value = self.get(key)
+        if value is not None:
+            return value
+        stamp = self._stamp(key)
+        value = loader()
+        if value is not None:
+            self._set(key, value, stamp)
+        return value
+
+    def _stamp(self, key: Hashable) -> tuple[int, int]:
+        return self._epoch, self._generations[hash(key) % _SHARDS]
+
+    def _set(self, key: Hashable, value: Any, stamp: tuple[int, int]) -> None:
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            if stamp != self._stamp(key):
+                return
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._generations[hash(key) % _SHARDS] += 1
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._epoch += 1
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
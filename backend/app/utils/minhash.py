@@ -0,0 +1,111 @@
+import re
+import threading
+from collections.abc import Hashable, Iterable
+
+_WORD = re.compile(r"[a-z0-9]+")
+
+# Signature length and banding: 16 bands of 4 rows make pairs above ~0.5
+# Jaccard likely to share a bucket; candidates are then checked exactly
+# against the caller's threshold
+NUM_HASHES = 64
+BANDS = 16
+ROWS = NUM_HASHES // BANDS
+_MAX_HASH = (1 << 64) - 1
+
+
+def shingles(text: str, size: int = 3) -> set[tuple[str, ...]]:
+    """Overlapping word `size`-grams of the normalized text."""
+    words = _WORD.findall(text.lower())
+    if len(words) <= size:
+        return {tuple(words)} if words else set()
+    return set(zip(*(words[i:] for i in range(size))))
+
+
+def signature(features: Iterable[Hashable]) -> tuple[int, ...]:
+    """One-permutation MinHash: hash each feature once, keep the minimum per bin.
+
+    Costs one hash per shingle instead of one per shingle per permutation. Empty
+    bins borrow the next filled bin's value (rotation densification) so short
+    texts still compare correctly. Uses the built-in hash, which is randomized
+    per process for strings: signatures are only comparable within one process.
+    """
+    bins = [_MAX_HASH] * NUM_HASHES
+    for feature in features:
+        value = hash(feature) & _MAX_HASH
+        index = value % NUM_HASHES
+        value //= NUM_HASHES
+        if value < bins[index]:
+            bins[index] = value
+    if all(v == _MAX_HASH for v in bins):
+        return tuple(bins)
+    for index in range(NUM_HASHES):
+        if bins[index] == _MAX_HASH:
+            offset = 1
+            while bins[(index + offset) % NUM_HASHES] == _MAX_HASH:
+                offset += 1
+            # Distance-tagged so borrowed values only match the same borrowing
+            bins[index] = bins[(index + offset) % NUM_HASHES] + offset * _MAX_HASH
+    return tuple(bins)
+
+
+def similarity(a: tuple[int, ...], b: tuple[int, ...]) -> float:
+    """Estimated Jaccard similarity of the sets behind two signatures."""
+    return sum(x == y for x, y in zip(a, b)) / NUM_HASHES
+
+
+class MinHashLSH:
+    """Thread-safe banded LSH index over MinHash signatures."""
+
+    def __init__(self):
+        self._signatures: dict[Hashable, tuple[int, ...]] = {}
+        self._buckets: list[dict[tuple[int, ...], set[Hashable]]] = [{} for _ in range(BANDS)]
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _bands(sig: tuple[int, ...]) -> list[tuple[int, ...]]:
+        return [sig[band * ROWS : (band + 1) * ROWS] for band in range(BANDS)]
+
+    def add(self, key: Hashable, sig: tuple[int, ...]) -> None:
+        with self._lock:
+            self._remove(key)
+            self._signatures[key] = sig
+            for buckets, band in zip(self._buckets, self._bands(sig)):
+                buckets.setdefault(band, set()).add(key)
+
+    def remove(self, key: Hashable) -> None:
+        with self._lock:
+            self._remove(key)
+
+    def _remove(self, key: Hashable) -> None:
+        sig = self._signatures.pop(key, None)
+        if sig is None:
+            return
+        for buckets, band in zip(self._buckets, self._bands(sig)):
+            bucket = buckets.get(band)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del buckets[band]
+
+    def query(
+        self, sig: tuple[int, ...], threshold: float, exclude: Hashable | None = None
+    ) -> list[tuple[Hashable, float]]:
+        """Keys whose estimated similarity is at least `threshold`, best first."""
+        with self._lock:
+            candidates = set()
+            for buckets, band in zip(self._buckets, self._bands(sig)):
+                candidates.update(buckets.get(band, ()))
+            candidates.discard(exclude)
+            matches = [(key, similarity(sig, self._signatures[key])) for key in candidates]
+        matches = [(key, score) for key, score in matches if score >= threshold]
+        matches.sort(key=lambda match: match[1], reverse=True)
+        return matches
+
+    def clear(self) -> None:
+        with self._lock:
+            self._signatures.clear()
+            for buckets in self._buckets:
+                buckets.clear()
+
+    def __len__(self) -> int:
+        return len(self._signatures)
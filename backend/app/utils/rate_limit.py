@@ -0,0 +1,143 @@
+import time
+from dataclasses import dataclass
+from typing import Protocol
+
+
+@dataclass(frozen=True)
+class RateLimitPolicy:
+    """`capacity` requests burst, refilled at `capacity / period` per second."""
+
+    name: str
+    capacity: int
+    period: float
+    methods: frozenset[str] | None = None
+    path_prefix: str = "/"
+    exact_path: bool = False
+    # "ip", or "user" (falls back to the client IP for anonymous requests)
+    key_by: str = "ip"
+
+    @property
+    def rate(self) -> float:
+        return self.capacity / self.period
+
+    def matches(self, method: str, path: str) -> bool:
+        if self.methods is not None and method not in self.methods:
+            return False
+        if self.exact_path:
+            return path.rstrip("/") == self.path_prefix.rstrip("/")
+        return path.startswith(self.path_prefix)
+
+
+class InMemoryRateLimiter:
+    """Per-process token buckets.
+
+    Only ever touched from the event loop thread, so no locking is needed: each
+    decision is a dict lookup and a little float arithmetic.
+    """
+
+    def __init__(self, max_keys: int = 100_000):
+        self.max_keys = max_keys
+        # key -> [tokens, last refill timestamp]
+        self._buckets: dict[str, list[float]] = {}
+
+    def hit(self, key: str, policy: RateLimitPolicy) -> float:
+        """Consume one token; return 0 if allowed, else seconds until allowed."""
+        now = time.monotonic()
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            if len(self._buckets) >= self.max_keys:
+                self._prune(now, policy)
+            self._buckets[key] = [policy.capacity - 1.0, now]
+            return 0.0
+
+        tokens = min(policy.capacity, bucket[0] + (now - bucket[1]) * policy.rate)
+        bucket[1] = now
+        if tokens >= 1.0:
+            bucket[0] = tokens - 1.0
+            return 0.0
+        bucket[0] = tokens
+        return (1.0 - tokens) / policy.rate
+
+    def _prune(self, now: float, policy: RateLimitPolicy) -> None:
+        """Drop buckets idle long enough to have refilled completely."""
+        idle = policy.period
+        stale = [k for k, (_, updated) in self._buckets.items() if now - updated >= idle]
+        for key in stale:
+            del self._buckets[key]
+        if len(self._buckets) >= self.max_keys:
+            self._buckets.clear()
+
+
+class BucketStore(Protocol):
+    def acquire(
+        self, key: str, capacity: int, rate: float, want: int
+    ) -> tuple[int, float]:
+        """Take up to `want` whole tokens from the shared bucket.
+
+        Returns (tokens granted, tokens that were available).
+        """
+
+
+class LeasedRateLimiter:
+    """Shared (multi-node) buckets with local token leases.
+
+    Each worker takes a small batch of tokens from the shared bucket and spends
+    them locally, so most decisions never leave the process; the store is only
+    consulted when the lease runs out. Denials are cached until the bucket is
+    expected to have a token again.
+    """
+
+    def __init__(self, store: BucketStore, lease_fraction: float = 0.1, max_keys: int = 100_000):
+        self.store = store
+        self.lease_fraction = lease_fraction
+        self.max_keys = max_keys
+        # key -> [remaining leased tokens, monotonic time leased]; spent leases are dropped
+        self._leases: dict[str, list[float]] = {}
+        # key -> monotonic time before which requests are denied without asking
+        self._denied_until: dict[str, float] = {}
+
+    def try_local(self, key: str) -> float | None:
+        """Decide from local state if possible: 0 allowed, >0 retry-after, None unknown."""
+        denied_until = self._denied_until.get(key)
+        if denied_until is not None:
+            wait = denied_until - time.monotonic()
+            if wait > 0:
+                return wait
+            del self._denied_until[key]
+
+        lease = self._leases.get(key)
+        if lease is not None:
+            lease[0] -= 1
+            if lease[0] <= 0:
+                del self._leases[key]
+            return 0.0
+        return None
+
+    def refill(self, key: str, policy: RateLimitPolicy) -> float:
+        """Lease tokens from the shared store (blocking) and consume one."""
+        want = max(1, int(policy.capacity * self.lease_fraction))
+        granted, available = self.store.acquire(key, policy.capacity, policy.rate, want)
+        now = time.monotonic()
+        if len(self._leases) + len(self._denied_until) >= self.max_keys:
+            self._prune(now, policy)
+        if granted <= 0:
+            wait = (1.0 - available) / policy.rate
+            self._denied_until[key] = now + wait
+            return wait
+        lease = self._leases.get(key)
+        remaining = (lease[0] if lease is not None else 0) + granted - 1
+        if remaining > 0:
+            self._leases[key] = [remaining, now]
+        else:
+            self._leases.pop(key, None)
+        return 0.0
+
+    def _prune(self, now: float, policy: RateLimitPolicy) -> None:
+        """Drop lapsed denials and leases idle long enough for the shared bucket
+        to have refilled completely (their tokens are simply not returned)."""
+        self._denied_until = {k: t for k, t in self._denied_until.items() if t > now}
+        idle = policy.period
+        self._leases = {k: v for k, v in self._leases.items() if now - v[1] < idle}
+        if len(self._leases) + len(self._denied_until) >= self.max_keys:
+            self._leases.clear()
+            self._denied_until.clear()
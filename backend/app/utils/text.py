@@ -0,0 +1,11 @@
+# Characters of description shown on job cards and candidate results
+SNIPPET_LENGTH = 200
+
+
+def make_snippet(text: str | None, length: int = SNIPPET_LENGTH) -> str:
+    """Whitespace-collapsed prefix of `text`, cut at a word boundary."""
+    text = " ".join((text or "").split())
+    if len(text) <= length:
+        return text
+    cut = text.rfind(" ", 0, length)
+    return text[: cut if cut > 0 else length].rstrip(" ,.;:") + "..."
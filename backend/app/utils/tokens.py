@@ -0,0 +1,22 @@
+import math
+
+# Rough average for English prose with BPE tokenizers; errs on the high side
+CHARS_PER_TOKEN = 3.5
+
+# Role markers and separators added around each chat message
+MESSAGE_OVERHEAD_TOKENS = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap, conservative token estimate for budgeting prompts (no tokenizer needed)."""
+    if not text:
+        return 0
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Cut `text` so that its estimated size fits in `max_tokens`."""
+    max_chars = int(max_tokens * CHARS_PER_TOKEN)
+    if len(text) <= max_chars:
+        return text
+    return text[: max(0, max_chars - 3)] + "..."
@@ -0,0 +1,138 @@
+"""CPU cost vs. bytes saved when compressing typical job list responses.
+
+Builds synthetic `JobListResponse` / summary payloads shaped like the API's
+output (stdlib only, no database needed) and times each codec/level.
+
+    python benchmarks/bench_compression.py
+"""
+import gzip
+import json
+import random
+import time
+import uuid
+from datetime import date, datetime, timedelta, timezone
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+WORDS = (
+    "automate workflow zapier make n8n python script api integration crm hubspot "
+    "salesforce spreadsheet google sheets airtable notion slack webhook email parse "
+    "invoice pdf extract data scrape dashboard report weekly sync contacts llm openai "
+    "prompt agent chatbot support tickets classify route leads enrich schedule deploy"
+).split()
+
+
+def _text(rng: random.Random, words: int) -> str:
+    sentences = []
+    while words > 0:
+        n = min(words, rng.randint(8, 18))
+        sentence = " ".join(rng.choice(WORDS) for _ in range(n))
+        sentences.append(sentence.capitalize() + ".")
+        words -= n
+    return " ".join(sentences)
+
+
+def _user(rng: random.Random) -> dict:
+    return {
+        "id": str(uuid.UUID(int=rng.getrandbits(128))),
+        "email": f"sponsor{rng.randint(1, 10_000)}@example.com",
+        "role": "sponsor",
+        "full_name": "Alex Example",
+        "bio": _text(rng, 40),
+        "company_name": "Example Automation Ltd",
+        "company_website": "https://example.com",
+        "portfolio_url": None,
+        "github_url": None,
+        "linkedin_url": None,
+        "created_at": datetime(2025, 1, 1, tzinfo=timezone.utc).isoformat(),
+    }
+
+
+def job_list_page(rng: random.Random, size: int) -> bytes:
+    jobs = []
+    for _ in range(size):
+        sponsor = _user(rng)
+        budget_min = rng.choice([100, 250, 500, 1000])
+        jobs.append(
+            {
+                "id": str(uuid.UUID(int=rng.getrandbits(128))),
+                "sponsor_id": sponsor["id"],
+                "title": _text(rng, 7)[:60],
+                "description": _text(rng, rng.randint(150, 400)),
+                "requirements": _text(rng, 40),
+                "budget_min": budget_min,
+                "budget_max": budget_min * 2,
+                "budget_type": rng.choice(["fixed", "hourly"]),
+                "estimated_hours": rng.randint(2, 80),
+                "deadline": (date(2026, 11, 1) + timedelta(days=rng.randint(0, 90))).isoformat(),
+                "status": "open",
+                "ai_generated_description": rng.random() < 0.3,
+                "created_at": datetime(2026, 10, 1, tzinfo=timezone.utc).isoformat(),
+                "application_count": rng.randint(0, 40),
+                "sponsor": sponsor,
+            }
+        )
+    return json.dumps({"jobs": jobs, "total": 12_345}).encode()
+
+
+def summary_page(rng: random.Random, size: int) -> bytes:
+    data = json.loads(job_list_page(rng, size))
+    for job in data["jobs"]:
+        job["snippet"] = job.pop("description")[:200] + "..."
+        job["sponsor_name"] = job.pop("sponsor")["company_name"]
+        job.pop("requirements")
+    return json.dumps(data).encode()
+
+
+def _codecs():
+    codecs = [
+        (f"gzip-{level}", lambda b, lv=level: gzip.compress(b, lv, mtime=0))
+        for level in (1, 4, 6, 9)
+    ]
+    if brotli is not None:
+        codecs += [
+            (f"br-{q}", lambda b, q=q: brotli.compress(b, quality=q)) for q in (1, 4, 6, 11)
+        ]
+    return codecs
+
+
+def measure(payload: bytes, compress, min_time: float = 0.2) -> tuple[float, int]:
+    """Return (mean seconds per call, compressed size)."""
+    out = compress(payload)
+    calls, start = 0, time.perf_counter()
+    while time.perf_counter() - start < min_time:
+        compress(payload)
+        calls += 1
+    return (time.perf_counter() - start) / calls, len(out)
+
+
+def main() -> None:
+    rng = random.Random(42)
+    payloads = [
+        ("full, 20 jobs", job_list_page(rng, 20)),
+        ("full, 100 jobs", job_list_page(rng, 100)),
+        ("summary, 20 jobs", summary_page(rng, 20)),
+        ("summary, 100 jobs", summary_page(rng, 100)),
+    ]
+    if brotli is None:
+        print("(brotli not installed; pip install '.[perf]' to include it)\n")
+
+    print(f"{'payload':<18} {'codec':<8} {'raw KB':>8} {'out KB':>8} {'saved':>7} "
+          f"{'ms/call':>8} {'MB/s':>8} {'KB saved/ms':>12}")
+    for name, payload in payloads:
+        for codec_name, compress in _codecs():
+            seconds, size = measure(payload, compress)
+            saved = len(payload) - size
+            print(
+                f"{name:<18} {codec_name:<8} {len(payload) / 1024:>8.1f} {size / 1024:>8.1f} "
+                f"{saved / len(payload):>7.1%} {seconds * 1000:>8.3f} "
+                f"{len(payload) / seconds / 1e6:>8.1f} {saved / 1024 / (seconds * 1000):>12.1f}"
+            )
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Near-duplicate detection: signature and lookup cost, and accuracy.
+
+Indexes synthetic job postings, then queries with lightly edited reposts
+(should match) and unrelated postings (should not), reporting per-call
+timings and hit rates (stdlib only, no database needed).
+
+    python benchmarks/bench_dedupe.py --jobs 100000
+"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.utils.minhash import MinHashLSH, shingles, signature  # noqa: E402
+
+WORDS = (
+    "automate workflow zapier make n8n python script api integration crm hubspot "
+    "salesforce spreadsheet google sheets airtable notion slack webhook email parse "
+    "invoice pdf extract data scrape dashboard report weekly sync contacts llm openai "
+    "prompt agent chatbot support tickets classify route leads enrich schedule deploy "
+    "shopify orders inventory stripe payments quickbooks calendar meeting transcript"
+).split()
+
+THRESHOLD = 0.8
+
+
+def posting(rng: random.Random, words: int = 120) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+def repost(rng: random.Random, text: str, edits: int = 3) -> str:
+    """Same posting with a few words changed, as a sponsor re-posting would."""
+    words = text.split()
+    for _ in range(edits):
+        words[rng.randrange(len(words))] = rng.choice(WORDS)
+    return " ".join(words)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=20_000)
+    parser.add_argument("--queries", type=int, default=1_000)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    texts = [posting(rng) for _ in range(args.jobs)]
+
+    index = MinHashLSH()
+    start = time.perf_counter()
+    for job_id, text in enumerate(texts):
+        index.add(job_id, signature(shingles(text)))
+    build = time.perf_counter() - start
+
+    queries = [(True, repost(rng, rng.choice(texts))) for _ in range(args.queries)]
+    queries += [(False, posting(rng)) for _ in range(args.queries)]
+
+    sig_time = lookup_time = 0.0
+    hits = false_hits = 0
+    for is_duplicate, text in queries:
+        t0 = time.perf_counter()
+        sig = signature(shingles(text))
+        t1 = time.perf_counter()
+        matches = index.query(sig, THRESHOLD)
+        t2 = time.perf_counter()
+        sig_time += t1 - t0
+        lookup_time += t2 - t1
+        if matches and is_duplicate:
+            hits += 1
+        elif matches:
+            false_hits += 1
+
+    n = len(queries)
+    print(f"indexed {args.jobs} jobs in {build:.2f} s ({build / args.jobs * 1e6:.0f} us/job)")
+    print(f"signature: {sig_time / n * 1e6:.0f} us/query, "
+          f"lookup: {lookup_time / n * 1e6:.0f} us/query")
+    print(f"reposts flagged: {hits / args.queries:.1%}, "
+          f"unrelated flagged: {false_hits / args.queries:.1%} (threshold {THRESHOLD})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Import-time profile of the application.
+
+Runs `python -X importtime -c "import app.main"` in a fresh interpreter and
+reports the total import time, the RSS after import and the slowest
+top-level packages (cumulative), so cold-start regressions show up as a
+number. Needs the backend dependencies installed; no database is contacted.
+
+    python benchmarks/bench_imports.py
+    python benchmarks/bench_imports.py --module app.api.jobs --top 30
+"""
+import argparse
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# Peak RSS in MB (ru_maxrss is in KB on Linux)
+_REPORT_RSS = "import resource; print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024)"
+
+
+def profile(module: str) -> tuple[list[tuple[str, int, int]], float]:
+    """(module, self us, cumulative us) rows from -X importtime, plus peak RSS in MB."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}; {_REPORT_RSS}"],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        sys.exit(result.stderr.strip().splitlines()[-1])
+
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((name.rstrip(), int(self_us), int(cumulative_us)))
+    return rows, float(result.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default="app.main")
+    parser.add_argument("--top", type=int, default=20)
+    args = parser.parse_args()
+
+    rows, rss = profile(args.module)
+
+    # Self time summed per root package (e.g. every pydantic.* submodule)
+    packages: dict[str, int] = defaultdict(int)
+    for name, self_us, _ in rows:
+        packages[name.strip().split(".")[0]] += self_us
+    total_us = sum(self_us for _, self_us, _ in rows)
+
+    print(f"import {args.module}: {total_us / 1000:.0f} ms, {len(rows)} modules, "
+          f"peak RSS {rss:.1f} MB\n")
+    print(f"{'package':<28} {'self ms':>8} {'share':>7}")
+    ranked = sorted(packages.items(), key=lambda item: item[1], reverse=True)
+    for name, self_us in ranked[: args.top]:
+        print(f"{name:<28} {self_us / 1000:>8.1f} {self_us / total_us:>7.1%}")
+
+
+if __name__ == "__main__":
+    main()
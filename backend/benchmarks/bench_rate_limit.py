@@ -0,0 +1,66 @@
+"""Cost of a rate limit decision.
+
+Times the in-process token bucket and the leased (shared-store) limiter with a
+fake store, so the numbers show the per-request overhead the middleware adds
+on the hot path (stdlib only, no database needed).
+
+    python benchmarks/bench_rate_limit.py
+"""
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.utils.rate_limit import (  # noqa: E402
+    InMemoryRateLimiter,
+    LeasedRateLimiter,
+    RateLimitPolicy,
+)
+
+CALLS = 200_000
+
+
+class FakeStore:
+    """Always grants what is asked for; counts round trips."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def acquire(self, key, capacity, rate, want):
+        self.calls += 1
+        return want, float(capacity)
+
+
+def measure(decide, keys: list[str]) -> float:
+    n = len(keys)
+    start = time.perf_counter()
+    for i in range(CALLS):
+        decide(keys[i % n])
+    return (time.perf_counter() - start) / CALLS
+
+
+def main() -> None:
+    policy = RateLimitPolicy("bench", capacity=1_000_000, period=60)
+    print(f"{'limiter':<28} {'keys':>7} {'us/decision':>12} {'store calls':>12}")
+    for n_keys in (1, 1_000, 50_000):
+        keys = [f"bench:ip:10.0.{i // 256}.{i % 256}" for i in range(n_keys)]
+
+        memory = InMemoryRateLimiter()
+        seconds = measure(lambda key: memory.hit(key, policy), keys)
+        print(f"{'in-memory':<28} {n_keys:>7} {seconds * 1e6:>12.3f} {'-':>12}")
+
+        store = FakeStore()
+        leased = LeasedRateLimiter(store, lease_fraction=0.001)
+
+        def decide(key: str) -> float:
+            decision = leased.try_local(key)
+            return decision if decision is not None else leased.refill(key, policy)
+
+        seconds = measure(decide, keys)
+        print(f"{'leased (1000-token lease)':<28} {n_keys:>7} {seconds * 1e6:>12.3f} "
+              f"{store.calls:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Measure production server startup time and memory per worker.
+
+Starts gunicorn with gunicorn.conf.py, waits until /health answers, then
+reports the time to first response and the RSS of the master and each
+worker (Linux /proc). Needs the backend dependencies installed; the
+database is optional (pool warmup failures are logged, not fatal).
+
+    python benchmarks/bench_startup.py --workers 4
+"""
+import argparse
+import os
+import signal
+import subprocess
+import sys
+import time
+import urllib.request
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+
+def rss_mb(pid: int) -> float:
+    with open(f"/proc/{pid}/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+def children(pid: int) -> list[int]:
+    try:
+        with open(f"/proc/{pid}/task/{pid}/children") as f:
+            return [int(p) for p in f.read().split()]
+    except OSError:
+        return []
+
+
+def wait_healthy(url: str, timeout: float) -> None:
+    start = time.perf_counter()
+    while time.perf_counter() - start < timeout:
+        try:
+            with urllib.request.urlopen(url, timeout=1) as response:
+                if response.status == 200:
+                    return
+        except OSError:
+            pass
+        time.sleep(0.05)
+    raise TimeoutError(f"{url} not healthy after {timeout}s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--timeout", type=float, default=60.0)
+    args = parser.parse_args()
+
+    env = {
+        **os.environ,
+        "WEB_CONCURRENCY": str(args.workers),
+        "BIND": f"127.0.0.1:{args.port}",
+        "ACCESS_LOG": "/dev/null",
+    }
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py", "app.main:app"],
+        cwd=BACKEND_DIR,
+        env=env,
+    )
+    try:
+        wait_healthy(f"http://127.0.0.1:{args.port}/health", args.timeout)
+        first_response_ms = (time.perf_counter() - started) * 1000
+        # Give the remaining workers a moment to finish booting
+        deadline = time.perf_counter() + args.timeout
+        while len(children(server.pid)) < args.workers and time.perf_counter() < deadline:
+            time.sleep(0.05)
+        time.sleep(1.0)
+
+        workers = children(server.pid)
+        worker_rss = [rss_mb(pid) for pid in workers]
+        print()
+        print(f"workers:              {len(workers)}")
+        print(f"first /health 200:    {first_response_ms:.0f} ms after launch")
+        print(f"master RSS:           {rss_mb(server.pid):.1f} MB")
+        if worker_rss:
+            print(f"worker RSS (each):    {', '.join(f'{r:.1f}' for r in worker_rss)} MB")
+            print(f"worker RSS (mean):    {sum(worker_rss) / len(worker_rss):.1f} MB")
+    finally:
+        server.send_signal(signal.SIGTERM)
+        shutdown_started = time.perf_counter()
+        server.wait(timeout=60)
+        print(f"graceful shutdown:    {(time.perf_counter() - shutdown_started) * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
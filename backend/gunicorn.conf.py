@@ -0,0 +1,70 @@
+"""Production server settings: gunicorn managing uvicorn workers.
+
+    gunicorn -c gunicorn.conf.py app.main:app
+
+Every setting can be overridden from the environment (e.g. WEB_CONCURRENCY=4).
+"""
+import logging
+import multiprocessing
+import os
+import time
+
+bind = os.getenv("BIND", "0.0.0.0:8000")
+
+# The app is async, so one worker per core keeps every core busy
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+# Tell the app how many siblings share the host (it sizes per-worker pools by it)
+os.environ["WEB_CONCURRENCY"] = str(workers)
+
+# UvicornWorker picks uvloop and httptools when installed (uvicorn[standard])
+worker_class = "uvicorn.workers.UvicornWorker"
+
+# Import the app once in the master; workers fork with it already loaded
+preload_app = True
+
+# Let in-flight requests and background tasks finish on SIGTERM
+graceful_timeout = int(os.getenv("GRACEFUL_TIMEOUT", "30"))
+timeout = int(os.getenv("WORKER_TIMEOUT", "60"))
+keepalive = int(os.getenv("KEEPALIVE", "5"))
+
+# Recycle workers periodically to bound memory growth
+max_requests = int(os.getenv("MAX_REQUESTS", "10000"))
+max_requests_jitter = int(os.getenv("MAX_REQUESTS_JITTER", "1000"))
+
+accesslog = os.getenv("ACCESS_LOG", "-")
+loglevel = os.getenv("LOG_LEVEL", "info")
+
+_boot_started = time.perf_counter()
+
+
+def on_starting(server):
+    # Send the app's own logs (worker startup report, background tasks) to
+    # gunicorn's error log
+    app_logger = logging.getLogger("app")
+    app_logger.setLevel(loglevel.upper())
+    for handler in server.log.error_log.handlers:
+        app_logger.addHandler(handler)
+
+
+def when_ready(server):
+    # Modules the app imports lazily are loaded once here, before forking
+    import importlib
+
+    from app.main import LAZY_MODULES
+
+    for name in LAZY_MODULES:
+        importlib.import_module(name)
+
+    server.log.info(
+        "Master ready in %.0f ms (app preloaded), starting %d workers",
+        (time.perf_counter() - _boot_started) * 1000,
+        server.num_workers,
+    )
+
+
+def post_fork(server, worker):
+    # Connections opened while preloading belong to the master; each worker
+    # must build its own pool
+    from app.database import engine
+
+    engine.dispose(close=False)
@@ -0,0 +1,102 @@
+import os
+from uuid import uuid4
+
+import httpx
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import Base
+from app.models.job import Job
+from app.models.user import User, UserRole
+from app.services.ai_service import AIService
+
+
+@pytest.fixture
+def ai_settings(monkeypatch):
+    """Fast retries and a small breaker, so fault scenarios run in milliseconds."""
+    monkeypatch.setattr(settings, "OPENROUTER_API_KEY", "test-key")
+    monkeypatch.setattr(settings, "AI_MAX_RETRIES", 2)
+    monkeypatch.setattr(settings, "AI_RETRY_BASE_DELAY", 0.0)
+    monkeypatch.setattr(settings, "AI_RETRY_MAX_DELAY", 1.0)
+    monkeypatch.setattr(settings, "AI_BREAKER_FAILURE_THRESHOLD", 2)
+    monkeypatch.setattr(settings, "AI_BREAKER_RESET_SECONDS", 30.0)
+    return settings
+
+
+@pytest.fixture
+async def make_service(ai_settings):
+    """Build an AIService whose OpenRouter is a fault-injecting MockTransport."""
+    services = []
+
+    def make(handler) -> AIService:
+        service = AIService(transport=httpx.MockTransport(handler))
+        services.append(service)
+        return service
+
+    yield make
+    for service in services:
+        await service.aclose()
+
+
+@pytest.fixture(scope="session")
+def db_engine():
+    """A scratch Postgres database from TEST_DATABASE_URL; tests needing it are
+    skipped when it isn't set. Every table is dropped and recreated."""
+    url = os.environ.get("TEST_DATABASE_URL")
+    if not url:
+        pytest.skip("TEST_DATABASE_URL is not set")
+    import app.models  # noqa: F401  (registers every table)
+
+    engine = create_engine(url)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    yield engine
+    Base.metadata.drop_all(engine)
+    engine.dispose()
+
+
+@pytest.fixture
+def db(db_engine):
+    """Session whose commits only release savepoints; everything is rolled back."""
+    connection = db_engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
+    yield session
+    session.close()
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture
+def make_user(db):
+    def make(role: UserRole = UserRole.SPONSOR, **fields) -> User:
+        user = User(
+            email=fields.pop("email", f"{uuid4().hex}@example.com"),
+            password_hash="x",
+            role=role,
+            full_name=fields.pop("full_name", "Test User"),
+            **fields,
+        )
+        db.add(user)
+        db.flush()
+        return user
+
+    return make
+
+
+@pytest.fixture
+def make_job(db):
+    def make(sponsor: User, **fields) -> Job:
+        job = Job(
+            sponsor_id=sponsor.id,
+            title=fields.pop("title", "Automate invoice intake"),
+            description=fields.pop("description", "Parse emailed PDFs into the ledger"),
+            **fields,
+        )
+        db.add(job)
+        db.flush()
+        return job
+
+    return make
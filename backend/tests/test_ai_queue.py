@@ -0,0 +1,68 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.config import settings
+from app.models.ai_task import AITask, AITaskStatus
+from app.services import ai_queue
+from app.services.ai_queue import AIWorkerPool, claim_next
+from app.services.ai_service import AIServiceUnavailable
+
+
+@pytest.fixture
+def finished(monkeypatch):
+    """Capture `_finish` writes instead of opening a real session."""
+    calls = []
+    monkeypatch.setattr(ai_queue, "_finish", lambda task_id, **values: calls.append(values))
+    return calls
+
+
+def test_claim_skips_tasks_backing_off(db, make_user):
+    user = make_user()
+    later = AITask(
+        user_id=user.id,
+        kind="match_jobs",
+        payload={},
+        available_at=datetime.now(timezone.utc) + timedelta(minutes=1),
+    )
+    now = AITask(user_id=user.id, kind="match_jobs", payload={})
+    db.add(later)
+    db.flush()
+    db.add(now)
+    db.flush()
+
+    assert claim_next(db).id == now.id
+    assert claim_next(db) is None
+
+
+async def test_unavailable_upstream_requeues_with_backoff(monkeypatch, finished):
+    async def unavailable(payload):
+        raise AIServiceUnavailable("breaker open")
+
+    monkeypatch.setitem(ai_queue.HANDLERS, "match_jobs", unavailable)
+    monkeypatch.setattr(settings, "AI_TASK_MAX_ATTEMPTS", 3)
+
+    before = datetime.now(timezone.utc)
+    await AIWorkerPool()._run("task", "match_jobs", {}, attempts=2)
+
+    [values] = finished
+    assert values["status"] == AITaskStatus.QUEUED
+    assert values["available_at"] >= before + timedelta(seconds=10)
+
+
+async def test_cancelled_task_is_handed_back(monkeypatch, finished):
+    started = asyncio.Event()
+
+    async def slow(payload):
+        started.set()
+        await asyncio.sleep(60)
+
+    monkeypatch.setitem(ai_queue.HANDLERS, "match_jobs", slow)
+    run = asyncio.create_task(AIWorkerPool()._run("task", "match_jobs", {}, attempts=1))
+    await started.wait()
+    run.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await run
+
+    assert finished == [{"status": AITaskStatus.QUEUED}]
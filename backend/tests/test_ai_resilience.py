@@ -0,0 +1,194 @@
+import asyncio
+from types import SimpleNamespace
+from uuid import uuid4
+
+import httpx
+import pytest
+from fastapi import HTTPException
+
+from app.api.ai import enforce_ai_quota
+from app.services.ai_service import AIServiceUnavailable, ai_service
+from app.utils.resilience import CircuitBreaker, CircuitBreakerOpen
+
+MESSAGES = [{"role": "user", "content": "hi"}]
+
+
+def completion(content: str = "ok") -> httpx.Response:
+    return httpx.Response(200, json={"choices": [{"message": {"content": content}}]})
+
+
+def scripted(*responses):
+    """Handler replying with `responses` in order, then repeating the last one."""
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return responses[min(len(calls), len(responses)) - 1]
+
+    return handler, calls
+
+
+def open_to_half_open(breaker: CircuitBreaker) -> None:
+    breaker.opened_at -= breaker.reset_timeout
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+
+
+async def test_429_retry_after_is_honoured(make_service):
+    handler, calls = scripted(
+        httpx.Response(429, headers={"Retry-After": "0"}),
+        completion("done"),
+    )
+    service = make_service(handler)
+
+    assert await service._call_llm(MESSAGES, 10, "model") == "done"
+    assert len(calls) == 2
+    assert service.breaker_for("model").failures == 0
+
+
+async def test_retry_after_beyond_max_delay_gives_up_at_once(make_service):
+    handler, calls = scripted(httpx.Response(429, headers={"Retry-After": "120"}))
+    service = make_service(handler)
+
+    with pytest.raises(AIServiceUnavailable):
+        await service._call_llm(MESSAGES, 10, "model")
+    assert len(calls) == 1
+
+
+async def test_retries_exhausted(make_service, ai_settings):
+    handler, calls = scripted(httpx.Response(503))
+    service = make_service(handler)
+
+    with pytest.raises(AIServiceUnavailable) as exc_info:
+        await service._call_llm(MESSAGES, 10, "model")
+    assert len(calls) == ai_settings.AI_MAX_RETRIES + 1
+    assert isinstance(exc_info.value.__cause__, httpx.HTTPStatusError)
+    assert service.breaker_for("model").failures == 1
+
+
+async def test_transport_errors_are_retried(make_service):
+    attempts = []
+
+    def handler(request):
+        attempts.append(request)
+        if len(attempts) == 1:
+            raise httpx.ConnectError("refused", request=request)
+        return completion()
+
+    service = make_service(handler)
+    assert await service._call_llm(MESSAGES, 10, "model") == "ok"
+    assert len(attempts) == 2
+
+
+async def test_breaker_opens_half_opens_and_closes(make_service, ai_settings):
+    handler, calls = scripted(httpx.Response(503))
+    service = make_service(handler)
+    breaker = service.breaker_for("model")
+
+    for _ in range(ai_settings.AI_BREAKER_FAILURE_THRESHOLD):
+        with pytest.raises(AIServiceUnavailable):
+            await service._call_llm(MESSAGES, 10, "model")
+    assert breaker.state == CircuitBreaker.OPEN
+
+    # Open: fail fast without reaching the upstream
+    sent = len(calls)
+    with pytest.raises(AIServiceUnavailable):
+        await service._call_llm(MESSAGES, 10, "model")
+    assert len(calls) == sent
+
+    # Half-open: a failed trial opens it again
+    open_to_half_open(breaker)
+    with pytest.raises(AIServiceUnavailable):
+        await service._call_llm(MESSAGES, 10, "model")
+    assert breaker.state == CircuitBreaker.OPEN
+
+    # Half-open: a successful trial closes it
+    open_to_half_open(breaker)
+    handler_ok, _ = scripted(completion("back"))
+    service._transport = httpx.MockTransport(handler_ok)
+    await service.aclose()
+    assert await service._call_llm(MESSAGES, 10, "model") == "back"
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.failures == 0
+
+
+async def test_half_open_admits_one_trial_at_a_time():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+    breaker.record_failure()
+    open_to_half_open(breaker)
+
+    breaker.before_call()
+    with pytest.raises(CircuitBreakerOpen):
+        breaker.before_call()
+
+
+async def test_cancelled_trial_does_not_wedge_breaker(make_service):
+    release = asyncio.Event()
+
+    async def handler(request):
+        await release.wait()
+        return completion()
+
+    service = make_service(handler)
+    breaker = service.breaker_for("model")
+    breaker.record_failure()
+    breaker.record_failure()
+    open_to_half_open(breaker)
+
+    trial = asyncio.create_task(service._call_llm(MESSAGES, 10, "model"))
+    await asyncio.sleep(0.01)
+    trial.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await trial
+
+    # The next caller gets the trial slot instead of "half-open" forever
+    release.set()
+    assert await service._call_llm(MESSAGES, 10, "model") == "ok"
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+async def test_unexpected_error_in_trial_reopens_breaker(make_service):
+    def handler(request):
+        raise RuntimeError("stub blew up")
+
+    service = make_service(handler)
+    breaker = service.breaker_for("model")
+    breaker.record_failure()
+    breaker.record_failure()
+    open_to_half_open(breaker)
+
+    with pytest.raises(RuntimeError):
+        await service._call_llm(MESSAGES, 10, "model")
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker._trial_in_flight
+
+
+async def test_wait_for_timeout_does_not_wedge_breaker(make_service):
+    async def handler(request):
+        await asyncio.sleep(10)
+        return completion()
+
+    service = make_service(handler)
+    breaker = service.breaker_for("model")
+    breaker.record_failure()
+    breaker.record_failure()
+    open_to_half_open(breaker)
+
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(service._call_llm(MESSAGES, 10, "model"), timeout=0.01)
+    breaker.before_call()
+
+
+def test_user_quota_allows_burst_then_429():
+    user = SimpleNamespace(id=uuid4())
+    burst = int(ai_service.user_quota.capacity)
+
+    for _ in range(burst):
+        assert enforce_ai_quota(user) is user
+    with pytest.raises(HTTPException) as exc_info:
+        enforce_ai_quota(user)
+    assert exc_info.value.status_code == 429
+    assert int(exc_info.value.headers["Retry-After"]) >= 1
+
+    # Quotas are per user
+    other = SimpleNamespace(id=uuid4())
+    assert enforce_ai_quota(other) is other
@@ -0,0 +1,88 @@
+import asyncio
+import json
+from dataclasses import replace
+
+import httpx
+
+from app.services.ai_providers import TASK_COVER_LETTER, RouteHealth, task_policies
+from app.utils.resilience import CircuitBreaker
+
+MESSAGES = [{"role": "user", "content": "hi"}]
+
+
+def routed(replies: dict):
+    """Handler answering per requested model; `replies[model]` is a Response or
+    an async callable returning one."""
+    calls = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        model = json.loads(request.content)["model"]
+        calls.append(model)
+        reply = replies[model]
+        if callable(reply):
+            return await reply()
+        return reply
+
+    return handler, calls
+
+
+def completion(content: str) -> httpx.Response:
+    return httpx.Response(200, json={"choices": [{"message": {"content": content}}]})
+
+
+def cover_letter_models() -> tuple[str, str]:
+    primary, fallback = task_policies()[TASK_COVER_LETTER].routes
+    return primary.model, fallback.model
+
+
+async def test_fallback_survives_primary_breaker_opening(make_service, ai_settings):
+    primary, fallback = cover_letter_models()
+    handler, calls = routed({primary: httpx.Response(503), fallback: completion("from fallback")})
+    service = make_service(handler)
+
+    for _ in range(ai_settings.AI_BREAKER_FAILURE_THRESHOLD + 1):
+        # Keep trying the primary rather than skipping it while degraded
+        service.route_health = RouteHealth(0)
+        assert await service.run_task(TASK_COVER_LETTER, MESSAGES) == "from fallback"
+
+    assert service.breaker_for(primary).state == CircuitBreaker.OPEN
+    assert service.breaker_for(fallback).state == CircuitBreaker.CLOSED
+
+
+async def test_http_error_on_primary_falls_back(make_service):
+    primary, fallback = cover_letter_models()
+    handler, calls = routed(
+        {
+            primary: httpx.Response(404, json={"error": "model not found"}),
+            fallback: completion("from fallback"),
+        }
+    )
+    service = make_service(handler)
+
+    assert await service.run_task(TASK_COVER_LETTER, MESSAGES) == "from fallback"
+    assert calls == [primary, fallback]
+    assert service.breaker_for(primary).failures == 1
+
+
+async def test_slo_breach_falls_back_without_wedging_primary(make_service):
+    primary, fallback = cover_letter_models()
+
+    async def slow():
+        await asyncio.sleep(10)
+        return completion("too late")
+
+    handler, calls = routed({primary: slow, fallback: completion("from fallback")})
+    service = make_service(handler)
+    service.policies[TASK_COVER_LETTER] = replace(
+        service.policies[TASK_COVER_LETTER], slo_seconds=0.01
+    )
+    breaker = service.breaker_for(primary)
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.opened_at -= breaker.reset_timeout
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+
+    assert await service.run_task(TASK_COVER_LETTER, MESSAGES) == "from fallback"
+
+    # The cancelled trial gave its slot back
+    breaker.before_call()
@@ -0,0 +1,21 @@
+import pytest
+from fastapi import HTTPException
+
+from app.api.analytics import require_analytics_access
+from app.config import settings
+from app.models.user import User
+
+
+def test_analytics_denied_when_no_emails_are_allowed(monkeypatch):
+    monkeypatch.setattr(settings, "ANALYTICS_ALLOWED_EMAILS", [])
+    with pytest.raises(HTTPException) as exc:
+        require_analytics_access(User(email="anyone@example.com"))
+    assert exc.value.status_code == 403
+
+
+def test_analytics_allowed_for_listed_emails_only(monkeypatch):
+    monkeypatch.setattr(settings, "ANALYTICS_ALLOWED_EMAILS", ["ops@example.com"])
+    user = User(email="ops@example.com")
+    assert require_analytics_access(user) is user
+    with pytest.raises(HTTPException):
+        require_analytics_access(User(email="other@example.com"))
@@ -0,0 +1,63 @@
+import io
+
+import pytest
+from fastapi import HTTPException, UploadFile
+
+from app.api.auth import register_apprentices, register_bulk_csv
+from app.config import settings
+from app.models.user import User, UserRole
+from app.services import password_hashing
+from app.services.password_hashing import default_workers, password_hash_pool
+
+
+def test_hash_pool_splits_cpus_between_server_workers(monkeypatch):
+    monkeypatch.setattr(password_hashing.os, "cpu_count", lambda: 8)
+    monkeypatch.setattr(settings, "WEB_CONCURRENCY", 8)
+    assert default_workers() == 1
+    monkeypatch.setattr(settings, "WEB_CONCURRENCY", 2)
+    assert default_workers() == 4
+    monkeypatch.setattr(settings, "WEB_CONCURRENCY", 16)
+    assert default_workers() == 1
+
+
+def test_passwords_are_hashed_with_no_transaction_open(db, make_user, monkeypatch):
+    sponsor = make_user()
+    taken = make_user(email="taken@example.com")
+    db.commit()
+
+    def fake_hash_all(passwords):
+        assert not db.in_transaction()
+        return [f"hashed:{password}" for password in passwords]
+
+    monkeypatch.setattr(password_hash_pool, "hash_all", fake_hash_all)
+    rows = [
+        {"email": "new@example.com", "password": "correct-horse", "full_name": "New"},
+        {"email": taken.email, "password": "correct-horse", "full_name": "Taken"},
+    ]
+    response = register_apprentices(db, sponsor, rows)
+
+    assert (response.created, response.failed) == (1, 1)
+    created = db.query(User).filter(User.email == "new@example.com").one()
+    assert created.password_hash == "hashed:correct-horse"
+
+
+def test_csv_upload_stops_reading_past_the_row_limit(monkeypatch):
+    monkeypatch.setattr(settings, "BULK_REGISTER_MAX_ROWS", 2)
+    lines = [f"user{i}@example.com,correct-horse,User {i}" for i in range(20_000)]
+    upload = io.BytesIO(("email,password,full_name\n" + "\n".join(lines)).encode())
+
+    with pytest.raises(HTTPException) as exc_info:
+        register_bulk_csv(UploadFile(upload), None, User(role=UserRole.SPONSOR))
+
+    assert exc_info.value.status_code == 413
+    assert upload.tell() < len(upload.getvalue()) // 10
+    assert not upload.closed
+
+
+def test_csv_upload_must_be_utf8():
+    upload = io.BytesIO(b"email,password,full_name\n\xff\xfe,x,y\n")
+
+    with pytest.raises(HTTPException) as exc_info:
+        register_bulk_csv(UploadFile(upload), None, User(role=UserRole.SPONSOR))
+
+    assert exc_info.value.status_code == 400
@@ -0,0 +1,35 @@
+from app.utils.cache import TTLCache
+
+
+def load_while(cache: TTLCache, key, during):
+    """get_or_load `key`, running `during()` while the loader is in flight."""
+
+    def loader():
+        during()
+        return "loaded"
+
+    return cache.get_or_load(key, loader)
+
+
+def test_invalidating_another_key_does_not_cancel_a_load():
+    cache = TTLCache(max_size=10, ttl=60)
+
+    load_while(cache, 1, lambda: cache.invalidate(2))
+
+    assert cache.get(1) == "loaded"
+
+
+def test_invalidating_the_same_key_cancels_the_load():
+    cache = TTLCache(max_size=10, ttl=60)
+
+    assert load_while(cache, 1, lambda: cache.invalidate(1)) == "loaded"
+
+    assert cache.get(1) is None
+
+
+def test_clear_cancels_every_load():
+    cache = TTLCache(max_size=10, ttl=60)
+
+    load_while(cache, 1, cache.clear)
+
+    assert cache.get(1) is None
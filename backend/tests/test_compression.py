@@ -0,0 +1,40 @@
+import httpx
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse, PlainTextResponse
+from starlette.routing import Route
+
+from app.middleware.compression import CompressionMiddleware
+
+app = Starlette(
+    routes=[
+        Route("/small", lambda request: JSONResponse({"ok": True})),
+        Route("/large", lambda request: JSONResponse({"jobs": ["x" * 40] * 100})),
+        Route("/binary", lambda request: PlainTextResponse("x" * 2000, media_type="image/png")),
+    ]
+)
+app.add_middleware(CompressionMiddleware, minimum_size=1024)
+
+
+async def get(path: str, accept_encoding: str) -> httpx.Response:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.get(path, headers={"Accept-Encoding": accept_encoding})
+
+
+async def test_compressed_response_varies_on_accept_encoding():
+    response = await get("/large", "gzip")
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+
+
+async def test_uncompressed_variants_still_vary():
+    # No coding accepted, and a body under the threshold
+    for path, accept_encoding in (("/large", "identity"), ("/small", "gzip")):
+        response = await get(path, accept_encoding)
+        assert "content-encoding" not in response.headers
+        assert response.headers["vary"] == "Accept-Encoding"
+
+
+async def test_incompressible_types_do_not_vary():
+    response = await get("/binary", "gzip")
+    assert "vary" not in response.headers
@@ -0,0 +1,31 @@
+from app.models.job import JobStatus
+from app.services.job_dedupe import JobDuplicateIndex
+
+TITLE = "Automate invoice intake from email"
+DESCRIPTION = "Parse emailed PDF invoices and post each line item to the ledger every morning"
+
+
+def test_closed_jobs_are_never_reported_and_are_dropped(db, make_user, make_job):
+    index = JobDuplicateIndex()
+    sponsor = make_user()
+    job = make_job(sponsor, title=TITLE, description=DESCRIPTION)
+    index.update(job)
+    assert [job_id for job_id, _ in index.find_duplicates(db, TITLE, DESCRIPTION)] == [job.id]
+
+    # Closed without this worker hearing about it (e.g. a missed event)
+    job.status = JobStatus.CANCELLED
+    db.flush()
+
+    assert index.find_duplicates(db, TITLE, DESCRIPTION) == []
+    assert len(index.index) == 0
+
+
+def test_resync_event_rebuilds_the_index(monkeypatch, db, make_user, make_job):
+    index = JobDuplicateIndex()
+    index.update(make_job(make_user(), title=TITLE, description=DESCRIPTION))
+    rebuilds = []
+    monkeypatch.setattr(index, "start_rebuild", lambda: rebuilds.append(len(index.index)))
+
+    index.handle_event({"topic": "system", "type": "resync"})
+
+    assert rebuilds == [0]
@@ -0,0 +1,99 @@
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from app.models.application import Application, ApplicationStatus
+from app.models.application_event import ApplicationStatusEvent
+from app.models.job import JobStatus
+from app.models.outbox import OutboxMessage
+from app.models.user import UserRole
+from app.services import job_expiry, outbox
+from app.services.job_expiry import close_expired_jobs, reject_stale_applications
+
+
+@pytest.fixture
+def published(monkeypatch):
+    events = []
+    monkeypatch.setattr(
+        job_expiry, "publish_event", lambda db, topic, kind, data: events.append((kind, data))
+    )
+    return events
+
+
+def test_expiry_closes_past_deadline_jobs_and_publishes(db, make_user, make_job, published):
+    sponsor = make_user()
+    expired = make_job(sponsor, deadline=date.today() - timedelta(days=1))
+    current = make_job(sponsor, deadline=date.today() + timedelta(days=1))
+
+    assert close_expired_jobs(db) == 1
+    db.refresh(expired)
+    db.refresh(current)
+    assert (expired.status, current.status) == (JobStatus.CANCELLED, JobStatus.OPEN)
+    assert published == [
+        (
+            "job.updated",
+            {"job_id": str(expired.id), "sponsor_id": str(sponsor.id), "status": "cancelled"},
+        )
+    ]
+
+
+def test_only_applications_on_closed_jobs_are_rejected(db, make_user, make_job, published):
+    sponsor = make_user()
+    apprentice = make_user(UserRole.APPRENTICE)
+    open_job = make_job(sponsor)
+    closed_job = make_job(sponsor, status=JobStatus.CANCELLED)
+    long_ago = datetime.now(timezone.utc) - timedelta(days=365)
+    on_open = Application(job_id=open_job.id, apprentice_id=apprentice.id, created_at=long_ago)
+    on_closed = Application(job_id=closed_job.id, apprentice_id=apprentice.id)
+    db.add_all([on_open, on_closed])
+    db.flush()
+
+    assert reject_stale_applications(db) == 1
+    db.refresh(on_open)
+    db.refresh(on_closed)
+    assert on_open.status == ApplicationStatus.PENDING
+    assert on_closed.status == ApplicationStatus.REJECTED
+    assert [(kind, data["application_id"]) for kind, data in published] == [
+        ("application.status_changed", str(on_closed.id))
+    ]
+
+
+def test_auto_rejections_are_written_to_status_history(db, make_user, make_job, published):
+    sponsor = make_user()
+    apprentice = make_user(UserRole.APPRENTICE)
+    job = make_job(sponsor, status=JobStatus.CANCELLED)
+    application = Application(job_id=job.id, apprentice_id=apprentice.id)
+    db.add(application)
+    db.flush()
+
+    reject_stale_applications(db)
+
+    event = (
+        db.query(ApplicationStatusEvent)
+        .filter(ApplicationStatusEvent.application_id == application.id)
+        .one()
+    )
+    assert (event.from_status, event.to_status) == (
+        ApplicationStatus.PENDING,
+        ApplicationStatus.REJECTED,
+    )
+    assert (event.job_id, event.apprentice_id, event.changed_by) == (job.id, apprentice.id, None)
+
+
+def test_auto_rejections_notify_the_apprentice(db, make_user, make_job, published):
+    sponsor = make_user()
+    apprentice = make_user(UserRole.APPRENTICE)
+    job = make_job(sponsor, status=JobStatus.CANCELLED, title="Label scanned receipts")
+    application = Application(job_id=job.id, apprentice_id=apprentice.id)
+    db.add(application)
+    db.flush()
+
+    reject_stale_applications(db)
+
+    message = db.query(OutboxMessage).filter(OutboxMessage.recipient_id == apprentice.id).one()
+    assert message.kind == outbox.APPLICATION_REJECTED
+    assert message.payload == {
+        "application_id": str(application.id),
+        "job_id": str(job.id),
+        "job_title": "Label scanned receipts",
+    }
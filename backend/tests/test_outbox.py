@@ -0,0 +1,154 @@
+import smtplib
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.config import settings
+from app.models.outbox import OutboxMessage
+from app.services import outbox
+from app.services.outbox import (
+    BaseTransport,
+    Notification,
+    Recipient,
+    SMTPTransport,
+    dispatch_batch,
+)
+
+
+class RecordingTransport(BaseTransport):
+    """Records sends, and whether the dispatcher's session held a transaction meanwhile."""
+
+    def __init__(self, db, fail: bool = False):
+        self.db = db
+        self.fail = fail
+        self.sent: list[Notification] = []
+        self.in_transaction: list[bool] = []
+        self.batches = 0
+
+    def __enter__(self):
+        self.batches += 1
+        return self
+
+    def send(self, notification: Notification) -> None:
+        self.in_transaction.append(self.db.in_transaction())
+        if self.fail:
+            raise ConnectionError("mail relay unreachable")
+        self.sent.append(notification)
+
+
+@pytest.fixture
+def make_message(db, make_user):
+    def make(recipient=None, **fields) -> OutboxMessage:
+        message = OutboxMessage(
+            recipient_id=(recipient or make_user()).id,
+            kind=outbox.APPLICATION_REJECTED,
+            payload={"application_id": "a1", "job_id": "j1", "job_title": "Sort receipts"},
+            **fields,
+        )
+        db.add(message)
+        db.flush()
+        return message
+
+    return make
+
+
+def test_sends_outside_the_claim_transaction_and_records_the_outcome(db, make_message):
+    message = make_message()
+    transport = RecordingTransport(db)
+
+    assert dispatch_batch(db, transport) == 1
+
+    assert transport.in_transaction == [False]
+    assert transport.batches == 1
+    assert [n.subject for n in transport.sent] == [
+        "Your application for Sort receipts was not selected"
+    ]
+    db.refresh(message)
+    assert message.sent_at is not None
+    assert (message.attempts, message.claimed_until) == (1, None)
+
+
+def test_messages_under_a_live_claim_are_skipped(db, make_message):
+    now = datetime.now(timezone.utc)
+    claimed = make_message(claimed_until=now + timedelta(minutes=5))
+    abandoned = make_message(claimed_until=now - timedelta(seconds=1))
+    transport = RecordingTransport(db)
+
+    assert dispatch_batch(db, transport) == 1
+
+    db.refresh(claimed)
+    db.refresh(abandoned)
+    assert claimed.sent_at is None
+    assert abandoned.sent_at is not None
+
+
+def test_failed_delivery_backs_off_and_releases_the_claim(db, make_message):
+    message = make_message()
+
+    dispatch_batch(db, RecordingTransport(db, fail=True))
+
+    db.refresh(message)
+    assert (message.attempts, message.claimed_until, message.sent_at) == (1, None, None)
+    assert message.last_error == "mail relay unreachable"
+    assert message.available_at > datetime.now(timezone.utc)
+
+
+class FakeSMTP:
+    instances: list["FakeSMTP"] = []
+
+    def __init__(self, host, port, timeout):
+        self.sent: list = []
+        self.closed = False
+        FakeSMTP.instances.append(self)
+
+    def starttls(self):
+        pass
+
+    def login(self, username, password):
+        pass
+
+    def send_message(self, email):
+        if email["To"] == "bounce@example.com":
+            raise smtplib.SMTPServerDisconnected("connection lost")
+        self.sent.append(email["To"])
+
+    def quit(self):
+        self.closed = True
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def fake_smtp(monkeypatch):
+    FakeSMTP.instances = []
+    monkeypatch.setattr(smtplib, "SMTP", FakeSMTP)
+    monkeypatch.setattr(settings, "SMTP_USERNAME", "")
+    return FakeSMTP.instances
+
+
+def _notification(email: str) -> Notification:
+    return Notification(Recipient(None, email, "Sam"), "Update", ["- hello"], [])
+
+
+def test_smtp_reuses_one_connection_per_batch(fake_smtp):
+    transport = SMTPTransport()
+    with transport:
+        transport.send(_notification("a@example.com"))
+        transport.send(_notification("b@example.com"))
+
+    assert len(fake_smtp) == 1
+    assert fake_smtp[0].sent == ["a@example.com", "b@example.com"]
+    assert fake_smtp[0].closed
+
+
+def test_smtp_reconnects_after_a_failed_send(fake_smtp):
+    transport = SMTPTransport()
+    with transport:
+        with pytest.raises(smtplib.SMTPServerDisconnected):
+            transport.send(_notification("bounce@example.com"))
+        transport.send(_notification("c@example.com"))
+
+    assert len(fake_smtp) == 2
+    assert fake_smtp[0].closed
+    assert fake_smtp[1].sent == ["c@example.com"]
@@ -0,0 +1,56 @@
+from app.utils.rate_limit import LeasedRateLimiter, RateLimitPolicy
+
+POLICY = RateLimitPolicy(name="search", capacity=100, period=60)
+
+
+class FakeStore:
+    """Shared buckets that always have tokens, unless a key is exhausted."""
+
+    def __init__(self, exhausted: set[str] = frozenset()):
+        self.exhausted = exhausted
+        self.calls = 0
+
+    def acquire(self, key, capacity, rate, want):
+        self.calls += 1
+        if key in self.exhausted:
+            return 0, 0.5
+        return want, float(capacity)
+
+
+def test_lease_is_spent_locally_then_dropped():
+    store = FakeStore()
+    limiter = LeasedRateLimiter(store, lease_fraction=0.1)
+
+    assert limiter.try_local("k") is None
+    assert limiter.refill("k", POLICY) == 0.0
+    for _ in range(9):
+        assert limiter.try_local("k") == 0.0
+    assert store.calls == 1
+    # Spent leases leave nothing behind
+    assert "k" not in limiter._leases
+    assert limiter.try_local("k") is None
+
+
+def test_denial_is_cached_until_a_token_is_due():
+    limiter = LeasedRateLimiter(FakeStore(exhausted={"k"}))
+
+    wait = limiter.refill("k", POLICY)
+    assert wait > 0
+    assert 0 < limiter.try_local("k") <= wait
+
+
+def test_one_off_keys_do_not_accumulate():
+    limiter = LeasedRateLimiter(FakeStore(exhausted={"ip:9"}), max_keys=5)
+    for i in range(50):
+        limiter.refill(f"ip:{i}", POLICY)
+    assert len(limiter._leases) + len(limiter._denied_until) <= 5
+
+
+def test_prune_keeps_live_leases_and_drops_idle_ones():
+    limiter = LeasedRateLimiter(FakeStore(), max_keys=2)
+    limiter.refill("idle", POLICY)
+    limiter._leases["idle"][1] -= POLICY.period
+    limiter.refill("live", POLICY)
+    limiter.refill("new", POLICY)
+
+    assert set(limiter._leases) == {"live", "new"}
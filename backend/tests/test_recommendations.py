@@ -0,0 +1,145 @@
+import asyncio
+import time
+from uuid import uuid4
+
+import pytest
+
+from app.services.recommendations import (
+    ACCEPTED_WEIGHT,
+    APPLIED_WEIGHT,
+    CoApplicationRecommender,
+)
+
+
+def application_event(kind: str, apprentice_id, job_id, status: str) -> dict:
+    return {
+        "topic": "applications",
+        "type": kind,
+        "apprentice_id": str(apprentice_id),
+        "job_id": str(job_id),
+        "status": status,
+    }
+
+
+@pytest.fixture
+def recommender():
+    return CoApplicationRecommender()
+
+
+def weight(recommender, apprentice_id, job_id) -> float:
+    return recommender._history[apprentice_id][recommender._job_index[job_id]]
+
+
+def test_accept_reject_toggles_do_not_inflate_weights(recommender):
+    apprentice, job, other = uuid4(), uuid4(), uuid4()
+    recommender.handle_event(application_event("application.created", apprentice, other, "pending"))
+    recommender.handle_event(application_event("application.created", apprentice, job, "pending"))
+    baseline = (list(recommender._rows[0].items()), recommender._norms[1])
+
+    for status in ("accepted", "rejected", "accepted", "rejected"):
+        recommender.handle_event(
+            application_event("application.status_changed", apprentice, job, status)
+        )
+        expected = ACCEPTED_WEIGHT if status == "accepted" else APPLIED_WEIGHT
+        assert weight(recommender, apprentice, job) == expected
+
+    assert (list(recommender._rows[0].items()), recommender._norms[1]) == baseline
+
+
+def test_replayed_events_are_counted_once(recommender):
+    apprentice, job = uuid4(), uuid4()
+    accepted = application_event("application.status_changed", apprentice, job, "accepted")
+    recommender.handle_event(accepted)
+    recommender.handle_event(accepted)
+
+    j = recommender._job_index[job]
+    assert weight(recommender, apprentice, job) == ACCEPTED_WEIGHT
+    assert recommender._norms[j] == ACCEPTED_WEIGHT**2
+
+
+class SnapshotSession:
+    """Stands in for rebuild's session: `tables` maps model name to the rows of
+    its snapshot, and `on_read` runs as each batch is fetched."""
+
+    def __init__(self, tables: dict[str, list], on_read=lambda: None):
+        self.tables = tables
+        self.on_read = on_read
+
+    def connection(self, **kwargs):
+        pass
+
+    def execute(self, statement, execution_options=None):
+        rows = self.tables.get(statement.column_descriptions[0]["entity"].__name__, [])
+        return SnapshotResult(rows, self.on_read)
+
+    def close(self):
+        pass
+
+
+class SnapshotResult:
+    def __init__(self, rows: list, on_read):
+        self.rows = rows
+        self.on_read = on_read
+
+    def partitions(self):
+        for row in self.rows:
+            self.on_read()
+            yield [row]
+
+
+def test_events_during_rebuild_apply_after_its_snapshot(recommender, monkeypatch):
+    apprentice, job = uuid4(), uuid4()
+    accepted = application_event("application.status_changed", apprentice, job, "accepted")
+    # The accept commits after the snapshot was taken, while rows are streaming
+    session = SnapshotSession(
+        {"Application": [(apprentice, job, "pending")]},
+        on_read=lambda: recommender.handle_event(accepted),
+    )
+    monkeypatch.setattr("app.services.recommendations.SessionLocal", lambda: session)
+
+    recommender.rebuild()
+
+    assert weight(recommender, apprentice, job) == ACCEPTED_WEIGHT
+    assert recommender._pending is None
+
+
+def test_rebuild_reads_without_holding_the_lock(recommender, monkeypatch):
+    held = []
+    rows = [(uuid4(), uuid4(), "pending") for _ in range(3)]
+    session = SnapshotSession(
+        {"Application": rows}, on_read=lambda: held.append(recommender._lock.locked())
+    )
+    monkeypatch.setattr("app.services.recommendations.SessionLocal", lambda: session)
+
+    recommender.rebuild()
+
+    assert held == [False, False, False]
+    assert len(recommender._history) == 3
+
+
+async def test_resyncs_run_one_at_a_time(recommender, monkeypatch):
+    running, overlaps, runs = [], [], []
+
+    def reset():
+        overlaps.append(bool(running))
+        running.append(1)
+        time.sleep(0.01)
+        running.pop()
+        runs.append(1)
+
+    monkeypatch.setattr(recommender, "_reset", reset)
+    for _ in range(3):
+        recommender.handle_event({"topic": "system", "type": "resync"})
+    await asyncio.gather(*recommender._tasks)
+
+    # The later resyncs fold into the one already queued
+    assert len(runs) == 1
+    assert overlaps == [False]
+
+    recommender.handle_event({"topic": "system", "type": "resync"})
+    task = recommender._tasks[-1]
+    await asyncio.sleep(0)
+    recommender.handle_event({"topic": "system", "type": "resync"})
+    await asyncio.gather(task, *recommender._tasks)
+    assert len(runs) == 3
+    assert overlaps == [False, False, False]
@@ -0,0 +1,65 @@
+import asyncio
+import time
+
+import pytest
+from sqlalchemy import text
+
+from app.services import scheduler as scheduler_module
+from app.services.scheduler import PeriodicTask, Scheduler, _lock_key
+
+
+@pytest.fixture
+def scheduler_engine(db_engine, monkeypatch):
+    monkeypatch.setattr(scheduler_module, "engine", db_engine)
+    return db_engine
+
+
+def test_a_run_uses_one_connection_across_commits(scheduler_engine):
+    checked_out = []
+
+    def task(db):
+        db.execute(text("SELECT 1"))
+        db.commit()
+        db.execute(text("SELECT 1"))
+        checked_out.append(scheduler_engine.pool.checkedout())
+
+    assert Scheduler().run_once(PeriodicTask("one_connection", 60, task))
+    assert checked_out == [1]
+
+
+def test_a_task_locked_elsewhere_is_skipped(scheduler_engine):
+    ran = []
+    with scheduler_engine.connect() as other:
+        other.execute(text("SELECT pg_advisory_lock(:key)"), {"key": _lock_key("busy")})
+        assert not Scheduler().run_once(PeriodicTask("busy", 60, ran.append))
+        other.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": _lock_key("busy")})
+    assert ran == []
+    # Released after each run, so the next run gets it
+    assert Scheduler().run_once(PeriodicTask("busy", 60, ran.append))
+    assert len(ran) == 1
+
+
+async def test_due_tasks_run_one_after_another(monkeypatch):
+    scheduler = Scheduler()
+    running, overlaps, runs = [], [], []
+
+    def run_once(task):
+        overlaps.append(bool(running))
+        running.append(task.name)
+        time.sleep(0.01)
+        running.pop()
+        runs.append(task.name)
+        return True
+
+    monkeypatch.setattr(scheduler, "run_once", run_once)
+    for name in ("a", "b", "c"):
+        scheduler.register(name, 3600, lambda db: None)
+    scheduler.start()
+    for _ in range(50):
+        if len(runs) == 3:
+            break
+        await asyncio.sleep(0.01)
+    await scheduler.stop()
+
+    assert runs == ["a", "b", "c"]
+    assert overlaps == [False, False, False]
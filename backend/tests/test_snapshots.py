@@ -0,0 +1,65 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.models.job import JobStatus
+from app.schemas.job import JobListResponse
+from app.services.snapshots import JobSnapshotStore, refresh_snapshots
+
+
+@pytest.fixture
+def store(tmp_path):
+    return JobSnapshotStore(tmp_path, page_size=2)
+
+
+@pytest.fixture
+def jobs(db, make_user, make_job):
+    """Five open jobs created a day apart, newest first, so pages are [0 1] [2 3] [4]."""
+    sponsor = make_user()
+    now = datetime.now(timezone.utc)
+    return [
+        make_job(sponsor, title=f"Job {i}", created_at=now - timedelta(days=i + 1))
+        for i in range(5)
+    ]
+
+
+def page(store, n: int) -> JobListResponse:
+    return JobListResponse.model_validate_json(store.read(store.page_path(n)))
+
+
+def test_full_refresh_renders_every_job_and_page(db, store, jobs):
+    stats = refresh_snapshots(db, store)
+
+    assert (stats["rendered"], stats["pages"]) == (5, 3)
+    assert [job.title for job in page(store, 0).jobs] == ["Job 0", "Job 1"]
+    assert page(store, 2).total == 5
+    # Assembled from the job files, byte for byte what the API model would produce
+    assert store.read(store.page_path(0)) == page(store, 0).model_dump_json().encode()
+    assert store.load_manifest()["jobs"] == [str(job.id) for job in jobs]
+
+
+def test_an_edit_rewrites_only_its_own_page(db, store, jobs):
+    refresh_snapshots(db, store)
+    assert refresh_snapshots(db, store)["pages"] == 0
+
+    jobs[3].title = "Job 3, revised"
+    jobs[3].updated_at = datetime.now(timezone.utc)
+    db.flush()
+    stats = refresh_snapshots(db, store)
+
+    assert (stats["rendered"], stats["pages"]) == (1, 1)
+    assert [job.title for job in page(store, 1).jobs] == ["Job 2", "Job 3, revised"]
+
+
+def test_closing_a_job_repages_and_removes_its_file(db, store, jobs):
+    refresh_snapshots(db, store)
+
+    jobs[0].status = JobStatus.CANCELLED
+    db.flush()
+    stats = refresh_snapshots(db, store)
+
+    assert (stats["rendered"], stats["removed"], stats["pages"]) == (0, 1, 2)
+    assert not store.job_path(jobs[0].id).exists()
+    assert [job.title for job in page(store, 0).jobs] == ["Job 1", "Job 2"]
+    assert page(store, 1).total == 4
+    assert not store.page_path(2).exists()
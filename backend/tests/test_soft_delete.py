@@ -0,0 +1,86 @@
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import func
+
+from app.api.applications import get_application, update_application_status
+from app.api.jobs import delete_job
+from app.config import settings
+from app.models.application import Application, ApplicationStatus
+from app.models.job import Job
+from app.models.user import UserRole
+from app.schemas.application import ApplicationStatusUpdate
+from app.services.job_expiry import reject_stale_applications
+
+
+@pytest.fixture
+def deleted_job_application(db, make_user, make_job):
+    sponsor = make_user()
+    apprentice = make_user(UserRole.APPRENTICE)
+    job = make_job(sponsor)
+    application = Application(job_id=job.id, apprentice_id=apprentice.id)
+    db.add(application)
+    job.deleted_at = func.now()
+    db.commit()
+    ids = job.id, application.id
+    # Later lookups must go back to the database
+    db.expunge(job)
+    db.expunge(application)
+    return sponsor, apprentice, *ids
+
+
+def test_queries_hide_soft_deleted_jobs(db, deleted_job_application):
+    _, _, job_id, _ = deleted_job_application
+
+    assert db.query(Job).filter(Job.id == job_id).first() is None
+    hidden = db.query(Job).execution_options(include_deleted=True).filter(Job.id == job_id)
+    assert hidden.one().id == job_id
+
+
+def test_relationship_loads_hide_soft_deleted_job(db, deleted_job_application):
+    _, apprentice, _, application_id = deleted_job_application
+
+    application = db.query(Application).filter(Application.id == application_id).one()
+    assert application.job is None
+    # The apprentice still sees their own application
+    assert get_application(application_id, db, apprentice).id == application_id
+
+
+def test_owner_can_decide_applications_on_soft_deleted_job(db, deleted_job_application):
+    sponsor, _, _, application_id = deleted_job_application
+
+    assert get_application(application_id, db, sponsor).id == application_id
+    updated = update_application_status(
+        application_id, ApplicationStatusUpdate(status=ApplicationStatus.REJECTED), db, sponsor
+    )
+    assert updated.status == ApplicationStatus.REJECTED
+
+
+def test_other_sponsor_still_forbidden_on_soft_deleted_job(
+    db, make_user, deleted_job_application
+):
+    _, _, _, application_id = deleted_job_application
+    stranger = make_user()
+
+    with pytest.raises(HTTPException) as exc_info:
+        update_application_status(
+            application_id, ApplicationStatusUpdate(status=ApplicationStatus.ACCEPTED), db, stranger
+        )
+    assert exc_info.value.status_code == 403
+
+
+def test_soft_deleting_a_job_lets_the_sweep_reject_its_applications(
+    db, make_user, make_job, monkeypatch
+):
+    monkeypatch.setattr(settings, "JOB_SOFT_DELETE", True)
+    sponsor = make_user()
+    apprentice = make_user(UserRole.APPRENTICE)
+    job = make_job(sponsor)
+    application = Application(job_id=job.id, apprentice_id=apprentice.id)
+    db.add(application)
+    db.flush()
+
+    delete_job(job.id, db, sponsor)
+
+    assert reject_stale_applications(db) == 1
+    db.refresh(application)
+    assert application.status == ApplicationStatus.REJECTED
@@ -3,10 +3,10 @@ import { Card, CardContent, CardFooter, CardHeader } from '@/components/ui/card'
 import { Badge } from '@/components/ui/badge';
 import { Button } from '@/components/ui/button';
 import { formatDate, formatBudget } from '@/lib/utils';
-import type { Job } from '@/types';
+import type { JobSummary } from '@/types';
 
 interface JobCardProps {
-  job: Job;
+  job: JobSummary;
   showApplyButton?: boolean;
 }
 
@@ -29,10 +29,8 @@ export function JobCard({ job, showApplyButton = true }: JobCardProps) {
             >
               {job.title}
             </Link>
-            {job.sponsor && (
-              <p className="text-sm text-muted-foreground">
-                {job.sponsor.company_name || job.sponsor.full_name}
-              </p>
+            {job.sponsor_name && (
+              <p className="text-sm text-muted-foreground">{job.sponsor_name}</p>
             )}
           </div>
           <Badge variant={statusColors[job.status]}>{job.status}</Badge>
@@ -41,7 +39,7 @@ export function JobCard({ job, showApplyButton = true }: JobCardProps) {
 
       <CardContent>
         <p className="text-sm text-muted-foreground line-clamp-2 mb-4">
-          {job.description}
+          {job.snippet}
         </p>
 
         <div className="flex flex-wrap gap-2 text-sm">
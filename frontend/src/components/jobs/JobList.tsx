@@ -1,8 +1,8 @@
 import { JobCard } from './JobCard';
-import type { Job } from '@/types';
+import type { JobSummary } from '@/types';
 
 interface JobListProps {
-  jobs: Job[];
+  jobs: JobSummary[];
   isLoading?: boolean;
   emptyMessage?: string;
 }
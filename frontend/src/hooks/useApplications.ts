@@ -1,5 +1,6 @@
 import { useState, useEffect } from 'react';
 import { applicationsApi } from '@/lib/api';
+import { useEventStream } from '@/hooks/useEvents';
 import type { Application } from '@/types';
 
 export function useMyApplications() {
@@ -25,6 +26,8 @@ export function useMyApplications() {
     fetchApplications();
   }, []);
 
+  useEventStream(['applications'], () => fetchApplications());
+
   return { applications, isLoading, error, refetch: fetchApplications };
 }
 
@@ -52,5 +55,11 @@ export function useJobApplications(jobId: string | undefined) {
     fetchApplications();
   }, [jobId]);
 
+  useEventStream(['applications'], (event) => {
+    if (event.topic === 'system' || event.job_id === jobId) {
+      fetchApplications();
+    }
+  });
+
   return { applications, isLoading, error, refetch: fetchApplications };
 }
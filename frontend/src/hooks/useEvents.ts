@@ -0,0 +1,52 @@
+import { useEffect, useRef } from 'react';
+import { API_BASE_URL } from '@/lib/api';
+import type { BoardEvent, EventTopic } from '@/types';
+
+/**
+ * Subscribe to server-sent job/application events.
+ * Bursts of events are debounced into a single callback so list refetches stay cheap.
+ */
+export function useEventStream(
+  topics: EventTopic[],
+  onEvent: (event: BoardEvent) => void,
+  debounceMs = 300
+) {
+  const callbackRef = useRef(onEvent);
+  callbackRef.current = onEvent;
+
+  const topicKey = topics.join(',');
+
+  useEffect(() => {
+    if (!topicKey || typeof EventSource === 'undefined') return;
+
+    const params = new URLSearchParams({ topics: topicKey });
+    const token = localStorage.getItem('auth_token');
+    if (token) {
+      params.append('access_token', token);
+    }
+
+    const source = new EventSource(`${API_BASE_URL}/events?${params.toString()}`);
+    let timer: ReturnType<typeof setTimeout> | undefined;
+
+    const handle = (message: MessageEvent) => {
+      const event = JSON.parse(message.data) as BoardEvent;
+      clearTimeout(timer);
+      timer = setTimeout(() => callbackRef.current(event), debounceMs);
+    };
+
+    const eventTypes = [
+      'job.created',
+      'job.updated',
+      'job.deleted',
+      'application.created',
+      'application.status_changed',
+      'resync',
+    ];
+    eventTypes.forEach((type) => source.addEventListener(type, handle as EventListener));
+
+    return () => {
+      clearTimeout(timer);
+      source.close();
+    };
+  }, [topicKey, debounceMs]);
+}
@@ -1,9 +1,10 @@
 import { useState, useEffect } from 'react';
 import { jobsApi } from '@/lib/api';
-import type { Job } from '@/types';
+import { useEventStream } from '@/hooks/useEvents';
+import type { Job, JobSummary } from '@/types';
 
 export function useJobs(params?: { search?: string }) {
-  const [jobs, setJobs] = useState<Job[]>([]);
+  const [jobs, setJobs] = useState<JobSummary[]>([]);
   const [total, setTotal] = useState(0);
   const [isLoading, setIsLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
@@ -11,7 +12,7 @@ export function useJobs(params?: { search?: string }) {
   const fetchJobs = async () => {
     try {
       setIsLoading(true);
-      const response = await jobsApi.list(params);
+      const response = await jobsApi.listSummaries(params);
       setJobs(response.jobs);
       setTotal(response.total);
       setError(null);
@@ -27,6 +28,9 @@ export function useJobs(params?: { search?: string }) {
     fetchJobs();
   }, [params?.search]);
 
+  // Refetch only when jobs actually change instead of polling
+  useEventStream(['jobs'], () => fetchJobs());
+
   return { jobs, total, isLoading, error, refetch: fetchJobs };
 }
 
@@ -84,5 +88,7 @@ export function useMyJobs() {
     fetchJobs();
   }, []);
 
+  useEventStream(['jobs', 'applications'], () => fetchJobs());
+
   return { jobs, isLoading, error, refetch: fetchJobs };
 }
@@ -5,12 +5,18 @@ import type {
   Token, 
   Job, 
   JobListResponse, 
+  JobSummaryListResponse,
+  JobFilters,
+  JobFacets,
+  SponsorDashboard,
+  CandidateSearchParams,
+  CandidateSearchResponse,
   Application, 
   GeneratedDescription,
   ApplicationStatus 
 } from '@/types';
 
-const API_BASE_URL = import.meta.env.VITE_API_URL || '/api';
+export const API_BASE_URL = import.meta.env.VITE_API_URL || '/api';
 
 // Create axios instance
 export const apiClient = axios.create({
@@ -105,9 +111,9 @@ export async function apiGetCurrentUser(): Promise<User> {
 
 export const jobsApi = {
   /**
-   * List all jobs with optional search
+   * List all jobs with optional search and range filters
    */
-  async list(params?: { search?: string }): Promise<JobListResponse> {
+  async list(params?: JobFilters): Promise<JobListResponse> {
     try {
       const response = await apiClient.get<JobListResponse>('/jobs', { params });
       return response.data;
@@ -117,6 +123,34 @@ export const jobsApi = {
     }
   },
 
+  /**
+   * List jobs as compact cards (description snippet, sponsor name only)
+   */
+  async listSummaries(params?: JobFilters): Promise<JobSummaryListResponse> {
+    try {
+      const response = await apiClient.get<JobSummaryListResponse>('/jobs', {
+        params: { ...params, view: 'summary' },
+      });
+      return response.data;
+    } catch (error: any) {
+      const message = error.response?.data?.detail || 'Failed to fetch jobs.';
+      throw new Error(message);
+    }
+  },
+
+  /**
+   * Get facet counts (budget bucket, budget type, deadline window) for a filter
+   */
+  async facets(params?: JobFilters): Promise<JobFacets> {
+    try {
+      const response = await apiClient.get<JobFacets>('/jobs/facets', { params });
+      return response.data;
+    } catch (error: any) {
+      const message = error.response?.data?.detail || 'Failed to fetch job facets.';
+      throw new Error(message);
+    }
+  },
+
   /**
    * Get a specific job by ID
    */
@@ -143,6 +177,19 @@ export const jobsApi = {
     }
   },
 
+  /**
+   * Get per-job application aggregates for the current sponsor
+   */
+  async getMyDashboard(): Promise<SponsorDashboard> {
+    try {
+      const response = await apiClient.get<SponsorDashboard>('/jobs/my/dashboard');
+      return response.data;
+    } catch (error: any) {
+      const message = error.response?.data?.detail || 'Failed to fetch dashboard.';
+      throw new Error(message);
+    }
+  },
+
   /**
    * Create a new job (sponsor only)
    */
@@ -231,6 +278,23 @@ export const applicationsApi = {
   },
 };
 
+// Candidates API
+
+export const candidatesApi = {
+  /**
+   * Search apprentices by text or by one of the sponsor's jobs
+   */
+  async search(params: CandidateSearchParams): Promise<CandidateSearchResponse> {
+    try {
+      const response = await apiClient.get<CandidateSearchResponse>('/candidates', { params });
+      return response.data;
+    } catch (error: any) {
+      const message = error.response?.data?.detail || 'Failed to search candidates.';
+      throw new Error(message);
+    }
+  },
+};
+
 // AI API
 
 export const aiApi = {
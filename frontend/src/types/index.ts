@@ -32,6 +32,7 @@ export interface Job {
   ai_generated_description: boolean;
   application_count: number;
   created_at: string;
+  possible_duplicate_of?: string[];
 }
 
 export interface JobListResponse {
@@ -39,6 +40,95 @@ export interface JobListResponse {
   total: number;
 }
 
+/** Compact job card returned by `view=summary` listings */
+export interface JobSummary {
+  id: string;
+  sponsor_id: string;
+  sponsor_name?: string;
+  title: string;
+  snippet: string;
+  budget_min?: number;
+  budget_max?: number;
+  budget_type: 'fixed' | 'hourly';
+  estimated_hours?: number;
+  deadline?: string;
+  status: JobStatus;
+  ai_generated_description: boolean;
+  application_count: number;
+  created_at: string;
+}
+
+export interface JobSummaryListResponse {
+  jobs: JobSummary[];
+  total: number;
+}
+
+export interface JobFilters {
+  search?: string;
+  status?: JobStatus;
+  budget_min?: number;
+  budget_max?: number;
+  budget_type?: 'fixed' | 'hourly';
+  hours_min?: number;
+  hours_max?: number;
+  deadline_after?: string;
+  deadline_before?: string;
+}
+
+export interface JobFacetCount {
+  value: string;
+  count: number;
+}
+
+export interface JobFacets {
+  budget: JobFacetCount[];
+  budget_type: JobFacetCount[];
+  deadline: JobFacetCount[];
+  total: number;
+}
+
+export interface JobDashboardEntry {
+  job_id: string;
+  title: string;
+  status: JobStatus;
+  created_at: string;
+  total_applications: number;
+  pending_count: number;
+  accepted_count: number;
+  rejected_count: number;
+  withdrawn_count: number;
+  average_proposed_rate?: number;
+  last_application_at?: string;
+}
+
+export interface SponsorDashboard {
+  jobs: JobDashboardEntry[];
+  total: number;
+}
+
+export interface Candidate {
+  id: string;
+  full_name: string;
+  bio_snippet: string;
+  portfolio_url?: string;
+  github_url?: string;
+  linkedin_url?: string;
+  created_at: string;
+  rank: number;
+}
+
+export interface CandidateSearchParams {
+  q?: string;
+  job_id?: string;
+  limit?: number;
+  cursor?: string;
+}
+
+export interface CandidateSearchResponse {
+  candidates: Candidate[];
+  next_cursor: string | null;
+}
+
 export interface Application {
   id: string;
   job_id: string;
@@ -78,3 +168,15 @@ export interface GeneratedDescription {
   description: string;
   requirements: string;
 }
+
+export type EventTopic = 'jobs' | 'applications';
+
+export interface BoardEvent {
+  topic: EventTopic | 'system';
+  type: string;
+  job_id?: string;
+  sponsor_id?: string;
+  application_id?: string;
+  apprentice_id?: string;
+  status?: string;
+}
@@ -0,0 +1,55 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+cd "$SCRIPT_DIR"
+
+# Colors
+RED='\033[0;31m'
+GREEN='\033[0;32m'
+YELLOW='\033[1;33m'
+NC='\033[0m'
+
+info()  { printf "${GREEN}[INFO]${NC} %s\n" "$*"; }
+warn()  { printf "${YELLOW}[WARN]${NC} %s\n" "$*"; }
+error() { printf "${RED}[ERROR]${NC} %s\n" "$*"; }
+
+# ── Detect docker compose command ────────────────────────────────────
+if docker compose version &>/dev/null; then
+  DOCKER_COMPOSE="docker compose"
+elif command -v docker-compose &>/dev/null; then
+  DOCKER_COMPOSE="docker-compose"
+else
+  error "Neither 'docker compose' nor 'docker-compose' found."
+  exit 1
+fi
+
+# ── Start Docker containers ──────────────────────────────────────────
+info "Starting Docker containers..."
+$DOCKER_COMPOSE up -d db
+
+# ── Wait for Postgres ────────────────────────────────────────────────
+info "Waiting for Postgres to be healthy..."
+retries=30
+until docker inspect --format='{{.State.Health.Status}}' aitb_postgres 2>/dev/null | grep -q "healthy"; do
+  retries=$((retries - 1))
+  if [ "$retries" -le 0 ]; then
+    error "Postgres did not become healthy in time."
+    exit 1
+  fi
+  sleep 2
+done
+info "Postgres is healthy."
+
+# ── Install production extras and run migrations ─────────────────────
+source backend/.venv/bin/activate
+pip install -e "backend/.[prod,perf]" --quiet
+info "Running pending migrations..."
+(cd backend && alembic upgrade head)
+
+# ── Start backend (multi-worker) ─────────────────────────────────────
+export DEBUG="${DEBUG:-false}"
+info "Starting backend (gunicorn, ${WEB_CONCURRENCY:-$(nproc)} uvicorn workers)..."
+info "Each worker logs its startup time and RSS once ready."
+cd backend
+exec gunicorn -c gunicorn.conf.py app.main:app